@@ -0,0 +1,95 @@
+"""
+Benchmark endpoint call resolution.
+
+Compares ``resolve_endpoint`` on the precompiled specs of
+``iucn_red_list_client.dispatch`` with the previous implementation, which
+walked the ``path_params`` and ``query_params`` lists of ``API_ENDPOINTS`` and
+formatted the path template on every call. Then compares
+``call_endpoint`` with the generated typed method of each endpoint, with the
+request itself stubbed out.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--calls N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from iucn_red_list_client.api_endpoints import API_ENDPOINTS  # noqa: E402
+from iucn_red_list_client.client import IUCNRedListClient, resolve_endpoint  # noqa: E402
+
+# Endpoint calls of increasing parameter counts
+CALLS = (
+    ('get_red_list_categories', {}),
+    ('get_taxa_sis_sis_id', {'sis_id': 15951}),
+    ('get_taxa_scientific_name', {'genus_name': 'Panthera', 'species_name': 'leo'}),
+    ('get_countries_code', {'code': 'US', 'page': 3, 'latest': True, 'year_published': 2020}),
+)
+
+
+def legacy_resolve_endpoint(endpoint_name, kwargs):
+    """The resolution code before precompiled specs."""
+    if endpoint_name not in API_ENDPOINTS:
+        raise ValueError(f"Unknown endpoint: {endpoint_name}")
+
+    endpoint_info = API_ENDPOINTS[endpoint_name]
+    path = endpoint_info['path']
+    method = endpoint_info['method']
+
+    path_params = {}
+    for param_name in endpoint_info.get('path_params', []):
+        if param_name in kwargs:
+            path_params[param_name] = kwargs.pop(param_name)
+        else:
+            raise ValueError(f"Missing required path parameter: {param_name}")
+    if path_params:
+        path = path.format(**path_params)
+
+    query_params = {}
+    for param_info in endpoint_info.get('query_params', []):
+        param_name = param_info['name']
+        if param_name in kwargs:
+            query_params[param_name] = kwargs.pop(param_name)
+        elif param_info.get('required', False):
+            raise ValueError(f"Missing required query parameter: {param_name}")
+
+    return method, path, query_params
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200_000, help='Calls to time per endpoint (default: 200000)')
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<28} {'legacy ns':>10} {'compiled ns':>12} {'speedup':>8}")
+    for endpoint_name, params in CALLS:
+        timings = []
+        for resolve in (legacy_resolve_endpoint, resolve_endpoint):
+            resolve(endpoint_name, dict(params))
+            seconds = min(timeit.repeat(lambda: resolve(endpoint_name, dict(params)), number=args.calls, repeat=3))
+            timings.append(seconds / args.calls * 1e9)
+        legacy, compiled = timings
+        print(f"{endpoint_name:<28} {legacy:>10.0f} {compiled:>12.0f} {legacy / compiled:>7.1f}x")
+
+    client = IUCNRedListClient(api_token='benchmark')
+    client._call_resolved = lambda *args: None
+    print()
+    print(f"{'endpoint':<28} {'call_endpoint ns':>16} {'method ns':>10} {'speedup':>8}")
+    for endpoint_name, params in CALLS:
+        method = getattr(client, endpoint_name)
+        timings = []
+        for call in (lambda: client.call_endpoint(endpoint_name, **params), lambda: method(**params)):
+            call()
+            seconds = min(timeit.repeat(call, number=args.calls, repeat=3))
+            timings.append(seconds / args.calls * 1e9)
+        dynamic, generated = timings
+        print(f"{endpoint_name:<28} {dynamic:>16.0f} {generated:>10.0f} {dynamic / generated:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
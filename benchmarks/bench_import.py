@@ -0,0 +1,94 @@
+"""
+Benchmark package and CLI start-up time.
+
+Imports the package, the client and the CLI module in fresh interpreters
+under ``python -X importtime`` and reports the cumulative import time of
+each against its budget, with any heavy dependencies that were loaded. Then
+times whole CLI commands that should not touch the HTTP stack. With
+``--check`` it exits with an error when an import exceeds its budget; the
+budgets are wall-clock measurements, so they are checked here rather than in
+the unit tests.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--check]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that only requests, exports or the async client should load
+HEAVY_MODULES = ('requests', 'urllib3', 'truststore', 'httpx', 'pyarrow', 'asyncio',
+                 'iucn_red_list_client.api_endpoints')
+
+# Cumulative import time budgets in milliseconds, with headroom for slow machines
+IMPORT_BUDGETS_MS = {
+    'iucn_red_list_client': 50,
+    'iucn_red_list_client.client': 150,
+    'iucn_red_list_client.cli': 200,
+}
+
+CLI_COMMANDS = (('--help',), ('--list-endpoints',), ('get_countries_code', 'help'))
+
+
+def measure_import(module: str, runs: int = 1) -> Tuple[float, List[str]]:
+    """Return the best cumulative import time of ``module`` in ms and the heavy modules it loads."""
+    code = f"import sys, {module}; print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    best = float('inf')
+    loaded: List[str] = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                cwd=ROOT, capture_output=True, text=True, check=True)
+        for line in result.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                best = min(best, int(fields[1]) / 1000)
+        loaded = result.stdout.split()
+    return best, loaded
+
+
+def time_command(args: Tuple[str, ...], runs: int) -> float:
+    """Return the best wall time of a CLI command in ms."""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'iucn_red_list_client.cli', *args],
+                       cwd=ROOT, capture_output=True, check=True)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per measurement (default: 5)')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with an error if an import exceeds its budget, without timing CLI commands')
+    args = parser.parse_args()
+
+    over_budget = []
+    print(f"{'module':<30} {'import ms':>10} {'budget ms':>10}  heavy modules loaded")
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        milliseconds, loaded = measure_import(module, args.runs)
+        print(f"{module:<30} {milliseconds:>10.1f} {budget:>10}  {', '.join(loaded) or '-'}")
+        if milliseconds >= budget:
+            over_budget.append(module)
+
+    if args.check:
+        if over_budget:
+            sys.exit(f"Over import time budget: {', '.join(over_budget)}")
+        return
+
+    print()
+    print(f"{'command':<40} {'wall ms':>8}")
+    for command in CLI_COMMANDS:
+        print(f"{'iucn-client ' + ' '.join(command):<40} {time_command(command, args.runs):>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
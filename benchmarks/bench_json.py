@@ -0,0 +1,61 @@
+"""
+Benchmark the JSON backends on realistic IUCN Red List payloads.
+
+Measures decoding of response bodies (as in ``call_endpoint``) and
+pretty-printed encoding (as in the CLI) for every installed backend, and
+reports throughput and the speedup over the standard library.
+
+Usage:
+    python benchmarks/bench_json.py [--repeat N]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from iucn_red_list_client.jsoncodec import available_backends, get_codec  # noqa: E402
+
+from payloads import assessment_document, collection_page  # noqa: E402
+
+
+def best_time(func, repeat: int) -> float:
+    """Return the best per-call time in seconds over ``repeat`` rounds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Timing rounds per measurement (default: 5)')
+    args = parser.parse_args()
+
+    payloads = {
+        'collection page (100 records)': collection_page(),
+        'full assessment document': assessment_document(),
+    }
+    print(f"Backends installed: {', '.join(available_backends())}\n")
+    print(f"{'payload':<32} {'backend':<8} {'decode MB/s':>12} {'x json':>7} {'encode MB/s':>12} {'x json':>7}")
+
+    for label, payload in payloads.items():
+        body = json.dumps(payload).encode('utf-8')
+        megabytes = len(body) / 1e6
+        baseline = None
+        for name in ['json'] + [n for n in available_backends() if n != 'json']:
+            codec = get_codec(name)
+            decode = best_time(lambda: codec.loads(body), args.repeat)
+            encode = best_time(lambda: codec.dumps(payload, pretty=True), args.repeat)
+            if baseline is None:
+                baseline = (decode, encode)
+            print(f"{label:<32} {name:<8} {megabytes / decode:>12.1f} {baseline[0] / decode:>6.1f}x "
+                  f"{megabytes / encode:>12.1f} {baseline[1] / encode:>6.1f}x")
+        print(f"{'':<32} ({len(body) / 1024:.0f} KiB body)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark offline species lookups from a SpeciesStore.
+
+Fills a store with synthetic taxon responses and reports the latency of
+``LocalIUCNClient.call_endpoint`` lookups by scientific name and SIS id,
+to compare with the 200-500 ms of an API request.
+
+Usage:
+    python benchmarks/bench_local.py [--taxa N] [--lookups N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from iucn_red_list_client.local import LocalIUCNClient, SpeciesStore  # noqa: E402
+
+from payloads import taxon_response  # noqa: E402
+
+
+def timed(lookups) -> list:
+    """Run each lookup and return its latency in microseconds."""
+    latencies = []
+    for lookup in lookups:
+        started = time.perf_counter()
+        lookup()
+        latencies.append((time.perf_counter() - started) * 1e6)
+    return latencies
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--taxa', type=int, default=100_000, help='Taxa in the store (default: 100000)')
+    parser.add_argument('--lookups', type=int, default=20_000, help='Lookups to time (default: 20000)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SpeciesStore(Path(directory) / 'species.sqlite')
+        responses = [taxon_response(sis_id) for sis_id in range(1, args.taxa + 1)]
+        started = time.perf_counter()
+        store.add_taxa(responses)
+        print(f"Stored {len(store)} taxa in {time.perf_counter() - started:.1f} s\n")
+
+        client = LocalIUCNClient(store)
+        rng = random.Random(0)
+        sample = [rng.choice(responses)['taxon'] for _ in range(args.lookups)]
+        by_name = timed(
+            lambda taxon=taxon: client.call_endpoint('get_taxa_scientific_name',
+                                                     genus_name=taxon['genus_name'].upper(),
+                                                     species_name=f" {taxon['species_name']} ")
+            for taxon in sample
+        )
+        by_sis = timed(lambda taxon=taxon: client.call_endpoint('get_taxa_sis_sis_id', sis_id=taxon['sis_id'])
+                       for taxon in sample)
+        store.close()
+
+    print(f"{'lookup':<16} {'median us':>10} {'p99 us':>10}")
+    for label, latencies in (('scientific name', by_name), ('SIS id', by_sis)):
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(f"{label:<16} {statistics.median(latencies):>10.1f} {p99:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark memory use and field access of typed models against plain dicts.
+
+Decodes pages of assessment summaries, keeps every record in memory as
+either dicts or ``AssessmentSummary`` models, and reports retained memory,
+decode time and the time to read the fields the species checker uses.
+
+Usage:
+    python benchmarks/bench_models.py [--records N]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from iucn_red_list_client import models  # noqa: E402
+from iucn_red_list_client.jsoncodec import get_codec  # noqa: E402
+from iucn_red_list_client.models import AssessmentList, decode_model  # noqa: E402
+
+from payloads import collection_page  # noqa: E402
+
+
+def load(bodies, decode):
+    """Decode every page and return all records with retained bytes and decode seconds."""
+    gc.collect()
+    started = time.perf_counter()
+    for body in bodies:
+        decode(body)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    records = []
+    for body in bodies:
+        records.extend(decode(body))
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, retained, elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=200_000, help='Records to hold (default: 200000)')
+    args = parser.parse_args()
+
+    codec = get_codec()
+    bodies = [json.dumps(collection_page(page)).encode() for page in range(1, args.records // 100 + 1)]
+    backend = 'msgspec structs' if models.msgspec is not None else f'slotted classes ({codec.name})'
+
+    dict_records, dict_bytes, dict_seconds = load(bodies, lambda body: codec.loads(body)['assessments'])
+    started = time.perf_counter()
+    for record in dict_records:
+        record.get('red_list_category_code'), record.get('year_published'), record.get('latest', False)
+    dict_access = time.perf_counter() - started
+    del dict_records
+
+    model_records, model_bytes, model_seconds = load(
+        bodies, lambda body: decode_model(body, AssessmentList, codec).assessments)
+    started = time.perf_counter()
+    for record in model_records:
+        record.red_list_category_code, record.year_published, record.latest
+    model_access = time.perf_counter() - started
+
+    print(f"{len(model_records)} assessment summaries, models as {backend}\n")
+    print(f"{'':<8} {'retained MB':>12} {'decode s':>9} {'access s':>9}")
+    print(f"{'dicts':<8} {dict_bytes / 1e6:>12.1f} {dict_seconds:>9.2f} {dict_access:>9.3f}")
+    print(f"{'models':<8} {model_bytes / 1e6:>12.1f} {model_seconds:>9.2f} {model_access:>9.3f}")
+    print(f"\nmemory: {dict_bytes / model_bytes:.1f}x smaller, access: {dict_access / model_access:.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
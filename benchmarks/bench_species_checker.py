@@ -0,0 +1,118 @@
+"""
+Benchmark post-processing of species checker results.
+
+Builds synthetic lookup results and compares formatting them row by row
+(a dict per row, a function call per threatened flag and one pass per
+summary count) with the column-wise ``results_frame``, ``format_results``
+and ``count_results`` of ``examples/check_species_status.py``, in batches
+as the checker does and as a single frame.
+
+Usage:
+    python benchmarks/bench_species_checker.py [--rows N] [--batch N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'examples'))
+
+import pandas as pd  # noqa: E402
+
+from check_species_status import (  # noqa: E402
+    OUTPUT_BATCH_ROWS,
+    OUTPUT_COLUMNS,
+    count_results,
+    format_results,
+    results_frame,
+    is_threatened,
+)
+
+CATEGORIES = ['LC', 'LC', 'LC', 'NT', 'VU', 'EN', 'CR', 'DD', 'EX', 'EW', 'Not Found', 'Error']
+DESCRIPTIONS = {
+    'EX': 'Extinct', 'EW': 'Extinct in the Wild', 'CR': 'Critically Endangered', 'EN': 'Endangered',
+    'VU': 'Vulnerable', 'NT': 'Near Threatened', 'LC': 'Least Concern', 'DD': 'Data Deficient',
+}
+
+
+def make_results(rows: int) -> list:
+    """Return synthetic result dicts as produced by the checker."""
+    rng = random.Random(0)
+    results = []
+    for row_number in range(2, rows + 2):
+        code = rng.choice(CATEGORIES)
+        status = {'Not Found': 'not_found', 'Error': 'error'}.get(code, 'found')
+        results.append({
+            'row_number': row_number, 'input_genus': 'Genus', 'input_species': f'species{row_number}',
+            'scientific_name': f'Genus species{row_number}', 'red_list_category': code,
+            'year_published': '2020', 'assessment_id': row_number, 'url': 'N/A', 'status': status,
+        })
+    return results
+
+
+def per_row(results: list) -> Counter:
+    """Format and count results one row at a time."""
+    rows = []
+    for result in results:
+        code = result['red_list_category']
+        row = {column: result[column] for column in OUTPUT_COLUMNS if column in result}
+        row['conservation_status'] = DESCRIPTIONS.get(code, code)
+        row['is_threatened'] = is_threatened(code)
+        rows.append(row)
+    frame = pd.DataFrame(rows, columns=OUTPUT_COLUMNS)
+    return Counter({
+        'found': sum(1 for result in results if result['status'] == 'found'),
+        'not_found': sum(1 for result in results if result['status'] == 'not_found'),
+        'error': sum(1 for result in results if result['status'] == 'error'),
+        'threatened': int(frame['is_threatened'].sum()),
+    })
+
+
+def vectorized(results: list, batch: int) -> Counter:
+    """Format and count results column-wise, batch by batch."""
+    counts: Counter = Counter()
+    for start in range(0, len(results), batch):
+        frame = results_frame(results[start:start + batch])
+        counts.update(count_results(frame, format_results(frame, DESCRIPTIONS)))
+    totals: Counter = Counter()
+    for (status, threatened), count in counts.items():
+        totals[status] += count
+        totals['threatened'] += count if threatened else 0
+    return totals
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Results to process (default: 1000000)')
+    parser.add_argument('--batch', type=int, default=OUTPUT_BATCH_ROWS,
+                        help=f'Rows per vectorized batch (default: {OUTPUT_BATCH_ROWS})')
+    args = parser.parse_args()
+
+    results = make_results(args.rows)
+    timings = {}
+    totals = {}
+    for label, run in (('per row', lambda: per_row(results)),
+                       (f'vectorized ({args.batch})', lambda: vectorized(results, args.batch)),
+                       ('vectorized (all)', lambda: vectorized(results, len(results)))):
+        started = time.perf_counter()
+        totals[label] = run()
+        timings[label] = time.perf_counter() - started
+
+    if len({tuple(sorted(total.items())) for total in totals.values()}) != 1:
+        raise SystemExit(f"Summary counts differ: {totals}")
+
+    baseline = timings['per row']
+    print(f"{args.rows} results\n")
+    print(f"{'method':<20} {'seconds':>8} {'speedup':>8}")
+    for label, seconds in timings.items():
+        print(f"{label:<20} {seconds:>8.2f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
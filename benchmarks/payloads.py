@@ -0,0 +1,126 @@
+"""
+Synthetic IUCN Red List API payloads for benchmarks.
+
+Shapes follow API v4 responses: collection endpoints return pages of 100
+slim assessment summaries, while ``get_assessment_assessment_id`` returns a
+large nested document with habitats, threats and long narrative text.
+Generation is seeded, so every run benchmarks the same bytes.
+"""
+
+import random
+from typing import Any, Dict
+
+CATEGORIES = ['EX', 'EW', 'CR', 'EN', 'VU', 'NT', 'LC', 'DD']
+WORDS = ('population habitat decline forest range species threat survey '
+         'coastal montane breeding reported observed estimated').split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    """Return pseudo-random narrative text."""
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def collection_page(page: int = 1, size: int = 100, seed: int = 0) -> Dict[str, Any]:
+    """Return one page of a collection endpoint such as ``get_countries_code``."""
+    rng = random.Random(seed + page)
+    assessments = []
+    for i in range(size):
+        sis_id = rng.randint(1000, 250000000)
+        assessment_id = rng.randint(1000, 250000000)
+        assessments.append({
+            'year_published': str(rng.randint(1996, 2025)),
+            'latest': rng.random() < 0.8,
+            'possibly_extinct': False,
+            'possibly_extinct_in_the_wild': False,
+            'sis_taxon_id': sis_id,
+            'url': f'https://www.iucnredlist.org/species/{sis_id}/{assessment_id}',
+            'taxon_scientific_name': f'{_text(rng, 1).title()} {_text(rng, 1)}',
+            'red_list_category_code': rng.choice(CATEGORIES),
+            'assessment_id': assessment_id,
+            'code': 'US',
+            'code_type': 'country',
+            'scopes': [{'description': {'en': 'Global'}, 'code': '1'}],
+        })
+    return {
+        'country': {'description': {'en': 'United States'}, 'code': 'US'},
+        'filters': {'page': page, 'latest': None},
+        'assessments': assessments,
+    }
+
+
+def assessment_document(seed: int = 0) -> Dict[str, Any]:
+    """Return a full assessment as returned by ``get_assessment_assessment_id``."""
+    rng = random.Random(seed)
+
+    def coded(count: int, prefix: str) -> list:
+        return [
+            {
+                'code': f'{prefix}_{i}',
+                'description': {'en': _text(rng, 6)},
+                'majorImportance': rng.choice(['Yes', 'No', None]),
+                'season': rng.choice(['Resident', 'Breeding Season', None]),
+                'suitability': rng.choice(['Suitable', 'Marginal']),
+            }
+            for i in range(count)
+        ]
+
+    return {
+        'assessment_id': rng.randint(1000, 250000000),
+        'year_published': '2023',
+        'latest': True,
+        'red_list_category': {'version': '3.1', 'code': rng.choice(CATEGORIES),
+                              'description': {'en': 'Vulnerable'}},
+        'criteria': 'A2bcd+4bcd',
+        'taxon': {
+            'sis_id': rng.randint(1000, 250000000),
+            'scientific_name': 'Panthera leo',
+            'kingdom_name': 'ANIMALIA', 'phylum_name': 'CHORDATA',
+            'class_name': 'MAMMALIA', 'order_name': 'CARNIVORA',
+            'family_name': 'FELIDAE', 'genus_name': 'Panthera', 'species_name': 'leo',
+            'common_names': [{'main': i == 0, 'name': _text(rng, 2), 'language': 'eng'} for i in range(12)],
+            'synonyms': [{'name': _text(rng, 2), 'status': 'ACCEPTED'} for i in range(8)],
+        },
+        'documentation': {key: _text(rng, 400) for key in
+                          ('rationale', 'range', 'population', 'habitats', 'threats',
+                           'measures', 'use_trade', 'taxonomic_notes')},
+        'habitats': coded(25, '1'),
+        'threats': coded(60, '2'),
+        'conservation_actions': coded(30, '3'),
+        'locations': [
+            {'code': f'C{i:03d}', 'is_endemic': False, 'presence': 'Extant',
+             'origin': 'Native', 'description': {'en': _text(rng, 2)}}
+            for i in range(80)
+        ],
+        'references': [{'citation': _text(rng, 30), 'year': str(rng.randint(1950, 2023))}
+                       for _ in range(120)],
+    }
+
+
+def taxon_response(sis_id: int, seed: int = 0) -> Dict[str, Any]:
+    """Return a taxon with its assessments, as returned by ``get_taxa_scientific_name``."""
+    rng = random.Random(seed + sis_id)
+    genus, species = _text(rng, 1).title(), f'{_text(rng, 1)}{sis_id}'
+    return {
+        'taxon': {
+            'sis_id': sis_id,
+            'scientific_name': f'{genus} {species}',
+            'kingdom_name': 'ANIMALIA', 'phylum_name': 'CHORDATA',
+            'class_name': 'MAMMALIA', 'order_name': 'CARNIVORA', 'family_name': 'FELIDAE',
+            'genus_name': genus, 'species_name': species,
+            'infra_name': None, 'subpopulation_name': None, 'authority': '(Linnaeus, 1758)',
+            'common_names': [{'main': i == 0, 'name': _text(rng, 2), 'language': 'eng'} for i in range(4)],
+        },
+        'assessments': [
+            {
+                'assessment_id': sis_id * 10 + i,
+                'sis_taxon_id': sis_id,
+                'year_published': str(2024 - 4 * i),
+                'latest': i == 0,
+                'red_list_category_code': rng.choice(CATEGORIES),
+                'taxon_scientific_name': f'{genus} {species}',
+                'url': f'https://www.iucnredlist.org/species/{sis_id}/{sis_id * 10 + i}',
+                'scopes': [{'description': {'en': 'Global'}, 'code': '1'}],
+            }
+            for i in range(3)
+        ],
+    }
@@ -6,7 +6,8 @@ This script reads a CSV or Excel file containing plant species names and checks
 their conservation status using the IUCN Red List API.
 
 Expected input columns:
-- 'species' or 'scientific_name': Full scientific name (e.g., "Quercus alba")
+- 'species' or 'scientific_name': Full scientific name (e.g., "Quercus alba");
+  subspecies and varieties (e.g., "Quercus alba var. minor") are looked up as such
 - 'genus': Genus name (optional, will be extracted from species if not provided)
 - 'species_name': Species epithet (optional, will be extracted from species if not provided)
 
@@ -18,98 +19,166 @@ Output includes:
 """
 
 import argparse
-import csv
+import json
 import sys
+import time
+from collections import Counter
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
 from iucn_red_list_client import IUCNRedListClient
+from iucn_red_list_client.names import DEFAULT_CUTOFF, NameIndex, parse_name
+from iucn_red_list_client.sync import MirrorStore
+
+DEFAULT_WORKERS = 8
+DEFAULT_RATE_LIMIT = 10.0
+JOURNAL_SUFFIX = '.journal.jsonl'
+INPUT_CHUNK_ROWS = 10_000
+OUTPUT_BATCH_ROWS = 10_000
+OUTPUT_FLUSH_SECONDS = 1.0
+THREATENED_CODES = ['EX', 'EW', 'CR', 'EN', 'VU']
+
+# Columns of the results table, in output order
+OUTPUT_COLUMNS = [
+    'scientific_name', 'common_name', 'family_name', 'conservation_status',
+    'is_threatened', 'year_published', 'assessment_id', 'url'
+]
+# Result fields read when formatting output rows and counting the summary
+RESULT_FIELDS = [column for column in OUTPUT_COLUMNS if column not in ('conservation_status', 'is_threatened')]
+RESULT_FIELDS += ['red_list_category', 'status']
 
 
-def parse_scientific_name(scientific_name: str) -> Tuple[Optional[str], Optional[str]]:
-    """Parse scientific name into genus and species components."""
-    parts = scientific_name.strip().split()
-    if len(parts) >= 2:
-        return parts[0], parts[1]
-    elif len(parts) == 1:
-        return parts[0], None
-    return None, None
+def parse_scientific_name(scientific_name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Parse scientific name into genus, species and infraspecific name components.
+    
+    Authorities, hybrid signs, subgenera and rank words are ignored.
+    """
+    parsed = parse_name(scientific_name)
+    return parsed['genus_name'], parsed['species_name'], parsed['infra_name']
+
 
+def display_name(genus: str, species: str, infra_name: Optional[str] = None) -> str:
+    """Return the name a row was looked up under."""
+    return f"{genus} {species} {infra_name}" if infra_name else f"{genus} {species}"
 
-def check_species_status(client: IUCNRedListClient, genus: str, species: str) -> Dict:
-    """Check conservation status for a species."""
+
+def load_name_index(mirror_path: str) -> NameIndex:
+    """Build a name index from the scientific names in a local mirror."""
+    store = MirrorStore(mirror_path)
     try:
-        response = client.call_endpoint('get_taxa_scientific_name', 
-                                      genus_name=genus, 
-                                      species_name=species)
+        return NameIndex(store.scientific_names())
+    finally:
+        store.close()
+
+
+def resolve_species_name(name_index: NameIndex, genus: str, species: str, infra_name: Optional[str] = None,
+                         match_cutoff: float = DEFAULT_CUTOFF) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """Resolve a name against known names.
+    
+    Returns genus, species, infraspecific name and the matched name if
+    corrected. A subspecies is only corrected to another infraspecific name,
+    never to its species.
+    """
+    matched = name_index.match(display_name(genus, species, infra_name), match_cutoff)
+    if matched is None or matched['exact'] or bool(matched['parsed']['infra_name']) != bool(infra_name):
+        return genus, species, infra_name, None
+    parsed = matched['parsed']
+    return parsed['genus_name'], parsed['species_name'], parsed['infra_name'], matched['name']
+
+
+def summarize_species_response(response: Dict, genus: str, species: str, infra_name: Optional[str] = None) -> Dict:
+    """Summarize a get_taxa_scientific_name response for one species or infraspecific taxon."""
+    if 'assessments' in response and response['assessments']:
+        # Get the latest assessment
+        latest = None
+        for assessment in response['assessments']:
+            if assessment.get('latest', False):
+                latest = assessment
+                break
         
-        if 'assessments' in response and response['assessments']:
-            # Get the latest assessment
-            latest = None
-            for assessment in response['assessments']:
-                if assessment.get('latest', False):
-                    latest = assessment
-                    break
+        # If no latest found, use the first one
+        if not latest and response['assessments']:
+            latest = response['assessments'][0]
+        
+        if latest:
+            # Get taxon info
+            taxon = response.get('taxon', {})
             
-            # If no latest found, use the first one
-            if not latest and response['assessments']:
-                latest = response['assessments'][0]
+            # Get common name (first main common name if available)
+            common_name = 'N/A'
+            common_names = taxon.get('common_names', [])
+            for cn in common_names:
+                if cn.get('main', False):
+                    common_name = cn.get('name', 'N/A')
+                    break
+            if common_name == 'N/A' and common_names:
+                common_name = common_names[0].get('name', 'N/A')
             
-            if latest:
-                # Get taxon info
-                taxon = response.get('taxon', {})
-                
-                # Get common name (first main common name if available)
-                common_name = 'N/A'
-                common_names = taxon.get('common_names', [])
-                for cn in common_names:
-                    if cn.get('main', False):
-                        common_name = cn.get('name', 'N/A')
-                        break
-                if common_name == 'N/A' and common_names:
-                    common_name = common_names[0].get('name', 'N/A')
-                
-                return {
-                    'status': 'found',
-                    'scientific_name': taxon.get('scientific_name', f"{genus} {species}"),
-                    'common_name': common_name,
-                    'family_name': taxon.get('family_name', 'N/A'),
-                    'red_list_category': latest.get('red_list_category_code', 'Unknown'),
-                    'year_published': latest.get('year_published', 'Unknown'),
-                    'assessment_id': latest.get('assessment_id', 'Unknown'),
-                    'url': latest.get('url', 'Unknown'),
-                    'possibly_extinct': latest.get('possibly_extinct', False),
-                    'possibly_extinct_in_wild': latest.get('possibly_extinct_in_the_wild', False)
-                }
-        
-        return {
-            'status': 'not_found',
-            'scientific_name': f"{genus} {species}",
-            'common_name': 'N/A',
-            'family_name': 'N/A',
-            'red_list_category': 'Not Found',
-            'year_published': 'N/A',
-            'assessment_id': 'N/A',
-            'url': 'N/A',
-            'possibly_extinct': False,
-            'possibly_extinct_in_wild': False
-        }
+            return {
+                'status': 'found',
+                'scientific_name': taxon.get('scientific_name', display_name(genus, species, infra_name)),
+                'common_name': common_name,
+                'family_name': taxon.get('family_name', 'N/A'),
+                'red_list_category': latest.get('red_list_category_code', 'Unknown'),
+                'year_published': latest.get('year_published', 'Unknown'),
+                'assessment_id': latest.get('assessment_id', 'Unknown'),
+                'url': latest.get('url', 'Unknown'),
+                'possibly_extinct': latest.get('possibly_extinct', False),
+                'possibly_extinct_in_wild': latest.get('possibly_extinct_in_the_wild', False)
+            }
+    
+    return {
+        'status': 'not_found',
+        'scientific_name': display_name(genus, species, infra_name),
+        'common_name': 'N/A',
+        'family_name': 'N/A',
+        'red_list_category': 'Not Found',
+        'year_published': 'N/A',
+        'assessment_id': 'N/A',
+        'url': 'N/A',
+        'possibly_extinct': False,
+        'possibly_extinct_in_wild': False
+    }
+
+
+def error_result(genus: str, species: str, error: str, infra_name: Optional[str] = None) -> Dict:
+    """Build the result row for a species whose lookup failed."""
+    return {
+        'status': 'error',
+        'scientific_name': display_name(genus, species, infra_name),
+        'common_name': 'N/A',
+        'family_name': 'N/A',
+        'red_list_category': 'Error',
+        'year_published': 'N/A',
+        'assessment_id': 'N/A',
+        'url': 'N/A',
+        'possibly_extinct': False,
+        'possibly_extinct_in_wild': False,
+        'error': error
+    }
+
+
+def check_species_status(client: IUCNRedListClient, genus: str, species: str,
+                         infra_name: Optional[str] = None) -> Dict:
+    """Check conservation status for a species, or a subspecies or variety given ``infra_name``."""
+    params = {'infra_name': infra_name} if infra_name else {}
+    try:
+        response = client.call_endpoint('get_taxa_scientific_name', 
+                                      genus_name=genus, 
+                                      species_name=species,
+                                      **params)
+        return summarize_species_response(response, genus, species, infra_name)
         
     except Exception as e:
-        return {
-            'status': 'error',
-            'scientific_name': f"{genus} {species}",
-            'common_name': 'N/A',
-            'family_name': 'N/A',
-            'red_list_category': 'Error',
-            'year_published': 'N/A',
-            'assessment_id': 'N/A',
-            'url': 'N/A',
-            'possibly_extinct': False,
-            'possibly_extinct_in_wild': False,
-            'error': str(e)
-        }
+        return error_result(genus, species, str(e), infra_name)
 
 
 def get_status_descriptions(client: IUCNRedListClient) -> Dict[str, str]:
@@ -130,8 +199,7 @@ def get_status_descriptions(client: IUCNRedListClient) -> Dict[str, str]:
 
 def is_threatened(code: str) -> bool:
     """Check if species is threatened (extinct, endangered, vulnerable)."""
-    threatened_codes = {'EX', 'EW', 'CR', 'EN', 'VU'}
-    return code in threatened_codes
+    return code in THREATENED_CODES
 
 
 def read_input_file(file_path: str) -> pd.DataFrame:
@@ -146,8 +214,244 @@ def read_input_file(file_path: str) -> pd.DataFrame:
         raise ValueError(f"Unsupported file format: {path.suffix}")
 
 
-def process_species_list(input_file: str, output_file: Optional[str] = None, verbose: bool = False) -> None:
-    """Process species list and check conservation status."""
+def open_input_file(file_path: str, chunk_rows: int = INPUT_CHUNK_ROWS) -> Tuple[List[str], Iterator[pd.DataFrame]]:
+    """Open a CSV or Excel file for reading in chunks.
+    
+    Returns the column names and an iterator of DataFrames of at most
+    ``chunk_rows`` rows, with cells as strings, so only one chunk is held in
+    memory. ``.xlsx`` files are read with openpyxl in read-only mode; legacy
+    ``.xls`` files can only be read whole.
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix == '.csv':
+        columns = list(pd.read_csv(file_path, nrows=0).columns)
+        return columns, iter(pd.read_csv(file_path, chunksize=chunk_rows, dtype=str, keep_default_na=False))
+    elif suffix == '.xlsx':
+        return _open_xlsx(file_path, chunk_rows)
+    elif suffix == '.xls':
+        df = pd.read_excel(file_path, dtype=str, keep_default_na=False)
+        return list(df.columns), iter([df])
+    else:
+        raise ValueError(f"Unsupported file format: {Path(file_path).suffix}")
+
+
+def _open_xlsx(file_path: str, chunk_rows: int) -> Tuple[List[str], Iterator[pd.DataFrame]]:
+    """Read the first worksheet of an .xlsx file row by row."""
+    if openpyxl is None:
+        raise ImportError("Reading .xlsx files requires openpyxl: pip install openpyxl")
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    rows = workbook.active.iter_rows(values_only=True)
+    header = next(rows, None) or ()
+    columns = [str(value) if value is not None else f"Unnamed: {i}" for i, value in enumerate(header)]
+    
+    def chunks() -> Iterator[pd.DataFrame]:
+        start = 0
+        try:
+            while True:
+                batch = list(islice(rows, chunk_rows))
+                if not batch:
+                    return
+                values = [
+                    ['' if value is None else str(value) for value in (list(row) + [None] * len(columns))[:len(columns)]]
+                    for row in batch
+                ]
+                yield pd.DataFrame(values, columns=columns, index=range(start, start + len(batch)))
+                start += len(batch)
+        finally:
+            workbook.close()
+    
+    return columns, chunks()
+
+
+def find_name_columns(columns: Iterable[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return the scientific name, genus and species epithet columns, where present."""
+    species_col = None
+    genus_col = None
+    species_name_col = None
+    
+    for col in columns:
+        col_lower = col.lower()
+        if col_lower in ['species', 'scientific_name', 'name']:
+            species_col = col
+        elif col_lower == 'genus':
+            genus_col = col
+        elif col_lower in ['species_name', 'epithet']:
+            species_name_col = col
+    return species_col, genus_col, species_name_col
+
+
+def iter_species_rows(chunks: Iterable[pd.DataFrame], species_col: Optional[str], genus_col: Optional[str],
+                      species_name_col: Optional[str], verbose: bool = False,
+                      name_index: Optional[NameIndex] = None,
+                      match_cutoff: float = DEFAULT_CUTOFF) -> Iterator[Tuple[int, str, str, Optional[str]]]:
+    """Yield ``(row_number, genus, species, infra_name)`` for each input row with a valid species name."""
+    for chunk in chunks:
+        for idx, row in zip(chunk.index, chunk.to_dict('records')):
+            if species_col:
+                scientific_name = str(row[species_col]).strip()
+                genus, species_name, infra_name = parse_scientific_name(scientific_name)
+            else:
+                genus = str(row[genus_col]).strip() if genus_col else None
+                species_name = str(row[species_name_col]).strip() if species_name_col else None
+                infra_name = None
+            
+            if not genus or not species_name:
+                if verbose:
+                    print(f"Row {idx + 1}: Skipping invalid species name")
+                continue
+            
+            if name_index is not None:
+                genus, species_name, infra_name, corrected = resolve_species_name(
+                    name_index, genus, species_name, infra_name, match_cutoff)
+                if corrected and verbose:
+                    print(f"Row {idx + 1}: Matched to known name {corrected}")
+            
+            yield idx + 1, genus, species_name, infra_name
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of completed lookups, used to resume interrupted runs."""
+    
+    def __init__(self, path: str, resume: bool = False):
+        """Open the journal, indexing completed rows when resuming and starting afresh otherwise."""
+        self.path = Path(path)
+        # Row number -> offset of its journal line; results are read back from disk when needed
+        self.completed: Dict[int, int] = self._load() if resume else {}
+        self._reader = open(self.path, 'rb') if self.completed else None
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+    
+    def _load(self) -> Dict[int, int]:
+        """Index completed rows by line offset, dropping a last line left incomplete by a crash."""
+        completed: Dict[int, int] = {}
+        if not self.path.exists():
+            return completed
+        offset = 0
+        with open(self.path, 'r+b') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    f.truncate(offset)
+                    break
+                if line.strip():
+                    completed[json.loads(line)['row_number']] = offset
+                offset += len(line)
+        return completed
+    
+    def get(self, row_number: int, genus: str, species: str, infra_name: Optional[str] = None) -> Optional[Dict]:
+        """Return the journaled result of a row, if it was looked up for the same name."""
+        offset = self.completed.get(row_number)
+        if offset is None:
+            return None
+        self._reader.seek(offset)
+        result = json.loads(self._reader.readline())
+        if (result['input_genus'], result['input_species'], result.get('input_infra')) == (
+                genus, species, infra_name):
+            return result
+        return None
+    
+    def record(self, result: Dict) -> None:
+        """Append a completed result and flush it to disk."""
+        self._file.write(json.dumps(result) + '\n')
+        self._file.flush()
+    
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._reader is not None:
+            self._reader.close()
+        self._file.close()
+
+
+class ResultWriter:
+    """Write batches of output rows as they complete, without holding them in memory.
+    
+    CSV and TSV files are appended to batch by batch and Excel workbooks
+    written through openpyxl's write-only mode. Without an output file,
+    batches are collected for the console table.
+    """
+    
+    def __init__(self, output_file: Optional[str] = None):
+        """Open the output file, or collect batches for the console table."""
+        self.output_file = output_file
+        self.frames: List[pd.DataFrame] = []
+        self._file = self._workbook = self._sheet = None
+        ext = Path(output_file).suffix.lower() if output_file else None
+        self._sep = '\t' if ext == '.tsv' else ','
+        if ext in ('.xlsx', '.xls'):
+            if openpyxl is None:
+                raise ImportError("Writing Excel files requires openpyxl: pip install openpyxl")
+            self._workbook = openpyxl.Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet()
+            self._sheet.append(OUTPUT_COLUMNS)
+        elif output_file:
+            # Unknown extensions default to CSV
+            self._file = open(output_file, 'w', newline='', encoding='utf-8')
+            pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(self._file, index=False, sep=self._sep)
+    
+    def write(self, frame: pd.DataFrame) -> None:
+        """Write a batch of output rows."""
+        if self._file is not None:
+            frame.to_csv(self._file, header=False, index=False, sep=self._sep)
+            self._file.flush()
+        elif self._sheet is not None:
+            for row in frame.astype(object).where(frame.notna(), None).itertuples(index=False):
+                self._sheet.append(list(row))
+        else:
+            self.frames.append(frame)
+    
+    def table(self) -> pd.DataFrame:
+        """Return the collected rows for display."""
+        if not self.frames:
+            return pd.DataFrame(columns=OUTPUT_COLUMNS)
+        return pd.concat(self.frames, ignore_index=True)
+    
+    def close(self) -> None:
+        """Finish the output file."""
+        if self._file is not None:
+            self._file.close()
+        elif self._workbook is not None:
+            self._workbook.save(self.output_file)
+
+
+def results_frame(results: List[Dict]) -> pd.DataFrame:
+    """Build a frame of the result fields needed for output and the summary, column by column."""
+    return pd.DataFrame({column: [result.get(column) for result in results] for column in RESULT_FIELDS})
+
+
+def format_results(results: pd.DataFrame, status_descriptions: Dict[str, str]) -> pd.DataFrame:
+    """Select the output columns of a batch of results, adding readable statuses and threatened flags.
+    
+    ``red_list_category`` is made categorical, so each distinct code is
+    described once per batch rather than once per row.
+    """
+    codes = results['red_list_category'].astype('category')
+    formatted = results.reindex(columns=OUTPUT_COLUMNS)
+    formatted['conservation_status'] = codes.map(lambda code: status_descriptions.get(code, code))
+    formatted['is_threatened'] = codes.isin(THREATENED_CODES)
+    return formatted
+
+
+def count_results(results: pd.DataFrame, formatted: pd.DataFrame) -> Counter:
+    """Count a batch of results by lookup status and threatened flag."""
+    counts = results.groupby([results['status'], formatted['is_threatened']], observed=True).size()
+    return Counter(counts.to_dict())
+
+
+def default_journal_path(input_file: str, output_file: Optional[str] = None) -> str:
+    """Return the journal path used when none is given: next to the output, else the input."""
+    return f"{output_file or input_file}{JOURNAL_SUFFIX}"
+
+
+def process_species_list(input_file: str, output_file: Optional[str] = None, verbose: bool = False,
+                         max_workers: int = DEFAULT_WORKERS, rate_limit: Optional[float] = DEFAULT_RATE_LIMIT,
+                         name_index: Optional[NameIndex] = None, match_cutoff: float = DEFAULT_CUTOFF,
+                         resume: bool = False, journal_file: Optional[str] = None) -> None:
+    """Process species list and check conservation status.
+    
+    With a ``name_index``, misspelled names are corrected to the closest
+    known name before they are looked up. Each completed lookup is appended
+    to a checkpoint journal (``journal_file``, by default next to the
+    output), and with ``resume`` rows already in the journal are not looked
+    up again. Results are written in input order as they complete.
+    """
     
     # Initialize IUCN client
     client = IUCNRedListClient()
@@ -157,103 +461,122 @@ def process_species_list(input_file: str, output_file: Optional[str] = None, ver
         print("Fetching conservation status descriptions from API...")
     status_descriptions = get_status_descriptions(client)
     
-    # Read input file
+    # Open input file for reading in chunks
     try:
-        df = read_input_file(input_file)
+        columns, chunks = open_input_file(input_file)
         if verbose:
-            print(f"Loaded {len(df)} species from {input_file}")
+            print(f"Reading species from {input_file}")
     except Exception as e:
         print(f"Error reading input file: {e}")
         sys.exit(1)
     
     # Determine column names
-    species_col = None
-    genus_col = None
-    species_name_col = None
-    
-    for col in df.columns:
-        col_lower = col.lower()
-        if col_lower in ['species', 'scientific_name', 'name']:
-            species_col = col
-        elif col_lower == 'genus':
-            genus_col = col
-        elif col_lower in ['species_name', 'epithet']:
-            species_name_col = col
+    species_col, genus_col, species_name_col = find_name_columns(columns)
     
     if not species_col and not (genus_col and species_name_col):
         print("Error: Could not find species name columns.")
         print("Expected columns: 'species' or 'scientific_name', or 'genus' + 'species_name'")
-        print(f"Found columns: {list(df.columns)}")
+        print(f"Found columns: {columns}")
         sys.exit(1)
     
-    results = []
+    rows = iter_species_rows(chunks, species_col, genus_col, species_name_col, verbose,
+                             name_index=name_index, match_cutoff=match_cutoff)
+    journal = CheckpointJournal(journal_file or default_journal_path(input_file, output_file), resume)
+    writer = ResultWriter(output_file)
+    counts: Counter = Counter()
+    threatened = []
+    resumed = 0
     
-    if verbose:
-        print("\nChecking species status...")
-    for idx, row in df.iterrows():
-        if species_col:
-            scientific_name = str(row[species_col]).strip()
-            genus, species_name = parse_scientific_name(scientific_name)
-        else:
-            genus = str(row[genus_col]).strip() if genus_col else None
-            species_name = str(row[species_name_col]).strip() if species_name_col else None
-        
-        if not genus or not species_name:
-            if verbose:
-                print(f"Row {idx + 1}: Skipping invalid species name")
-            continue
-        
-        if verbose:
-            print(f"Checking {genus} {species_name}...")
-        result = check_species_status(client, genus, species_name)
-        
-        # Add original row data
-        result.update({
-            'row_number': idx + 1,
-            'input_genus': genus,
-            'input_species': species_name
-        })
-        
-        results.append(result)
+    # Results are written in input order: completed rows wait here for earlier ones,
+    # then are formatted and written in batches
+    ready: Dict[int, Dict] = {}
+    next_position = 0
+    batch: List[Dict] = []
+    last_flush = time.monotonic()
     
-    # Create results DataFrame
-    results_df = pd.DataFrame(results)
+    def flush() -> None:
+        nonlocal last_flush
+        last_flush = time.monotonic()
+        if not batch:
+            return
+        results = results_frame(batch)
+        batch.clear()
+        formatted = format_results(results, status_descriptions)
+        writer.write(formatted)
+        counts.update(count_results(results, formatted))
+        # Threatened rows are only kept for the verbose summary
+        if verbose:
+            threatened.extend(formatted[formatted['is_threatened']].to_dict('records'))
     
-    # Add human-readable status using cached descriptions
-    results_df['status_description'] = results_df['red_list_category'].apply(
-        lambda code: status_descriptions.get(code, code)
-    )
-    results_df['is_threatened'] = results_df['red_list_category'].apply(is_threatened)
+    def complete(position: int, result: Dict) -> None:
+        nonlocal next_position
+        ready[position] = result
+        while next_position in ready:
+            batch.append(ready.pop(next_position))
+            next_position += 1
+        if len(batch) >= OUTPUT_BATCH_ROWS or time.monotonic() - last_flush >= OUTPUT_FLUSH_SECONDS:
+            flush()
     
-    # Reorder columns - keep only essential output columns
-    column_order = [
-        'scientific_name', 'common_name', 'family_name', 'conservation_status', 
-        'is_threatened', 'year_published', 'assessment_id', 'url'
-    ]
+    # Rows handed to the bulk lookup, by lookup index, until their result arrives
+    in_flight: Dict[int, Tuple[int, int, str, str, Optional[str]]] = {}
     
-    # Rename status_description to conservation_status for clarity
-    results_df = results_df.rename(columns={'status_description': 'conservation_status'})
+    def names_to_check() -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Yield rows to look up, completing rows found in the journal instead."""
+        nonlocal resumed
+        lookup_index = 0
+        for position, (row_number, genus, species_name, infra_name) in enumerate(rows):
+            journaled = journal.get(row_number, genus, species_name, infra_name)
+            if journaled is not None:
+                resumed += 1
+                complete(position, journaled)
+                continue
+            in_flight[lookup_index] = (position, row_number, genus, species_name, infra_name)
+            lookup_index += 1
+            yield genus, species_name, infra_name
     
-    # Select only the columns we want in output
-    output_columns = [col for col in column_order if col in results_df.columns]
-    results_df = results_df[output_columns]
+    try:
+        if verbose:
+            print(f"\nChecking species with {max_workers} workers...")
+        lookups = client.iter_species_bulk(names_to_check(), max_workers=max_workers, rate_limit=rate_limit)
+        for index, lookup in lookups:
+            position, row_number, genus, species_name, infra_name = in_flight.pop(index)
+            if lookup['error'] is not None:
+                result = error_result(genus, species_name, lookup['error'], infra_name)
+            else:
+                result = summarize_species_response(lookup['result'], genus, species_name, infra_name)
+            
+            # Add original row data
+            result.update({
+                'row_number': row_number,
+                'input_genus': genus,
+                'input_species': species_name,
+                'input_infra': infra_name
+            })
+            
+            journal.record(result)
+            complete(position, result)
+    finally:
+        flush()
+        journal.close()
+        writer.close()
     
     # Print summary (only if verbose)
     if verbose:
         print(f"\n=== SUMMARY ===")
-        print(f"Total species checked: {len(results)}")
-        found_count = sum(1 for r in results if r['status'] == 'found')
-        not_found_count = sum(1 for r in results if r['status'] == 'not_found')
-        error_count = sum(1 for r in results if r['status'] == 'error')
-        print(f"Found in IUCN database: {found_count}")
-        print(f"Not found: {not_found_count}")
-        print(f"Errors: {error_count}")
+        print(f"Total species checked: {next_position}")
+        if resume:
+            print(f"Resumed from journal: {resumed}")
+        status_counts = Counter()
+        for (status, _), count in counts.items():
+            status_counts[status] += count
+        print(f"Found in IUCN database: {status_counts['found']}")
+        print(f"Not found: {status_counts['not_found']}")
+        print(f"Errors: {status_counts['error']}")
         
         # Threatened species summary
-        threatened = results_df[results_df['is_threatened'] == True]
-        if len(threatened) > 0:
+        if threatened:
             print(f"\n=== THREATENED SPECIES ({len(threatened)}) ===")
-            for _, row in threatened.iterrows():
+            for row in threatened:
                 status_desc = row['conservation_status']
                 year = row['year_published']
                 url = row['url']
@@ -261,29 +584,14 @@ def process_species_list(input_file: str, output_file: Optional[str] = None, ver
                 if url != 'N/A':
                     print(f"  Study: {url}")
     
-    # Save or display results
+    # Report saved results or display them
     if output_file:
-        output_path = Path(output_file)
-        ext = output_path.suffix.lower()
-        
-        if ext == '.csv':
-            results_df.to_csv(output_file, index=False)
-            print(f"Results saved to: {output_file}")
-        elif ext == '.tsv':
-            results_df.to_csv(output_file, index=False, sep='\t')
-            print(f"Results saved to: {output_file}")
-        elif ext in ['.xlsx', '.xls']:
-            results_df.to_excel(output_file, index=False)
-            print(f"Results saved to: {output_file}")
-        else:
-            # Default to CSV if unknown extension
-            results_df.to_csv(output_file, index=False)
-            print(f"Results saved to: {output_file}")
+        print(f"Results saved to: {output_file}")
     else:
         # Display as table
         if verbose:
             print("\n=== RESULTS TABLE ===")
-        print(results_df.to_string(index=False))
+        print(writer.table().to_string(index=False))
 
 
 def main():
@@ -304,6 +612,39 @@ def main():
         action='store_true',
         help='Show detailed progress messages'
     )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of parallel lookups (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=DEFAULT_RATE_LIMIT,
+        help=f'Maximum API requests per second, 0 for no limit (default: {DEFAULT_RATE_LIMIT:g})'
+    )
+    
+    parser.add_argument(
+        '--mirror',
+        help='Local mirror database (see "iucn-client sync") whose names are used to correct misspellings'
+    )
+    parser.add_argument(
+        '--match-cutoff',
+        type=float,
+        default=DEFAULT_CUTOFF,
+        help=f'Minimum similarity (0-1) for correcting a name (default: {DEFAULT_CUTOFF:g})'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip species already checked by an interrupted run, as recorded in the journal'
+    )
+    parser.add_argument(
+        '--journal',
+        help=f'Checkpoint journal path (default: output or input file + {JOURNAL_SUFFIX})'
+    )
     
     args = parser.parse_args()
     
@@ -312,9 +653,13 @@ def main():
         sys.exit(1)
     
     try:
-        process_species_list(args.input_file, args.output, args.verbose)
+        name_index = load_name_index(args.mirror) if args.mirror else None
+        process_species_list(args.input_file, args.output, args.verbose,
+                             max_workers=args.workers, rate_limit=args.rate_limit or None,
+                             name_index=name_index, match_cutoff=args.match_cutoff,
+                             resume=args.resume, journal_file=args.journal)
     except KeyboardInterrupt:
-        print("\nOperation cancelled by user.")
+        print("\nOperation cancelled by user. Rerun with --resume to continue.")
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}")
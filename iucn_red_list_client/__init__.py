@@ -1,6 +1,57 @@
-"""IUCN Red List API Client Package."""
+"""IUCN Red List API Client Package.
+
+Public names are imported from their submodules on first access (PEP 562),
+so ``import iucn_red_list_client`` does not load the HTTP stacks.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 from .__version__ import __version__
-from .client import IUCNRedListClient
 
-__all__ = ['IUCNRedListClient', '__version__']
+if TYPE_CHECKING:
+    from .async_client import AsyncIUCNRedListClient
+    from .cache import MemoryCache, ResponseCache, SQLiteCache
+    from .client import IUCNRedListClient
+    from .local import LocalIUCNClient
+    from .ratelimit import TokenBucket
+    from .singleflight import SingleFlight
+
+# Public name -> defining submodule
+_LAZY_IMPORTS = {
+    'AsyncIUCNRedListClient': 'async_client',
+    'IUCNRedListClient': 'client',
+    'LocalIUCNClient': 'local',
+    'MemoryCache': 'cache',
+    'ResponseCache': 'cache',
+    'SQLiteCache': 'cache',
+    'SingleFlight': 'singleflight',
+    'TokenBucket': 'ratelimit',
+}
+
+__all__ = [
+    'AsyncIUCNRedListClient',
+    'IUCNRedListClient',
+    'LocalIUCNClient',
+    'MemoryCache',
+    'ResponseCache',
+    'SQLiteCache',
+    'SingleFlight',
+    'TokenBucket',
+    '__version__',
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public names alongside the loaded module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -372,7 +372,7 @@ API_ENDPOINTS = {
         "description": """Returns the latest assessments for the supplied phylum. Results are paginated (100 assessments per page) ...""",
         "tags": ['Taxa'],
         "path_params": ['phylum_name'],
-        "query_params": [{'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
+        "query_params": [{'name': 'page', 'required': False, 'type': 'integer'}, {'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
         "requires_auth": True
     },
     "get_taxa_class": {
@@ -392,7 +392,7 @@ API_ENDPOINTS = {
         "description": """Returns the latest assessments for the supplied class. Results are paginated (100 assessments per page) ...""",
         "tags": ['Taxa'],
         "path_params": ['class_name'],
-        "query_params": [{'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
+        "query_params": [{'name': 'page', 'required': False, 'type': 'integer'}, {'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
         "requires_auth": True
     },
     "get_taxa_order": {
@@ -412,7 +412,7 @@ API_ENDPOINTS = {
         "description": """Returns the latest assessments for the supplied order. Results are paginated (100 assessments per page)...""",
         "tags": ['Taxa'],
         "path_params": ['order_name'],
-        "query_params": [{'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
+        "query_params": [{'name': 'page', 'required': False, 'type': 'integer'}, {'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
         "requires_auth": True
     },
     "get_taxa_family": {
@@ -432,7 +432,7 @@ API_ENDPOINTS = {
         "description": """Returns the latest assessments for the supplied family. Results are paginated (100 assessments per page) ...""",
         "tags": ['Taxa'],
         "path_params": ['family_name'],
-        "query_params": [{'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
+        "query_params": [{'name': 'page', 'required': False, 'type': 'integer'}, {'name': 'year_published', 'required': False, 'type': 'integer'}, {'name': 'latest', 'required': False, 'type': 'boolean'}, {'name': 'scope_code', 'required': False, 'type': 'integer'}],
         "requires_auth": True
     },
     "get_taxa_possibly_extinct": {
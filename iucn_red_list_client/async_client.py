@@ -0,0 +1,234 @@
+"""
+Asyncio client for the IUCN Red List API v4.
+
+AsyncIUCNRedListClient mirrors IUCNRedListClient on top of a pooled httpx
+transport, so one event loop can keep many requests in flight without
+thread hops. It reads the same configuration sources and resolves paths and
+query parameters from the same endpoint registry.
+
+Requires the optional ``httpx`` dependency:
+
+    pip install iucn_red_list_client[async]
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None
+
+from .client import (
+    DEFAULT_BASE_URL,
+    PAGE_SIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+    ConfigMixin,
+    TimeoutSetting,
+    inject_truststore,
+    is_paginated,
+    page_records,
+)
+from .cache import make_cache_key
+from .dispatch import endpoint_spec
+from .endpoints import AsyncEndpointMethods
+from .jsoncodec import get_codec
+from .models import decode_model
+from .ratelimit import TokenBucket, parse_retry_after
+from .singleflight import SingleFlight
+from .transfer import TransferMeter, negotiate_encodings
+
+# Constants
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_MAX_CONNECTIONS = 100
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+
+class AsyncIUCNRedListClient(ConfigMixin, AsyncEndpointMethods):
+    """Asyncio IUCN Red List API Client."""
+
+    def __init__(self, config_file: Optional[str] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 transport: Optional["httpx.AsyncBaseTransport"] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 json_backend: Optional[str] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 **kwargs):
+        """Initialize the client.
+
+        ``max_concurrency`` bounds the number of requests in flight at once and
+        ``max_connections`` sizes the keep-alive connection pool. ``transport``
+        replaces the default httpx transport (useful for testing).
+        ``rate_limiter`` is a TokenBucket to share with other clients; when
+        omitted one is created from the ``rate_limit`` setting, if any.
+        ``json_backend`` names the JSON backend used to decode responses,
+        overriding the ``json_backend`` setting (default: fastest installed).
+        ``single_flight`` is a SingleFlight through which concurrent identical
+        GET calls share one request and its decoded result.
+        Wire and decoded response sizes are counted in ``transfer``.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncIUCNRedListClient requires httpx. "
+                "Install it with: pip install iucn_red_list_client[async]"
+            )
+
+        # Load configuration
+        self.config = self._load_config(config_file, **kwargs)
+        self.base_url = self.config.get('base_url', DEFAULT_BASE_URL)
+        self.rate_limiter = rate_limiter or self._rate_limiter_from_config()
+        self.timeout = self._timeout_from_config()
+        self.json_codec = get_codec(json_backend or self.config.get('json_backend'))
+        self.single_flight = single_flight
+
+        # Set up authentication
+        headers = {}
+        if self.config.get('api_token'):
+            headers['Authorization'] = self.config['api_token']
+
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        inject_truststore()
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url.rstrip('/'),
+            headers=headers,
+            timeout=_httpx_timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+        # Advertise the most compact codings httpx can decode, and count what they save
+        self.http.headers['Accept-Encoding'] = (
+            self.config.get('accept_encoding') or negotiate_encodings(self.http.headers['Accept-Encoding'])
+        )
+        self.transfer = TransferMeter()
+
+    async def __aenter__(self) -> "AsyncIUCNRedListClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.http.aclose()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore, creating it inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _make_request(self, method: str, path: str, **kwargs) -> "httpx.Response":
+        """Make HTTP request to API, retrying throttled and failed responses."""
+        async with self._get_semaphore():
+            attempt = 0
+            while True:
+                try:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire_async()
+                    response = await self.http.request(method, path, **kwargs)
+                    self.transfer.record(str(response.url), response.headers.get('Content-Encoding', 'identity'),
+                                         response.num_bytes_downloaded, len(response.content))
+                    if self.rate_limiter is not None:
+                        if response.status_code == 429:
+                            self.rate_limiter.throttled(parse_retry_after(response.headers.get('Retry-After')))
+                        else:
+                            self.rate_limiter.succeeded()
+                    if response.status_code in RETRY_STATUS_FORCELIST and attempt < RETRY_TOTAL:
+                        attempt += 1
+                        if response.status_code == 429 and self.rate_limiter is not None:
+                            # The rate limiter paces the retry
+                            continue
+                        delay = _retry_delay(response, attempt)
+                        logger.info(f"Retrying {path} after HTTP {response.status_code} in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        continue
+                    response.raise_for_status()
+                    return response
+
+                except httpx.HTTPError as e:
+                    logger.error(f"Request failed: {e}")
+                    raise
+
+    async def call_endpoint(self, endpoint_name: str, timeout: TimeoutSetting = None,
+                            model: Optional[type] = None, **kwargs) -> Any:
+        """Call a specific API endpoint.
+
+        ``timeout`` overrides the configured timeout for this call: a number
+        sets the read timeout and a ``(connect, read)`` pair sets both.
+        ``model`` is a type from ``iucn_red_list_client.models`` to decode the
+        response into instead of nested dicts.
+        """
+        spec = endpoint_spec(endpoint_name)
+        method, path, query_params = spec.resolve(kwargs)
+        return await self._call_resolved(endpoint_name, spec.tags, method, path, query_params, timeout, model)
+
+    async def _call_resolved(self, endpoint_name: str, tags: Tuple[str, ...], method: str, path: str,
+                             query_params: Dict[str, Any], timeout: TimeoutSetting = None,
+                             model: Optional[type] = None) -> Any:
+        """Make an endpoint call whose path and query parameters are already resolved."""
+        request_kwargs = {'timeout': _httpx_timeout(self.timeout_for(endpoint_name, timeout, tags))}
+        if query_params:
+            request_kwargs['params'] = query_params
+
+        async def fetch() -> Any:
+            response = await self._make_request(method, path, **request_kwargs)
+            if model is not None:
+                return decode_model(response.content, model, self.json_codec)
+            return self.json_codec.loads(response.content)
+
+        # Concurrent identical calls share one request; the first caller's timeout applies
+        if method == 'GET' and self.single_flight is not None:
+            key = make_cache_key(method, f"{self.base_url.rstrip('/')}{path}", query_params)
+            if model is not None:
+                key = f"{key} as {model.__name__}"
+            return await self.single_flight.do_async(key, fetch)
+        return await fetch()
+
+    async def iter_pages(self, endpoint_name: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each page of a paginated endpoint in turn.
+
+        Iteration starts at ``page`` (default 1) and stops after the first
+        short or empty page.
+        """
+        if not is_paginated(endpoint_name):
+            raise ValueError(f"Endpoint is not paginated: {endpoint_name}")
+
+        page = int(kwargs.pop('page', 1))
+        while True:
+            result = await self.call_endpoint(endpoint_name, page=page, **kwargs)
+            count = len(page_records(result))
+            yield result
+            if count < PAGE_SIZE:
+                return
+            page += 1
+
+    async def iter_records(self, endpoint_name: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every assessment record of a paginated endpoint."""
+        async for result in self.iter_pages(endpoint_name, **kwargs):
+            for record in page_records(result):
+                yield record
+
+
+def _httpx_timeout(timeout: Tuple[float, float]) -> "httpx.Timeout":
+    """Convert a (connect, read) pair into an httpx timeout."""
+    connect, read = timeout
+    return httpx.Timeout(read, connect=connect)
+
+
+def _retry_delay(response: "httpx.Response", attempt: int) -> float:
+    """Return the delay before a retry, honouring ``Retry-After`` when present."""
+    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+    if retry_after is not None:
+        return retry_after
+    return RETRY_BACKOFF_FACTOR * (2 ** (attempt - 1))
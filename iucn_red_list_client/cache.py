@@ -0,0 +1,383 @@
+"""
+Response caching for the IUCN Red List API client.
+
+Caches are keyed on the HTTP method, the resolved request URL and the sorted
+query parameters. How long a response stays fresh is decided per endpoint:
+a TTL can be given for an endpoint name or for any of its tags in
+``API_ENDPOINTS``, falling back to a default. A TTL of ``0`` or ``None``
+disables caching for that endpoint.
+
+SQLiteCache also keeps the ``ETag`` and ``Last-Modified`` validators of each
+response. Once such an entry expires the client revalidates it with a
+conditional GET, and a 304 answer serves the stored body again, so an
+unchanged response costs headers only.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+# Constants
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'iucn_red_list_client' / 'responses.sqlite'
+DEFAULT_MEMORY_TTL = 5 * 60
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_NEGATIVE_TTL = 60
+
+
+def make_cache_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Build a cache key from the method, resolved URL and sorted query parameters."""
+    query = urlencode(sorted((name, str(value)) for name, value in (params or {}).items()))
+    return f"{method.upper()} {url}?{query}"
+
+
+def response_validators(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Return the ``etag`` and ``last_modified`` validators present in response headers."""
+    validators = {}
+    if headers.get('ETag'):
+        validators['etag'] = headers['ETag']
+    if headers.get('Last-Modified'):
+        validators['last_modified'] = headers['Last-Modified']
+    return validators
+
+
+def conditional_headers(validators: Mapping[str, str]) -> Dict[str, str]:
+    """Return the request headers revalidating a response with the given validators."""
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+class ResponseCache:
+    """Base class for response caches used by IUCNRedListClient.
+
+    Subclasses implement ``get``, ``set``, ``clear`` and ``__len__``, and
+    may keep expired entries for revalidation through ``get_stale`` and
+    ``refresh``; TTL policy and hit/miss accounting live here.
+    """
+
+    def __init__(self, ttls: Optional[Mapping[str, Optional[float]]] = None,
+                 default_ttl: Optional[float] = DEFAULT_TTL):
+        """Initialize the cache.
+
+        ``ttls`` maps endpoint names or endpoint tags to a TTL in seconds.
+        """
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.fetched = 0
+        self._stats_lock = threading.Lock()
+
+    def ttl_for(self, endpoint_name: str, tags: Iterable[str] = ()) -> Optional[float]:
+        """Return the TTL for an endpoint, checking its name, then its tags."""
+        if endpoint_name in self.ttls:
+            return self.ttls[endpoint_name]
+        for tag in tags:
+            if tag in self.ttls:
+                return self.ttls[tag]
+        return self.default_ttl
+
+    def _record(self, hit: bool) -> None:
+        """Count a cache lookup."""
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def record_fetch(self, not_modified: bool) -> None:
+        """Count a request made on a cache miss, answered 304 or with a full body."""
+        with self._stats_lock:
+            if not_modified:
+                self.revalidated += 1
+            else:
+                self.fetched += 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for ``key``, or None if missing or expired."""
+        raise NotImplementedError
+
+    def get_stale(self, key: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """Return the body and validators of an expired entry that can be revalidated, or None."""
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a response body for ``ttl`` seconds."""
+        raise NotImplementedError
+
+    def set_validated(self, key: str, value: bytes, ttl: float, validators: Mapping[str, str]) -> None:
+        """Store a response body with its ``response_validators``; caches that cannot revalidate ignore them."""
+        self.set(key, value, ttl)
+
+    def refresh(self, key: str, ttl: float, validators: Optional[Mapping[str, str]] = None) -> None:
+        """Keep serving an entry for another ``ttl`` seconds after it was revalidated."""
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hit/miss and revalidated/fetched counters and the current number of entries."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'fetched': self.fetched,
+            'entries': len(self),
+        }
+
+
+class SQLiteCache(ResponseCache):
+    """Persistent response cache stored in an SQLite database.
+
+    Entries are evicted least recently used first once the stored bodies
+    exceed ``max_bytes``. Expired entries with an ``ETag`` or
+    ``Last-Modified`` validator are kept for revalidation until evicted; others
+    are dropped. The database may be shared by several processes.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = DEFAULT_CACHE_PATH,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttls: Optional[Mapping[str, Optional[float]]] = None,
+                 default_ttl: Optional[float] = DEFAULT_TTL):
+        """Initialize the cache, creating the database file if needed."""
+        super().__init__(ttls=ttls, default_ttl=default_ttl)
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires REAL NOT NULL,"
+            " accessed REAL NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        # Databases created before validators were stored lack their columns
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        for column in ('etag', 'last_modified'):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for ``key``, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires, etag IS NULL AND last_modified IS NULL FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is not None and row[1] <= now:
+                if row[2]:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is not None:
+                self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self._record(row is not None)
+        return bytes(row[0]) if row is not None else None
+
+    def get_stale(self, key: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """Return the body and validators of an expired entry that can be revalidated, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, etag, last_modified FROM responses WHERE key = ?"
+                " AND (etag IS NOT NULL OR last_modified IS NOT NULL)", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        validators = {name: value for name, value in (('etag', row[1]), ('last_modified', row[2])) if value}
+        return bytes(row[0]), validators
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a response body for ``ttl`` seconds, evicting old entries if needed."""
+        self.set_validated(key, value, ttl, {})
+
+    def set_validated(self, key: str, value: bytes, ttl: float, validators: Mapping[str, str]) -> None:
+        """Store a response body for ``ttl`` seconds with its validators, evicting old entries if needed."""
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires, accessed, etag, last_modified)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, value, len(value), now + ttl, now, validators.get('etag'), validators.get('last_modified'))
+            )
+            self._evict()
+
+    def refresh(self, key: str, ttl: float, validators: Optional[Mapping[str, str]] = None) -> None:
+        """Keep serving an entry for another ``ttl`` seconds, updating any validators sent with the 304."""
+        validators = validators or {}
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires = ?, accessed = ?,"
+                " etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                (now + ttl, now, validators.get('etag'), validators.get('last_modified'), key)
+            )
+
+    def _evict(self) -> None:
+        """Drop expired entries without validators, then least recently used ones over the byte budget."""
+        self._conn.execute("DELETE FROM responses WHERE expires <= ? AND etag IS NULL AND last_modified IS NULL",
+                           (time.time(),))
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def total_bytes(self) -> int:
+        """Return the combined size of all stored bodies."""
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hit/miss counters, entry count and byte usage."""
+        info = super().cache_info()
+        with self._lock:
+            info['bytes'] = self.total_bytes()
+        info['max_bytes'] = self.max_bytes
+        return info
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-process LRU cache.
+
+    Used as the client's ``memory_cache`` it memoizes decoded results of
+    ``call_endpoint`` so repeated lookups skip both the network and JSON
+    decoding; callers should treat returned objects as read-only. Not-found
+    (404) errors can be cached for ``negative_ttl`` seconds so lookups of
+    unknown taxa are not repeated. Entries are evicted least recently used
+    first beyond ``max_entries`` or, if given, ``max_bytes``.
+    """
+
+    def __init__(self, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+                 max_bytes: Optional[int] = None,
+                 ttls: Optional[Mapping[str, Optional[float]]] = None,
+                 default_ttl: Optional[float] = DEFAULT_MEMORY_TTL,
+                 negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL):
+        """Initialize the cache."""
+        super().__init__(ttls=ttls, default_ttl=default_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self.negative_hits = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for ``key``, or None if missing or expired.
+
+        A cached not-found error is returned as the exception instance.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= now:
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if isinstance(entry[0], Exception):
+                    self.negative_hits += 1
+        self._record(entry is not None)
+        return entry[0] if entry is not None else None
+
+    def set(self, key: str, value: Any, ttl: float, size: Optional[int] = None) -> None:
+        """Store a value for ``ttl`` seconds.
+
+        ``size`` is the value's weight against ``max_bytes``; it defaults to
+        the length of bytes values and 0 otherwise.
+        """
+        if size is None:
+            size = len(value) if isinstance(value, (bytes, bytearray)) else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + ttl)
+            self._bytes += size
+            self._evict()
+
+    def set_negative(self, key: str, error: Exception) -> None:
+        """Remember that ``key`` was not found, if negative caching is enabled."""
+        if self.negative_ttl:
+            self.set(key, error, self.negative_ttl)
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry; the caller must hold the lock."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond the limits; the caller must hold the lock."""
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hit/miss counters, entry count and byte usage."""
+        info = super().cache_info()
+        with self._lock:
+            info.update({
+                'negative_hits': self.negative_hits,
+                'evictions': self.evictions,
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            })
+        return info
@@ -1,15 +1,20 @@
 """
 CLI interface for IUCN Red List API Client.
+
+The endpoint registry is loaded only by commands that need it, and the HTTP
+stack only once a request is made, so help and ``--list-endpoints`` start fast.
 """
 
 import argparse
-import json
 import logging
 import sys
 import textwrap
 
-from .api_endpoints import API_ENDPOINTS
+from .cache import SQLiteCache
 from .client import IUCNRedListClient
+from .export import EXPORT_FORMATS, export_records
+from .jsoncodec import AUTO_BACKEND, AUTO_PREFERENCE, get_codec
+from .sync import DEFAULT_MIRROR_PATH, MirrorStore, kingdom_collections, sync_mirror
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -17,6 +22,7 @@ logger = logging.getLogger(__name__)
 
 def show_endpoint_help(endpoint_name: str) -> None:
     """Display help information for a specific endpoint."""
+    from .api_endpoints import API_ENDPOINTS
     endpoint_info = API_ENDPOINTS.get(endpoint_name)
     if endpoint_info:
         print(f'{endpoint_name}:\n')
@@ -70,7 +76,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
         'endpoint',
         nargs='?',
         type=str,
-        help='The endpoint name from the API (e.g., get_taxa_scientific_name).'
+        help='The endpoint name from the API (e.g., get_taxa_scientific_name), or "sync" to update the local mirror.'
     )
     parser.add_argument(
         'parameters',
@@ -81,6 +87,48 @@ def create_argument_parser() -> argparse.ArgumentParser:
         '--config',
         help='Configuration file path'
     )
+    parser.add_argument(
+        '--cache',
+        metavar='FILE',
+        help='Cache responses in the given SQLite file'
+    )
+    parser.add_argument(
+        '--export',
+        metavar='FILE',
+        help='Export every assessment of a paginated endpoint to a Parquet or Feather file'
+    )
+    parser.add_argument(
+        '--export-format',
+        choices=EXPORT_FORMATS,
+        help='Export file format (default: inferred from the file suffix)'
+    )
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=1,
+        help='Number of page requests to keep in flight when exporting or syncing (default: 1)'
+    )
+    parser.add_argument(
+        '--store',
+        metavar='FILE',
+        default=str(DEFAULT_MIRROR_PATH),
+        help='Mirror database used by the sync command (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--kingdom',
+        action='append',
+        help='Kingdom to mirror with the sync command; may be repeated (default: all kingdoms)'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Re-crawl every collection with the sync command instead of refreshing incrementally'
+    )
+    parser.add_argument(
+        '--json-backend',
+        choices=[AUTO_BACKEND, *AUTO_PREFERENCE],
+        help='JSON library used to decode responses and print results (default: fastest installed)'
+    )
     parser.add_argument(
         '--list-endpoints',
         action='store_true',
@@ -109,6 +157,7 @@ def main() -> None:
     
     # Check for endpoint-specific help before argparse processes arguments
     if len(original_argv) >= 3 and ('help' in original_argv):
+        from .api_endpoints import API_ENDPOINTS
         endpoint_name = None
         for arg in original_argv[1:]:
             if not arg.startswith('-') and arg != original_argv[0] and arg != 'help':
@@ -132,6 +181,7 @@ def main() -> None:
     )
     
     if args.list_endpoints:
+        from .api_endpoints import API_ENDPOINTS
         print("Available endpoints:")
         for name, info in API_ENDPOINTS.items():
             method = info.get('method', 'unknown').upper()
@@ -156,16 +206,42 @@ def main() -> None:
                 key, value = param.split('=', 1)
                 params[key] = value
     
-    # Create client and make request
-    client = IUCNRedListClient(config_file=args.config)
+    # Sync compares the live Red List version and pages, so it never reads cached responses
+    if args.cache and args.endpoint == 'sync':
+        logger.warning("--cache is ignored by the sync command, which always fetches fresh pages")
     
+    cache = store = None
     try:
+        # Create client and make request; a missing JSON backend is reported like any other error
+        codec = get_codec(args.json_backend)
+        if args.cache and args.endpoint != 'sync':
+            cache = SQLiteCache(args.cache)
+        client = IUCNRedListClient(config_file=args.config, cache=cache, json_backend=args.json_backend)
+        
+        if args.endpoint == 'sync':
+            store = MirrorStore(args.store)
+            collections = kingdom_collections(args.kingdom) if args.kingdom else None
+            stats = sync_mirror(client, store, collections=collections, full=args.full, prefetch=args.prefetch)
+            print(codec.dumps(stats, pretty=True))
+            return
+        
+        if args.export:
+            stats = export_records(client, args.endpoint, args.export, file_format=args.export_format,
+                                   prefetch=args.prefetch, **params)
+            print(f"Exported {stats['rows']} records to {stats['path']} ({stats['format']})")
+            return
+        
         result = client.call_endpoint(args.endpoint, **params)
-        print(json.dumps(result, indent=2))
+        print(codec.dumps(result, pretty=True))
         
     except Exception as e:
         logger.error(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if store is not None:
+            store.close()
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == '__main__':
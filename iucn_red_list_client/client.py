@@ -5,70 +5,139 @@ Environment Variable Priority:
 1. If ANY IUCN_* environment variables are set, ALL required ones must be present
 2. Environment variables completely bypass config files
 3. Falls back to config file only if NO environment variables are detected
+4. Keyword arguments given to the client, api_token included, override either source
 
 Supported IUCN_* Environment Variables:
 - IUCN_API_TOKEN (required): Bearer token for API authentication
 - IUCN_BASE_URL (optional): Base URL for the API (defaults to https://api.iucnredlist.org)
+- IUCN_RATE_LIMIT (optional): Client-side request rate limit in requests per second
+- IUCN_RATE_BURST (optional): Number of requests allowed back to back (defaults to 1)
+- IUCN_POOL_CONNECTIONS (optional): Number of per-host connection pools to cache (defaults to 10)
+- IUCN_POOL_MAXSIZE (optional): Connections kept alive per host (defaults to 10)
+- IUCN_POOL_BLOCK (optional): Wait for a free connection instead of opening extra ones (defaults to false)
+- IUCN_TIMEOUT (optional): Request timeout in seconds (defaults to 30)
+- IUCN_CONNECT_TIMEOUT (optional): Connection timeout in seconds (defaults to 10, or IUCN_TIMEOUT if lower)
+- IUCN_READ_TIMEOUT (optional): Read timeout in seconds (defaults to IUCN_TIMEOUT)
+- IUCN_JSON_BACKEND (optional): JSON backend: auto, orjson, msgspec or json (defaults to auto)
+- IUCN_ACCEPT_ENCODING (optional): Accept-Encoding header (defaults to every coding the client can decode)
+
+requests, urllib3 and truststore are imported, and truststore injected into
+``ssl``, when a client first needs its HTTP session, so importing the package
+and resolving endpoints stay cheap.
 """
 
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, Optional, TypedDict
-
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-import truststore
-truststore.inject_into_ssl()
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypedDict, Union
 
-from .api_endpoints import API_ENDPOINTS
+from .cache import MemoryCache, ResponseCache, conditional_headers, make_cache_key, response_validators
+from .dispatch import endpoint_spec
+from .endpoints import EndpointMethods
+from .jsoncodec import get_codec
+from .models import decode_model
+from .names import parse_name
+from .ratelimit import TokenBucket, parse_retry_after
+from .singleflight import SingleFlight
+from .streaming import StreamingRecordDecoder
+from .transfer import TransferMeter, negotiate_encodings
 
 # Constants
 REQUEST_TIMEOUT = 30
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
 DEFAULT_BASE_URL = "https://api.iucnredlist.org"
+PAGE_SIZE = 100
+RECORDS_KEY = 'assessments'
+DEFAULT_BULK_WORKERS = 8
+BULK_DEDUPE_SIZE = 10_000
+BULK_READ_AHEAD = 10_000
+STREAM_CHUNK_SIZE = 64 * 1024
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    import requests
+
+_truststore_lock = threading.Lock()
+_truststore_injected = False
+
+# A read timeout in seconds or a (connect, read) pair
+TimeoutSetting = Union[None, float, Tuple[float, float], List[float]]
+
 class EnvConfig(TypedDict, total=False):
     """Type definition for environment variable configuration."""
     api_token: str
     base_url: str
+    rate_limit: float
+    rate_burst: int
+    pool_connections: int
+    pool_maxsize: int
+    pool_block: bool
+    timeout: float
+    connect_timeout: float
+    read_timeout: float
+    json_backend: str
+    accept_encoding: str
+
+class PaginationStats(TypedDict):
+    """Counters describing the most recent paginated walk."""
+    pages_fetched: int
+    prefetch: int
+    in_flight: int
+    max_in_flight: int
+    fetch_seconds: float
+    elapsed_seconds: float
+    saved_seconds: float
+
+class BulkLookupResult(TypedDict):
+    """Outcome of a single species lookup in a bulk request."""
+    genus_name: Optional[str]
+    species_name: Optional[str]
+    infra_name: Optional[str]
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
 
-class IUCNRedListClient:
-    """IUCN Red List API Client."""
+def inject_truststore() -> None:
+    """Make ``ssl`` verify certificates against the system trust store, once per process."""
+    global _truststore_injected
+    with _truststore_lock:
+        if not _truststore_injected:
+            import truststore
+            truststore.inject_into_ssl()
+            _truststore_injected = True
+
+
+class ConfigMixin:
+    """Configuration loading shared by the sync and async clients."""
     
-    def __init__(self, config_file: Optional[str] = None, **kwargs):
-        """Initialize the client."""
-        self.session = requests.Session()
-        self._setup_retry_strategy()
-        
-        # Load configuration
-        self.config = self._load_config(config_file, **kwargs)
-        
-        # Set up authentication
-        if self.config.get('api_token'):
-            self.session.headers.update({
-                'Authorization': self.config['api_token']
-            })
+    def _load_config(self, config_file: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Load configuration from environment variables or config file, overridden by ``kwargs``.
         
-        self.base_url = self.config.get('base_url', DEFAULT_BASE_URL)
+        Explicit keyword arguments, ``api_token`` included, win over either source.
+        """
+        config = dict(self._load_base_config(config_file))
+        overrides = {key: value for key, value in kwargs.items() if value is not None}
+        if overrides:
+            logger.info("Applying provided configuration parameters")
+        config.update(overrides)
         
-    def _setup_retry_strategy(self) -> None:
-        """Set up retry strategy for requests."""
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        if not config.get('api_token'):
+            logger.warning("No configuration found. API token required for authenticated endpoints.")
+        return config
     
-    def _load_config(self, config_file: Optional[str] = None, **kwargs) -> Dict[str, Any]:
-        """Load configuration from environment variables or config file."""
+    def _load_base_config(self, config_file: Optional[str] = None) -> Dict[str, Any]:
+        """Load configuration from environment variables or, failing that, a config file."""
         
         # Check for environment variables first
         env_config = self._load_env_config()
@@ -76,11 +145,6 @@ class IUCNRedListClient:
             logger.info("Using environment variable configuration")
             return env_config
         
-        # Override with any kwargs
-        if kwargs:
-            logger.info("Using provided configuration parameters")
-            return kwargs
-            
         # Fall back to config file
         if config_file and Path(config_file).exists():
             logger.info(f"Loading configuration from {config_file}")
@@ -94,7 +158,6 @@ class IUCNRedListClient:
             with open(default_config, 'r') as f:
                 return json.load(f)
         
-        logger.warning("No configuration found. API token required for authenticated endpoints.")
         return {}
     
     def _load_env_config(self) -> Optional[EnvConfig]:
@@ -113,61 +176,624 @@ class IUCNRedListClient:
         # Optional variables
         if 'IUCN_BASE_URL' in env_vars:
             config['base_url'] = env_vars['IUCN_BASE_URL']
+        if 'IUCN_RATE_LIMIT' in env_vars:
+            config['rate_limit'] = float(env_vars['IUCN_RATE_LIMIT'])
+        if 'IUCN_RATE_BURST' in env_vars:
+            config['rate_burst'] = int(env_vars['IUCN_RATE_BURST'])
+        if 'IUCN_POOL_CONNECTIONS' in env_vars:
+            config['pool_connections'] = int(env_vars['IUCN_POOL_CONNECTIONS'])
+        if 'IUCN_POOL_MAXSIZE' in env_vars:
+            config['pool_maxsize'] = int(env_vars['IUCN_POOL_MAXSIZE'])
+        if 'IUCN_POOL_BLOCK' in env_vars:
+            config['pool_block'] = parse_bool(env_vars['IUCN_POOL_BLOCK'])
+        if 'IUCN_TIMEOUT' in env_vars:
+            config['timeout'] = float(env_vars['IUCN_TIMEOUT'])
+        if 'IUCN_CONNECT_TIMEOUT' in env_vars:
+            config['connect_timeout'] = float(env_vars['IUCN_CONNECT_TIMEOUT'])
+        if 'IUCN_READ_TIMEOUT' in env_vars:
+            config['read_timeout'] = float(env_vars['IUCN_READ_TIMEOUT'])
+        if 'IUCN_JSON_BACKEND' in env_vars:
+            config['json_backend'] = env_vars['IUCN_JSON_BACKEND']
+        if 'IUCN_ACCEPT_ENCODING' in env_vars:
+            config['accept_encoding'] = env_vars['IUCN_ACCEPT_ENCODING']
         
         return config
     
-    def _make_request(self, method: str, path: str, **kwargs) -> requests.Response:
+    def _rate_limiter_from_config(self) -> Optional[TokenBucket]:
+        """Create a token bucket from the ``rate_limit``/``rate_burst`` settings, if set."""
+        rate_limit = self.config.get('rate_limit')
+        if not rate_limit:
+            return None
+        return TokenBucket(float(rate_limit), burst=int(self.config.get('rate_burst', 1)))
+    
+    def _timeout_from_config(self) -> Tuple[float, float]:
+        """Return the default (connect, read) timeout from the configuration."""
+        timeout = float(self.config.get('timeout', REQUEST_TIMEOUT))
+        connect = float(self.config.get('connect_timeout', min(DEFAULT_CONNECT_TIMEOUT, timeout)))
+        read = float(self.config.get('read_timeout', timeout))
+        return connect, read
+    
+    def timeout_for(self, endpoint_name: str, timeout: TimeoutSetting = None,
+                    tags: Optional[Tuple[str, ...]] = None) -> Tuple[float, float]:
+        """Return the (connect, read) timeout for a call to an endpoint.
+        
+        An explicit ``timeout`` wins; otherwise the ``timeouts`` setting is
+        checked for the endpoint name, then its tags. A single number
+        overrides the read timeout and a ``[connect, read]`` pair both.
+        """
+        if timeout is None:
+            overrides = self.config.get('timeouts') or {}
+            if endpoint_name in overrides:
+                timeout = overrides[endpoint_name]
+            elif overrides:
+                if tags is None:
+                    tags = endpoint_spec(endpoint_name).tags
+                for tag in tags:
+                    if tag in overrides:
+                        timeout = overrides[tag]
+                        break
+        return merge_timeout(self.timeout, timeout)
+
+
+class IUCNRedListClient(ConfigMixin, EndpointMethods):
+    """IUCN Red List API Client.
+    
+    A single client may be shared by many threads. Requests go through one
+    ``requests.Session`` whose urllib3 connection pool is thread-safe,
+    configuration is not modified after construction, and the caches and
+    rate limiter synchronize internally. Size the pool (``pool_maxsize``)
+    to at least the number of threads issuing requests so connections are
+    reused rather than discarded; set ``pool_block`` to make extra threads
+    wait for a free connection instead of opening throwaway ones. Only
+    ``pagination_stats`` is per-walk state and reflects the latest walk.
+    """
+    
+    def __init__(self, config_file: Optional[str] = None, cache: Optional[ResponseCache] = None,
+                 memory_cache: Optional[MemoryCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 json_backend: Optional[str] = None,
+                 single_flight: Optional[SingleFlight] = None, **kwargs):
+        """Initialize the client.
+        
+        ``cache`` is an optional ResponseCache (such as SQLiteCache) consulted
+        before GET requests are sent. ``memory_cache`` is an optional
+        MemoryCache memoizing decoded results in front of it.
+        ``rate_limiter`` is a TokenBucket to share with other clients; when
+        omitted one is created from the ``rate_limit`` setting, if any.
+        ``json_backend`` names the JSON backend used to decode responses,
+        overriding the ``json_backend`` setting (default: fastest installed).
+        ``single_flight`` is a SingleFlight through which concurrent identical
+        GET calls share one request and its decoded result.
+        Wire and decoded response sizes are counted in ``transfer``.
+        """
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.single_flight = single_flight
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        
+        # Load configuration
+        self.config = self._load_config(config_file, **kwargs)
+        self.rate_limiter = rate_limiter or self._rate_limiter_from_config()
+        self.json_codec = get_codec(json_backend or self.config.get('json_backend'))
+        self.pool_maxsize = int(self.config.get('pool_maxsize', DEFAULT_POOL_MAXSIZE))
+        self.transfer = TransferMeter()
+        
+        self.base_url = self.config.get('base_url', DEFAULT_BASE_URL)
+        self.timeout = self._timeout_from_config()
+        self.pagination_stats: Optional[PaginationStats] = None
+        
+    @property
+    def session(self) -> "requests.Session":
+        """The HTTP session, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self) -> "requests.Session":
+        """Create the HTTP session, importing requests and injecting truststore."""
+        import requests
+        inject_truststore()
+        session = requests.Session()
+        self._setup_retry_strategy(session)
+        
+        # Set up authentication
+        if self.config.get('api_token'):
+            session.headers.update({
+                'Authorization': self.config['api_token']
+            })
+        
+        # Advertise the most compact codings urllib3 can decode, and count what they save
+        session.headers['Accept-Encoding'] = (
+            self.config.get('accept_encoding') or negotiate_encodings(session.headers['Accept-Encoding'])
+        )
+        session.hooks['response'].append(self._record_transfer)
+        return session
+    
+    def _setup_retry_strategy(self, session: "requests.Session") -> None:
+        """Set up retry strategy and connection pool for requests.
+        
+        With a rate limiter, 429 responses, including those carrying
+        ``Retry-After`` (which urllib3 would otherwise retry itself), are left
+        to ``_make_request`` so the limiter can slow down before retrying;
+        other retried statuses then back off without honouring the header.
+        """
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        status_forcelist = [status for status in RETRY_STATUS_FORCELIST
+                            if status != 429 or self.rate_limiter is None]
+        retry_strategy = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=status_forcelist,
+            respect_retry_after_header=self.rate_limiter is None,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=int(self.config.get('pool_connections', DEFAULT_POOL_CONNECTIONS)),
+            pool_maxsize=self.pool_maxsize,
+            pool_block=parse_bool(self.config.get('pool_block', False)),
+            max_retries=retry_strategy,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    
+    def _check_pool_capacity(self, workers: int) -> None:
+        """Warn when more threads will share the session than it keeps connections for."""
+        if workers > self.pool_maxsize:
+            logger.warning(
+                f"{workers} concurrent workers exceed pool_maxsize={self.pool_maxsize}; "
+                f"connections will be discarded and re-opened. Raise pool_maxsize to reuse them."
+            )
+    
+    def _record_transfer(self, response: "requests.Response", *args, stream: bool = False, **kwargs) -> None:
+        """Response hook counting a buffered body; streamed bodies are counted once consumed."""
+        if not stream:
+            self._meter_response(response, len(response.content))
+    
+    def _meter_response(self, response: "requests.Response", decoded_bytes: int) -> None:
+        """Count the wire and decoded size of a consumed response body."""
+        self.transfer.record(response.url, response.headers.get('Content-Encoding', 'identity'),
+                             response.raw.tell(), decoded_bytes)
+    
+    def _make_request(self, method: str, path: str, **kwargs) -> "requests.Response":
         """Make HTTP request to API."""
+        import requests
         url = f"{self.base_url.rstrip('/')}{path}"
+        kwargs.setdefault('timeout', self.timeout)
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                timeout=REQUEST_TIMEOUT,
-                **kwargs
-            )
-            response.raise_for_status()
-            return response
+            throttled_attempts = 0
+            while True:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    **kwargs
+                )
+                if self.rate_limiter is not None:
+                    if response.status_code == 429:
+                        self.rate_limiter.throttled(parse_retry_after(response.headers.get('Retry-After')))
+                        if throttled_attempts < RETRY_TOTAL:
+                            throttled_attempts += 1
+                            logger.info(f"Throttled on {path}, retrying at {self.rate_limiter.rate:.2f} req/s")
+                            continue
+                    else:
+                        self.rate_limiter.succeeded()
+                response.raise_for_status()
+                return response
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed: {e}")
             raise
     
-    def call_endpoint(self, endpoint_name: str, **kwargs) -> Dict[str, Any]:
-        """Call a specific API endpoint."""
-        if endpoint_name not in API_ENDPOINTS:
-            raise ValueError(f"Unknown endpoint: {endpoint_name}")
-        
-        endpoint_info = API_ENDPOINTS[endpoint_name]
-        path = endpoint_info['path']
-        method = endpoint_info['method']
-        
-        # Handle path parameters
-        path_params = {}
-        for param_name in endpoint_info.get('path_params', []):
-            if param_name in kwargs:
-                path_params[param_name] = kwargs.pop(param_name)
-            else:
-                raise ValueError(f"Missing required path parameter: {param_name}")
-        
-        # Format path with parameters
-        if path_params:
-            path = path.format(**path_params)
-        
-        # Handle query parameters
-        query_params = {}
-        for param_info in endpoint_info.get('query_params', []):
-            param_name = param_info['name']
-            if param_name in kwargs:
-                query_params[param_name] = kwargs.pop(param_name)
-            elif param_info.get('required', False):
-                raise ValueError(f"Missing required query parameter: {param_name}")
+    def call_endpoint(self, endpoint_name: str, timeout: TimeoutSetting = None, stream: bool = False,
+                      model: Optional[type] = None, **kwargs) -> Any:
+        """Call a specific API endpoint.
+        
+        ``timeout`` overrides the configured timeout for this call: a number
+        sets the read timeout and a ``(connect, read)`` pair sets both.
+        With ``stream=True`` the response is not buffered: an iterator is
+        returned that decodes the assessment records one at a time as the
+        body arrives. Streamed calls bypass the response caches.
+        ``model`` is a type from ``iucn_red_list_client.models`` to decode the
+        response into instead of nested dicts.
+        """
+        spec = endpoint_spec(endpoint_name)
+        method, path, query_params = spec.resolve(kwargs)
+        return self._call_resolved(endpoint_name, spec.tags, method, path, query_params, timeout, stream, model)
+    
+    def _call_resolved(self, endpoint_name: str, tags: Tuple[str, ...], method: str, path: str,
+                       query_params: Dict[str, Any], timeout: TimeoutSetting = None, stream: bool = False,
+                       model: Optional[type] = None) -> Any:
+        """Make an endpoint call whose path and query parameters are already resolved."""
+        if stream and model is not None:
+            raise ValueError("stream cannot be combined with model")
+        
+        if stream:
+            request_kwargs = {'timeout': self.timeout_for(endpoint_name, timeout, tags), 'stream': True}
+            if query_params:
+                request_kwargs['params'] = query_params
+            return self._stream_records(self._make_request(method, path, **request_kwargs))
+        
+        cache_key = memory_key = None
+        if method == 'GET' and (self.cache is not None or self.memory_cache is not None
+                                or self.single_flight is not None):
+            cache_key = make_cache_key(method, f"{self.base_url.rstrip('/')}{path}", query_params)
+            # Decoded results are memoized separately for each model
+            memory_key = cache_key if model is None else f"{cache_key} as {model.__name__}"
+        
+        # Serve from the in-memory cache when possible
+        memory_ttl = None
+        if cache_key is not None and self.memory_cache is not None:
+            memory_ttl = self.memory_cache.ttl_for(endpoint_name, tags)
+            if memory_ttl:
+                cached = self.memory_cache.get(memory_key)
+                if isinstance(cached, Exception):
+                    raise fresh_http_error(cached)
+                if cached is not None:
+                    return cached
+        
+        # Serve from the response cache when possible
+        ttl = None
+        if cache_key is not None and self.cache is not None:
+            ttl = self.cache.ttl_for(endpoint_name, tags)
+            if ttl:
+                body = self.cache.get(cache_key)
+                if body is not None:
+                    logger.debug(f"Cache hit for {cache_key}")
+                    result = self._decode(body, model)
+                    if memory_ttl:
+                        self.memory_cache.set(memory_key, result, memory_ttl, size=len(body))
+                    return result
         
         # Make the request
-        request_kwargs = {}
+        request_kwargs = {'timeout': self.timeout_for(endpoint_name, timeout, tags)}
         if query_params:
             request_kwargs['params'] = query_params
         
-        response = self._make_request(method, path, **request_kwargs)
-        return response.json()
+        def fetch() -> Any:
+            # An expired response with validators is revalidated with a conditional GET
+            stale = self.cache.get_stale(cache_key) if ttl else None
+            kwargs = dict(request_kwargs)
+            if stale is not None:
+                kwargs['headers'] = conditional_headers(stale[1])
+            import requests
+            try:
+                response = self._make_request(method, path, **kwargs)
+            except requests.HTTPError as e:
+                if memory_ttl and e.response is not None and e.response.status_code == 404:
+                    self.memory_cache.set_negative(memory_key, fresh_http_error(e))
+                raise
+            
+            body = response.content
+            if ttl:
+                not_modified = stale is not None and response.status_code == 304
+                self.cache.record_fetch(not_modified)
+                if not_modified:
+                    logger.debug(f"Revalidated {cache_key}")
+                    body = stale[0]
+                    self.cache.refresh(cache_key, ttl, response_validators(response.headers))
+                else:
+                    self.cache.set_validated(cache_key, body, ttl, response_validators(response.headers))
+            result = self._decode(body, model)
+            if memory_ttl:
+                self.memory_cache.set(memory_key, result, memory_ttl, size=len(body))
+            return result
+        
+        # Concurrent identical calls share one request; the first caller's timeout applies
+        if memory_key is not None and self.single_flight is not None:
+            return self.single_flight.do(memory_key, fetch)
+        return fetch()
+    
+    def _decode(self, body: bytes, model: Optional[type] = None) -> Any:
+        """Decode a response body into plain JSON values or ``model``."""
+        if model is not None:
+            return decode_model(body, model, self.json_codec)
+        return self.json_codec.loads(body)
+    
+    def _stream_records(self, response: "requests.Response") -> Iterator[Dict[str, Any]]:
+        """Yield assessment records from a streamed response, closing it when done."""
+        decoder = StreamingRecordDecoder(RECORDS_KEY)
+        decoded_bytes = 0
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                decoded_bytes += len(chunk)
+                yield from decoder.feed(chunk)
+            yield from decoder.close()
+        finally:
+            self._meter_response(response, decoded_bytes)
+            response.close()
+    
+    def cache_info(self) -> Dict[str, Dict[str, Any]]:
+        """Return counters for each configured cache layer."""
+        info = {}
+        if self.memory_cache is not None:
+            info['memory_cache'] = self.memory_cache.cache_info()
+        if self.cache is not None:
+            info['cache'] = self.cache.cache_info()
+        return info
+    
+    def iter_pages(self, endpoint_name: str, prefetch: int = 1, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield each page of a paginated endpoint in turn.
+        
+        Pages are requested starting at ``page`` (default 1) and iteration
+        stops after the first short or empty page. With ``prefetch`` greater
+        than one, up to that many page requests are kept in flight on a
+        bounded thread pool sharing this client's session. The window starts
+        at one page and doubles with each full page, so short collections cost
+        no extra requests and at most ``prefetch - 1`` are ever issued past
+        the last page. Pages are always yielded in order. Counters for the
+        walk are kept in ``pagination_stats``.
+        """
+        if not is_paginated(endpoint_name):
+            raise ValueError(f"Endpoint is not paginated: {endpoint_name}")
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        
+        page = int(kwargs.pop('page', 1))
+        stats: PaginationStats = {
+            'pages_fetched': 0,
+            'prefetch': prefetch,
+            'in_flight': 0,
+            'max_in_flight': 0,
+            'fetch_seconds': 0.0,
+            'elapsed_seconds': 0.0,
+            'saved_seconds': 0.0,
+        }
+        self.pagination_stats = stats
+        lock = threading.Lock()
+        started = time.perf_counter()
+        
+        def fetch(page_number: int) -> Dict[str, Any]:
+            with lock:
+                stats['in_flight'] += 1
+                stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+            fetch_started = time.perf_counter()
+            try:
+                return self.call_endpoint(endpoint_name, page=page_number, **kwargs)
+            finally:
+                with lock:
+                    stats['in_flight'] -= 1
+                    stats['pages_fetched'] += 1
+                    stats['fetch_seconds'] += time.perf_counter() - fetch_started
+        
+        executor = None
+        window = 1
+        pending: Deque[Future] = deque()
+        try:
+            if prefetch > 1:
+                self._check_pool_capacity(prefetch)
+                executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='iucn-prefetch')
+            while True:
+                if executor is None:
+                    result = fetch(page)
+                else:
+                    while len(pending) < window:
+                        pending.append(executor.submit(fetch, page))
+                        page += 1
+                    result = pending.popleft().result()
+                count = len(page_records(result))
+                yield result
+                if count < PAGE_SIZE:
+                    return
+                if executor is None:
+                    page += 1
+                else:
+                    window = min(prefetch, window * 2)
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+            with lock:
+                stats['elapsed_seconds'] = time.perf_counter() - started
+                stats['saved_seconds'] = max(0.0, stats['fetch_seconds'] - stats['elapsed_seconds'])
+    
+    def iter_records(self, endpoint_name: str, prefetch: int = 1, stream: bool = False,
+                     **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield every assessment record of a paginated endpoint.
+        
+        With ``stream=True`` each page is decoded incrementally (see
+        ``call_endpoint``), so only one record is held at a time; streaming
+        fetches pages one after another and cannot be combined with
+        ``prefetch``.
+        """
+        if not stream:
+            for result in self.iter_pages(endpoint_name, prefetch=prefetch, **kwargs):
+                yield from page_records(result)
+            return
+        
+        if not is_paginated(endpoint_name):
+            raise ValueError(f"Endpoint is not paginated: {endpoint_name}")
+        if prefetch != 1:
+            raise ValueError("stream cannot be combined with prefetch")
+        page = int(kwargs.pop('page', 1))
+        while True:
+            count = 0
+            for record in self.call_endpoint(endpoint_name, page=page, stream=True, **kwargs):
+                count += 1
+                yield record
+            if count < PAGE_SIZE:
+                return
+            page += 1
+    
+    def lookup_species_bulk(self, names: Iterable[Union[str, Tuple[str, ...]]],
+                            max_workers: int = DEFAULT_BULK_WORKERS,
+                            rate_limit: Optional[float] = None) -> List[BulkLookupResult]:
+        """Look up many species with ``get_taxa_scientific_name`` in parallel.
+        
+        ``names`` may contain ``"Genus species"`` strings, ``(genus, species)``
+        pairs or ``(genus, species, infra_name)`` triples; infraspecific names
+        are looked up as such. Duplicate names (compared case-insensitively)
+        are fetched once, up to ``max_workers`` requests run concurrently and
+        ``rate_limit`` caps the request rate in requests per second. One
+        result is returned per input, in input order; failures are reported
+        in its ``error`` field instead of being raised.
+        """
+        names = list(names)
+        results: List[Optional[BulkLookupResult]] = [None] * len(names)
+        for index, result in self.iter_species_bulk(names, max_workers=max_workers, rate_limit=rate_limit,
+                                                    dedupe_size=None, read_ahead=None):
+            results[index] = result
+        return results
+    
+    def iter_species_bulk(self, names: Iterable[Union[str, Tuple[str, ...]]],
+                          max_workers: int = DEFAULT_BULK_WORKERS,
+                          rate_limit: Optional[float] = None,
+                          dedupe_size: Optional[int] = BULK_DEDUPE_SIZE,
+                          read_ahead: Optional[int] = BULK_READ_AHEAD) -> Iterator[Tuple[int, BulkLookupResult]]:
+        """Yield ``(index, result)`` for each name as soon as its lookup completes.
+        
+        Takes the same arguments as ``lookup_species_bulk``, but ``names`` is
+        consumed lazily and at most ``2 * max_workers`` lookups are queued at a
+        time. No name is read more than ``read_ahead`` positions (None: no
+        limit) past the oldest one still waiting for its lookup, duplicates
+        and cached names included, so a consumer restoring input order holds
+        at most that many results. Outcomes are kept for deduplication only
+        for the last ``dedupe_size`` distinct names (None: all), so
+        arbitrarily long inputs run in bounded memory. Results arrive in
+        completion order; ``index`` is the position of the name in ``names``.
+        Closing the iterator early cancels the queued lookups.
+        """
+        limiter = TokenBucket(rate_limit) if rate_limit else None
+        
+        def lookup(name: Tuple[str, str, Optional[str]]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+            if limiter is not None:
+                limiter.acquire()
+            genus, species, infra = name
+            params = {'infra_name': infra} if infra else {}
+            try:
+                result = self.call_endpoint('get_taxa_scientific_name',
+                                            genus_name=genus, species_name=species, **params)
+                return result, None
+            except Exception as e:
+                return None, str(e)
+        
+        def bulk_result(name: Tuple[Optional[str], Optional[str], Optional[str]],
+                        outcome: Tuple[Optional[Dict[str, Any]], Optional[str]]) -> BulkLookupResult:
+            return {'genus_name': name[0], 'species_name': name[1], 'infra_name': name[2],
+                    'result': outcome[0], 'error': outcome[1]}
+        
+        # Outcomes of finished lookups, and the inputs waiting on each running one
+        outcomes: OrderedDict[Tuple[str, str, str], Tuple[Optional[Dict[str, Any]], Optional[str]]] = OrderedDict()
+        waiting: Dict[Tuple[str, str, str], List[Tuple[int, Tuple[str, str, Optional[str]]]]] = {}
+        pending: Dict[Future, Tuple[str, str, str]] = {}
+        max_queued = 2 * max_workers
+        # Indexes of inputs waiting on a lookup, in input order, and those since finished
+        outstanding: Deque[int] = deque()
+        finished: Set[int] = set()
+        
+        def drain(return_when: str) -> Iterator[Tuple[int, BulkLookupResult]]:
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                key = pending.pop(future)
+                outcome = outcomes[key] = future.result()
+                if dedupe_size is not None and len(outcomes) > dedupe_size:
+                    outcomes.popitem(last=False)
+                for index, name in waiting.pop(key):
+                    finished.add(index)
+                    yield index, bulk_result(name, outcome)
+        
+        def oldest_outstanding() -> Optional[int]:
+            while outstanding and outstanding[0] in finished:
+                finished.remove(outstanding.popleft())
+            return outstanding[0] if outstanding else None
+        
+        self._check_pool_capacity(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='iucn-bulk')
+        try:
+            for index, name in enumerate(names):
+                if read_ahead is not None:
+                    while pending and index - oldest_outstanding() >= read_ahead:
+                        yield from drain(FIRST_COMPLETED)
+                name = split_species_name(name)
+                genus, species, infra = name
+                if not genus or not species:
+                    yield index, bulk_result(name, (None, "Invalid species name"))
+                    continue
+                key = (genus.lower(), species.lower(), (infra or '').lower())
+                if key in outcomes:
+                    outcomes.move_to_end(key)
+                    yield index, bulk_result(name, outcomes[key])
+                    continue
+                outstanding.append(index)
+                if key in waiting:
+                    waiting[key].append((index, name))
+                    continue
+                waiting[key] = [(index, name)]
+                pending[executor.submit(lookup, name)] = key
+                if len(pending) >= max_queued:
+                    yield from drain(FIRST_COMPLETED)
+            while pending:
+                yield from drain(FIRST_COMPLETED)
+        finally:
+            # Explicit cancellation; shutdown(cancel_futures=True) needs Python 3.9
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+def resolve_endpoint(endpoint_name: str, kwargs: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+    """Resolve an endpoint call into its HTTP method, path and query parameters.
+    
+    Parameters consumed by the endpoint are popped from ``kwargs``; query
+    values are coerced to their declared types (see ``dispatch``).
+    """
+    return endpoint_spec(endpoint_name).resolve(kwargs)
+
+
+def fresh_http_error(error: "requests.HTTPError") -> "requests.HTTPError":
+    """Return a traceback-free copy of an HTTP error, as cached and as raised on each cache hit.
+    
+    Raising one shared instance would grow its traceback on every hit and
+    keep each caller's frames alive.
+    """
+    return type(error)(*error.args, response=error.response, request=error.request)
+
+
+def merge_timeout(default: Tuple[float, float], timeout: TimeoutSetting) -> Tuple[float, float]:
+    """Apply a timeout override to a default (connect, read) pair."""
+    if timeout is None:
+        return default
+    if isinstance(timeout, (tuple, list)):
+        connect, read = timeout
+        return float(connect), float(read)
+    return default[0], float(timeout)
+
+
+def parse_bool(value: Any) -> bool:
+    """Interpret a configuration value such as ``"true"`` or ``"0"`` as a boolean."""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def split_species_name(name: Union[str, Tuple[str, ...]]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Split a ``"Genus species [infra]"`` string, pair or triple into genus, species and infra name.
+    
+    Strings are parsed with ``names.parse_name``, so authorities, hybrid
+    signs, subgenera and rank words are dropped but the infraspecific name
+    is kept.
+    """
+    if isinstance(name, str):
+        parsed = parse_name(name)
+        return parsed['genus_name'], parsed['species_name'], parsed['infra_name']
+    parts = [str(part).strip() if part is not None else '' for part in name]
+    parts += [''] * (3 - len(parts))
+    return parts[0] or None, parts[1] or None, parts[2] or None
+
+
+def is_paginated(endpoint_name: str) -> bool:
+    """Return True if the endpoint accepts a ``page`` query parameter."""
+    return endpoint_spec(endpoint_name).paginated
+
+
+def page_records(result: Any) -> List[Any]:
+    """Return the assessment records contained in a page of results or page model."""
+    if isinstance(result, dict):
+        return result.get(RECORDS_KEY) or []
+    return getattr(result, RECORDS_KEY, None) or []
@@ -0,0 +1,137 @@
+"""
+Precompiled endpoint dispatch for the IUCN Red List API client.
+
+Each entry of ``API_ENDPOINTS`` is compiled, on first use, into an
+EndpointSpec holding what resolving a call needs: the path template split
+into literal segments and parameter names, frozensets of the parameter
+names, the required query parameters and a coercer per typed query
+parameter. Resolving a call then costs a few dict operations instead of a
+walk over the parameter lists and a ``str.format`` of the path.
+
+Query values are coerced to their declared type: integers from numeric
+strings, and booleans (``True``, ``"yes"``, ``"1"``...) to ``"true"`` or
+``"false"``, so that equal calls made from Python and from the CLI send, and
+cache, identical requests. The coercers are shared with the generated
+methods of ``endpoints``.
+"""
+
+import re
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+# Constants
+TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+FALSE_VALUES = frozenset({'0', 'false', 'no', 'off'})
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+def coerce_integer(name: str, value: Any) -> int:
+    """Return a query value as an integer."""
+    if type(value) is int:
+        return value
+    if isinstance(value, bool):
+        raise ValueError(f"Query parameter {name} must be an integer, not {value!r}")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Query parameter {name} must be an integer, not {value!r}") from None
+
+
+def coerce_boolean(name: str, value: Any) -> str:
+    """Return a query value as ``"true"`` or ``"false"``."""
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return 'true'
+    if text in FALSE_VALUES:
+        return 'false'
+    raise ValueError(f"Query parameter {name} must be a boolean, not {value!r}")
+
+
+COERCERS: Dict[str, Callable[[str, Any], Any]] = {
+    'integer': coerce_integer,
+    'boolean': coerce_boolean,
+}
+
+
+class EndpointSpec:
+    """An endpoint compiled for resolving calls."""
+
+    __slots__ = ('name', 'method', 'tags', 'path', 'path_segments', 'path_params', 'path_param_names',
+                 'query_params', 'query_param_names', 'required_query_params', 'coercers', 'paginated',
+                 '_query_coercers')
+
+    def __init__(self, name: str, endpoint_info: Dict[str, Any]):
+        """Compile an ``API_ENDPOINTS`` entry."""
+        self.name = name
+        self.method: str = endpoint_info['method']
+        self.tags: Tuple[str, ...] = tuple(endpoint_info.get('tags', ()))
+        self.path: str = endpoint_info['path']
+        # Literal segments alternate with parameter names: "/taxa/sis/{sis_id}" -> ("/taxa/sis/", "sis_id", "")
+        self.path_segments: Tuple[str, ...] = tuple(_PATH_PARAM.split(endpoint_info['path']))
+        self.path_params: Tuple[str, ...] = tuple(endpoint_info.get('path_params', ()))
+        self.path_param_names: FrozenSet[str] = frozenset(self.path_params)
+        query_params = endpoint_info.get('query_params', ())
+        self.query_params: Tuple[str, ...] = tuple(param['name'] for param in query_params)
+        self.query_param_names: FrozenSet[str] = frozenset(self.query_params)
+        self.required_query_params: Tuple[str, ...] = tuple(
+            param['name'] for param in query_params if param.get('required', False))
+        self.coercers: Dict[str, Callable[[str, Any], Any]] = {
+            param['name']: COERCERS[param['type']] for param in query_params if param.get('type') in COERCERS
+        }
+        self.paginated = 'page' in self.query_param_names
+        # Query parameters in declaration order, each with its coercer or None
+        self._query_coercers: Tuple[Tuple[str, Optional[Callable[[str, Any], Any]]], ...] = tuple(
+            (name, self.coercers.get(name)) for name in self.query_params)
+
+    def resolve(self, kwargs: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+        """Resolve a call into its HTTP method, path and query parameters.
+
+        Parameters consumed by the endpoint are popped from ``kwargs``.
+        """
+        path_params = self.path_params
+        if not path_params:
+            path = self.path
+        elif len(path_params) == 1:
+            prefix, name, suffix = self.path_segments
+            if name not in kwargs:
+                raise ValueError(f"Missing required path parameter: {name}")
+            path = prefix + str(kwargs.pop(name)) + suffix
+        else:
+            try:
+                values = [str(kwargs.pop(name)) for name in path_params]
+            except KeyError as e:
+                raise ValueError(f"Missing required path parameter: {e.args[0]}") from None
+            parts = list(self.path_segments)
+            parts[1::2] = values
+            path = ''.join(parts)
+
+        query_params = {}
+        if kwargs:
+            for name, coerce in self._query_coercers:
+                if name in kwargs:
+                    value = kwargs.pop(name)
+                    query_params[name] = value if coerce is None else coerce(name, value)
+        for name in self.required_query_params:
+            if name not in query_params:
+                raise ValueError(f"Missing required query parameter: {name}")
+        return self.method, path, query_params
+
+
+_SPECS: Dict[str, EndpointSpec] = {}
+
+
+def endpoint_spec(endpoint_name: str) -> EndpointSpec:
+    """Return the compiled spec of an endpoint, compiling it on first use."""
+    spec = _SPECS.get(endpoint_name)
+    if spec is None:
+        # The registry is only loaded once a call is dispatched by name
+        from .api_endpoints import API_ENDPOINTS
+        endpoint_info: Optional[Dict[str, Any]] = API_ENDPOINTS.get(endpoint_name)
+        if endpoint_info is None:
+            raise ValueError(f"Unknown endpoint: {endpoint_name}")
+        spec = _SPECS[endpoint_name] = EndpointSpec(endpoint_name, endpoint_info)
+    return spec
@@ -0,0 +1,1971 @@
+"""
+Typed per-endpoint methods for the IUCN Red List API clients.
+
+Generated from API_ENDPOINTS by tools/generate_methods.py; do not edit.
+
+EndpointMethods and AsyncEndpointMethods are mixed into IUCNRedListClient
+and AsyncIUCNRedListClient. Each method coerces its query parameters up
+front and calls the client with its path and tags inlined, skipping the
+endpoint registry, which this module does not import.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from .dispatch import coerce_boolean, coerce_integer
+
+if TYPE_CHECKING:
+    from .client import TimeoutSetting
+
+# Path parameters are formatted into the URL with str()
+PathValue = Union[str, int]
+
+
+class EndpointMethods:
+    """One method per API endpoint, for IUCNRedListClient."""
+
+    def get_assessment_assessment_id(
+        self,
+        assessment_id: PathValue,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Retrieves an assessment."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_assessment_assessment_id', ('Assessment',), 'GET', f"/api/v4/assessment/{assessment_id}",
+            query_params, timeout, stream, model)
+
+    def get_biogeographical_realms(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of biogeographic realm codes."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_biogeographical_realms', ('Biogeographical Realms',), 'GET', "/api/v4/biogeographical_realms/",
+            query_params, timeout, stream, model)
+
+    def get_biogeographical_realms_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a biogeographical realm code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_biogeographical_realms_code', ('Biogeographical Realms',), 'GET', f"/api/v4/biogeographical_realms/{code}",
+            query_params, timeout, stream, model)
+
+    def get_comprehensive_groups(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of comprehensive groups."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_comprehensive_groups', ('Comprehensive Groups',), 'GET', "/api/v4/comprehensive_groups/",
+            query_params, timeout, stream, model)
+
+    def get_comprehensive_groups_name(
+        self,
+        name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a comprehensive group name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_comprehensive_groups_name', ('Comprehensive Groups',), 'GET', f"/api/v4/comprehensive_groups/{name}",
+            query_params, timeout, stream, model)
+
+    def get_conservation_actions(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a list of conservation actions."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_conservation_actions', ('Conservation Actions',), 'GET', "/api/v4/conservation_actions/",
+            query_params, timeout, stream, model)
+
+    def get_conservation_actions_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a collection of assessments for a conservation action code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_conservation_actions_code', ('Conservation Actions',), 'GET', f"/api/v4/conservation_actions/{code}",
+            query_params, timeout, stream, model)
+
+    def get_countries(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of countries by ISO alpha-2 code."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_countries', ('Countries',), 'GET', "/api/v4/countries/",
+            query_params, timeout, stream, model)
+
+    def get_countries_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given country ISO alpha-2 code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_countries_code', ('Countries',), 'GET', f"/api/v4/countries/{code}",
+            query_params, timeout, stream, model)
+
+    def get_faos(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of FAOs."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_faos', ('FAOs',), 'GET', "/api/v4/faos/",
+            query_params, timeout, stream, model)
+
+    def get_faos_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for an FAO code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_faos_code', ('FAOs',), 'GET', f"/api/v4/faos/{code}",
+            query_params, timeout, stream, model)
+
+    def get_green_status_all(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all Green Status assessments."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_green_status_all', ('Green Status',), 'GET', "/api/v4/green_status/all",
+            query_params, timeout, stream, model)
+
+    def get_growth_forms(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of growth forms."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_growth_forms', ('Growth Forms',), 'GET', "/api/v4/growth_forms/",
+            query_params, timeout, stream, model)
+
+    def get_growth_forms_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given growth form code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_growth_forms_code', ('Growth Forms',), 'GET', f"/api/v4/growth_forms/{code}",
+            query_params, timeout, stream, model)
+
+    def get_habitats(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of habitat codes."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_habitats', ('Habitats',), 'GET', "/api/v4/habitats/",
+            query_params, timeout, stream, model)
+
+    def get_habitats_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given habitat code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_habitats_code', ('Habitats',), 'GET', f"/api/v4/habitats/{code}",
+            query_params, timeout, stream, model)
+
+    def get_information_api_version(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns the current version number of the IUCN Red List of Threatened Species API."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_information_api_version', ('Information',), 'GET', "/api/v4/information/api_version",
+            query_params, timeout, stream, model)
+
+    def get_information_red_list_version(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns the current IUCN Red List of Threatened Species version."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_information_red_list_version', ('Information',), 'GET', "/api/v4/information/red_list_version",
+            query_params, timeout, stream, model)
+
+    def get_population_trends(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of population trends."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_population_trends', ('Population Trends',), 'GET', "/api/v4/population_trends/",
+            query_params, timeout, stream, model)
+
+    def get_population_trends_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given population trend code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_population_trends_code', ('Population Trends',), 'GET', f"/api/v4/population_trends/{code}",
+            query_params, timeout, stream, model)
+
+    def get_red_list_categories(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of Red List categories."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_red_list_categories', ('Red List Categories',), 'GET', "/api/v4/red_list_categories/",
+            query_params, timeout, stream, model)
+
+    def get_red_list_categories_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given Red List category code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_red_list_categories_code', ('Red List Categories',), 'GET', f"/api/v4/red_list_categories/{code}",
+            query_params, timeout, stream, model)
+
+    def get_research(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of habitat codes."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_research', ('Research',), 'GET', "/api/v4/research/",
+            query_params, timeout, stream, model)
+
+    def get_research_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given research code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_research_code', ('Research',), 'GET', f"/api/v4/research/{code}",
+            query_params, timeout, stream, model)
+
+    def get_scopes(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a list of scopes."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_scopes', ('Scopes',), 'GET', "/api/v4/scopes/",
+            query_params, timeout, stream, model)
+
+    def get_scopes_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given scope code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        return self._call_resolved(
+            'get_scopes_code', ('Scopes',), 'GET', f"/api/v4/scopes/{code}",
+            query_params, timeout, stream, model)
+
+    def get_statistics_count(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Return count of the number of species with assessments."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_statistics_count', ('Statistics',), 'GET', "/api/v4/statistics/count",
+            query_params, timeout, stream, model)
+
+    def get_stresses(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of stressors."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_stresses', ('Stresses',), 'GET', "/api/v4/stresses/",
+            query_params, timeout, stream, model)
+
+    def get_stresses_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a collection of assessments for a given stress code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_stresses_code', ('Stresses',), 'GET', f"/api/v4/stresses/{code}",
+            query_params, timeout, stream, model)
+
+    def get_systems(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of systems."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_systems', ('Systems',), 'GET', "/api/v4/systems/",
+            query_params, timeout, stream, model)
+
+    def get_systems_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given system code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_systems_code', ('Systems',), 'GET', f"/api/v4/systems/{code}",
+            query_params, timeout, stream, model)
+
+    def get_taxa_class(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all class names."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_class', ('Taxa',), 'GET', "/api/v4/taxa/class/",
+            query_params, timeout, stream, model)
+
+    def get_taxa_class_class_name(
+        self,
+        class_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given class_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_taxa_class_class_name', ('Taxa',), 'GET', f"/api/v4/taxa/class/{class_name}",
+            query_params, timeout, stream, model)
+
+    def get_taxa_family(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all family names."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_family', ('Taxa',), 'GET', "/api/v4/taxa/family/",
+            query_params, timeout, stream, model)
+
+    def get_taxa_family_family_name(
+        self,
+        family_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given family_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_taxa_family_family_name', ('Taxa',), 'GET', f"/api/v4/taxa/family/{family_name}",
+            query_params, timeout, stream, model)
+
+    def get_taxa_kingdom(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all kingdom names."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_kingdom', ('Taxa',), 'GET', "/api/v4/taxa/kingdom/",
+            query_params, timeout, stream, model)
+
+    def get_taxa_kingdom_kingdom_name(
+        self,
+        kingdom_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given kingdom_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_taxa_kingdom_kingdom_name', ('Taxa',), 'GET', f"/api/v4/taxa/kingdom/{kingdom_name}",
+            query_params, timeout, stream, model)
+
+    def get_taxa_order(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all order names."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_order', ('Taxa',), 'GET', "/api/v4/taxa/order/",
+            query_params, timeout, stream, model)
+
+    def get_taxa_order_order_name(
+        self,
+        order_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given order_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_taxa_order_order_name', ('Taxa',), 'GET', f"/api/v4/taxa/order/{order_name}",
+            query_params, timeout, stream, model)
+
+    def get_taxa_phylum(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all phylum names."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_phylum', ('Taxa',), 'GET', "/api/v4/taxa/phylum/",
+            query_params, timeout, stream, model)
+
+    def get_taxa_phylum_phylum_name(
+        self,
+        phylum_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given phylum_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_taxa_phylum_phylum_name', ('Taxa',), 'GET', f"/api/v4/taxa/phylum/{phylum_name}",
+            query_params, timeout, stream, model)
+
+    def get_taxa_possibly_extinct(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the all latest global assessments for taxa that are possibly extinct."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_possibly_extinct', ('Taxa',), 'GET', "/api/v4/taxa/possibly_extinct",
+            query_params, timeout, stream, model)
+
+    def get_taxa_possibly_extinct_in_the_wild(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the all latest global assessments for taxa that are possibly extinct in the wild."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_possibly_extinct_in_the_wild', ('Taxa',), 'GET', "/api/v4/taxa/possibly_extinct_in_the_wild",
+            query_params, timeout, stream, model)
+
+    def get_taxa_scientific_name(
+        self,
+        *,
+        genus_name: str,
+        species_name: str,
+        infra_name: Optional[str] = None,
+        subpopulation_name: Optional[str] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given genus_name and species_name (i.e. Latin binomial) and optional infra_name (i.e. Latin trinomial)."""
+        query_params: Dict[str, Any] = {}
+        query_params['genus_name'] = genus_name
+        query_params['species_name'] = species_name
+        if infra_name is not None:
+            query_params['infra_name'] = infra_name
+        if subpopulation_name is not None:
+            query_params['subpopulation_name'] = subpopulation_name
+        return self._call_resolved(
+            'get_taxa_scientific_name', ('Taxa',), 'GET', "/api/v4/taxa/scientific_name",
+            query_params, timeout, stream, model)
+
+    def get_taxa_sis_sis_id(
+        self,
+        sis_id: PathValue,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given SIS id."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_taxa_sis_sis_id', ('Taxa',), 'GET', f"/api/v4/taxa/sis/{sis_id}",
+            query_params, timeout, stream, model)
+
+    def get_threats(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of threats."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_threats', ('Threats',), 'GET', "/api/v4/threats/",
+            query_params, timeout, stream, model)
+
+    def get_threats_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given threat code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_threats_code', ('Threats',), 'GET', f"/api/v4/threats/{code}",
+            query_params, timeout, stream, model)
+
+    def get_use_and_trade(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of use and trades."""
+        query_params: Dict[str, Any] = {}
+        return self._call_resolved(
+            'get_use_and_trade', ('Use and Trade',), 'GET', "/api/v4/use_and_trade/",
+            query_params, timeout, stream, model)
+
+    def get_use_and_trade_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        stream: bool = False,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given use and trade code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return self._call_resolved(
+            'get_use_and_trade_code', ('Use and Trade',), 'GET', f"/api/v4/use_and_trade/{code}",
+            query_params, timeout, stream, model)
+
+
+class AsyncEndpointMethods:
+    """One method per API endpoint, for AsyncIUCNRedListClient."""
+
+    async def get_assessment_assessment_id(
+        self,
+        assessment_id: PathValue,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Retrieves an assessment."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_assessment_assessment_id', ('Assessment',), 'GET', f"/api/v4/assessment/{assessment_id}",
+            query_params, timeout, model)
+
+    async def get_biogeographical_realms(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of biogeographic realm codes."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_biogeographical_realms', ('Biogeographical Realms',), 'GET', "/api/v4/biogeographical_realms/",
+            query_params, timeout, model)
+
+    async def get_biogeographical_realms_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a biogeographical realm code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_biogeographical_realms_code', ('Biogeographical Realms',), 'GET', f"/api/v4/biogeographical_realms/{code}",
+            query_params, timeout, model)
+
+    async def get_comprehensive_groups(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of comprehensive groups."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_comprehensive_groups', ('Comprehensive Groups',), 'GET', "/api/v4/comprehensive_groups/",
+            query_params, timeout, model)
+
+    async def get_comprehensive_groups_name(
+        self,
+        name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a comprehensive group name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_comprehensive_groups_name', ('Comprehensive Groups',), 'GET', f"/api/v4/comprehensive_groups/{name}",
+            query_params, timeout, model)
+
+    async def get_conservation_actions(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a list of conservation actions."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_conservation_actions', ('Conservation Actions',), 'GET', "/api/v4/conservation_actions/",
+            query_params, timeout, model)
+
+    async def get_conservation_actions_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a collection of assessments for a conservation action code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_conservation_actions_code', ('Conservation Actions',), 'GET', f"/api/v4/conservation_actions/{code}",
+            query_params, timeout, model)
+
+    async def get_countries(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of countries by ISO alpha-2 code."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_countries', ('Countries',), 'GET', "/api/v4/countries/",
+            query_params, timeout, model)
+
+    async def get_countries_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given country ISO alpha-2 code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_countries_code', ('Countries',), 'GET', f"/api/v4/countries/{code}",
+            query_params, timeout, model)
+
+    async def get_faos(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of FAOs."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_faos', ('FAOs',), 'GET', "/api/v4/faos/",
+            query_params, timeout, model)
+
+    async def get_faos_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for an FAO code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_faos_code', ('FAOs',), 'GET', f"/api/v4/faos/{code}",
+            query_params, timeout, model)
+
+    async def get_green_status_all(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all Green Status assessments."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_green_status_all', ('Green Status',), 'GET', "/api/v4/green_status/all",
+            query_params, timeout, model)
+
+    async def get_growth_forms(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of growth forms."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_growth_forms', ('Growth Forms',), 'GET', "/api/v4/growth_forms/",
+            query_params, timeout, model)
+
+    async def get_growth_forms_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given growth form code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_growth_forms_code', ('Growth Forms',), 'GET', f"/api/v4/growth_forms/{code}",
+            query_params, timeout, model)
+
+    async def get_habitats(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of habitat codes."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_habitats', ('Habitats',), 'GET', "/api/v4/habitats/",
+            query_params, timeout, model)
+
+    async def get_habitats_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given habitat code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_habitats_code', ('Habitats',), 'GET', f"/api/v4/habitats/{code}",
+            query_params, timeout, model)
+
+    async def get_information_api_version(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns the current version number of the IUCN Red List of Threatened Species API."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_information_api_version', ('Information',), 'GET', "/api/v4/information/api_version",
+            query_params, timeout, model)
+
+    async def get_information_red_list_version(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns the current IUCN Red List of Threatened Species version."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_information_red_list_version', ('Information',), 'GET', "/api/v4/information/red_list_version",
+            query_params, timeout, model)
+
+    async def get_population_trends(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of population trends."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_population_trends', ('Population Trends',), 'GET', "/api/v4/population_trends/",
+            query_params, timeout, model)
+
+    async def get_population_trends_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given population trend code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_population_trends_code', ('Population Trends',), 'GET', f"/api/v4/population_trends/{code}",
+            query_params, timeout, model)
+
+    async def get_red_list_categories(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of Red List categories."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_red_list_categories', ('Red List Categories',), 'GET', "/api/v4/red_list_categories/",
+            query_params, timeout, model)
+
+    async def get_red_list_categories_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given Red List category code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_red_list_categories_code', ('Red List Categories',), 'GET', f"/api/v4/red_list_categories/{code}",
+            query_params, timeout, model)
+
+    async def get_research(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of habitat codes."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_research', ('Research',), 'GET', "/api/v4/research/",
+            query_params, timeout, model)
+
+    async def get_research_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given research code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_research_code', ('Research',), 'GET', f"/api/v4/research/{code}",
+            query_params, timeout, model)
+
+    async def get_scopes(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a list of scopes."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_scopes', ('Scopes',), 'GET', "/api/v4/scopes/",
+            query_params, timeout, model)
+
+    async def get_scopes_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given scope code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        return await self._call_resolved(
+            'get_scopes_code', ('Scopes',), 'GET', f"/api/v4/scopes/{code}",
+            query_params, timeout, model)
+
+    async def get_statistics_count(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Return count of the number of species with assessments."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_statistics_count', ('Statistics',), 'GET', "/api/v4/statistics/count",
+            query_params, timeout, model)
+
+    async def get_stresses(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of stressors."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_stresses', ('Stresses',), 'GET', "/api/v4/stresses/",
+            query_params, timeout, model)
+
+    async def get_stresses_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """returns a collection of assessments for a given stress code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_stresses_code', ('Stresses',), 'GET', f"/api/v4/stresses/{code}",
+            query_params, timeout, model)
+
+    async def get_systems(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of systems."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_systems', ('Systems',), 'GET', "/api/v4/systems/",
+            query_params, timeout, model)
+
+    async def get_systems_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given system code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_systems_code', ('Systems',), 'GET', f"/api/v4/systems/{code}",
+            query_params, timeout, model)
+
+    async def get_taxa_class(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all class names."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_class', ('Taxa',), 'GET', "/api/v4/taxa/class/",
+            query_params, timeout, model)
+
+    async def get_taxa_class_class_name(
+        self,
+        class_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given class_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_taxa_class_class_name', ('Taxa',), 'GET', f"/api/v4/taxa/class/{class_name}",
+            query_params, timeout, model)
+
+    async def get_taxa_family(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all family names."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_family', ('Taxa',), 'GET', "/api/v4/taxa/family/",
+            query_params, timeout, model)
+
+    async def get_taxa_family_family_name(
+        self,
+        family_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given family_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_taxa_family_family_name', ('Taxa',), 'GET', f"/api/v4/taxa/family/{family_name}",
+            query_params, timeout, model)
+
+    async def get_taxa_kingdom(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all kingdom names."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_kingdom', ('Taxa',), 'GET', "/api/v4/taxa/kingdom/",
+            query_params, timeout, model)
+
+    async def get_taxa_kingdom_kingdom_name(
+        self,
+        kingdom_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given kingdom_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_taxa_kingdom_kingdom_name', ('Taxa',), 'GET', f"/api/v4/taxa/kingdom/{kingdom_name}",
+            query_params, timeout, model)
+
+    async def get_taxa_order(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all order names."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_order', ('Taxa',), 'GET', "/api/v4/taxa/order/",
+            query_params, timeout, model)
+
+    async def get_taxa_order_order_name(
+        self,
+        order_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given order_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_taxa_order_order_name', ('Taxa',), 'GET', f"/api/v4/taxa/order/{order_name}",
+            query_params, timeout, model)
+
+    async def get_taxa_phylum(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of all phylum names."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_phylum', ('Taxa',), 'GET', "/api/v4/taxa/phylum/",
+            query_params, timeout, model)
+
+    async def get_taxa_phylum_phylum_name(
+        self,
+        phylum_name: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the latests assessments for a given phylum_name."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_taxa_phylum_phylum_name', ('Taxa',), 'GET', f"/api/v4/taxa/phylum/{phylum_name}",
+            query_params, timeout, model)
+
+    async def get_taxa_possibly_extinct(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the all latest global assessments for taxa that are possibly extinct."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_possibly_extinct', ('Taxa',), 'GET', "/api/v4/taxa/possibly_extinct",
+            query_params, timeout, model)
+
+    async def get_taxa_possibly_extinct_in_the_wild(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of the all latest global assessments for taxa that are possibly extinct in the wild."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_possibly_extinct_in_the_wild', ('Taxa',), 'GET', "/api/v4/taxa/possibly_extinct_in_the_wild",
+            query_params, timeout, model)
+
+    async def get_taxa_scientific_name(
+        self,
+        *,
+        genus_name: str,
+        species_name: str,
+        infra_name: Optional[str] = None,
+        subpopulation_name: Optional[str] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given genus_name and species_name (i.e. Latin binomial) and optional infra_name (i.e. Latin trinomial)."""
+        query_params: Dict[str, Any] = {}
+        query_params['genus_name'] = genus_name
+        query_params['species_name'] = species_name
+        if infra_name is not None:
+            query_params['infra_name'] = infra_name
+        if subpopulation_name is not None:
+            query_params['subpopulation_name'] = subpopulation_name
+        return await self._call_resolved(
+            'get_taxa_scientific_name', ('Taxa',), 'GET', "/api/v4/taxa/scientific_name",
+            query_params, timeout, model)
+
+    async def get_taxa_sis_sis_id(
+        self,
+        sis_id: PathValue,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given SIS id."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_taxa_sis_sis_id', ('Taxa',), 'GET', f"/api/v4/taxa/sis/{sis_id}",
+            query_params, timeout, model)
+
+    async def get_threats(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of threats."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_threats', ('Threats',), 'GET', "/api/v4/threats/",
+            query_params, timeout, model)
+
+    async def get_threats_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given threat code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_threats_code', ('Threats',), 'GET', f"/api/v4/threats/{code}",
+            query_params, timeout, model)
+
+    async def get_use_and_trade(
+        self,
+        *,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a list of use and trades."""
+        query_params: Dict[str, Any] = {}
+        return await self._call_resolved(
+            'get_use_and_trade', ('Use and Trade',), 'GET', "/api/v4/use_and_trade/",
+            query_params, timeout, model)
+
+    async def get_use_and_trade_code(
+        self,
+        code: PathValue,
+        *,
+        page: Optional[int] = None,
+        year_published: Optional[int] = None,
+        latest: Optional[bool] = None,
+        possibly_extinct: Optional[bool] = None,
+        possibly_extinct_in_the_wild: Optional[bool] = None,
+        scope_code: Optional[int] = None,
+        timeout: "TimeoutSetting" = None,
+        model: Optional[type] = None,
+    ) -> Any:
+        """Returns a collection of assessments for a given use and trade code."""
+        query_params: Dict[str, Any] = {}
+        if page is not None:
+            query_params['page'] = coerce_integer('page', page)
+        if year_published is not None:
+            query_params['year_published'] = coerce_integer('year_published', year_published)
+        if latest is not None:
+            query_params['latest'] = coerce_boolean('latest', latest)
+        if possibly_extinct is not None:
+            query_params['possibly_extinct'] = coerce_boolean('possibly_extinct', possibly_extinct)
+        if possibly_extinct_in_the_wild is not None:
+            query_params['possibly_extinct_in_the_wild'] = coerce_boolean('possibly_extinct_in_the_wild', possibly_extinct_in_the_wild)
+        if scope_code is not None:
+            query_params['scope_code'] = coerce_integer('scope_code', scope_code)
+        return await self._call_resolved(
+            'get_use_and_trade_code', ('Use and Trade',), 'GET', f"/api/v4/use_and_trade/{code}",
+            query_params, timeout, model)
@@ -0,0 +1,153 @@
+"""
+Columnar export of paginated assessment collections.
+
+export_records walks a collection endpoint page by page and appends the
+assessments to a Parquet or Feather (Arrow IPC) file in record batches with a
+fixed schema. Only one batch is held in memory at a time, however large the
+collection, and the file is moved into place once it is complete.
+
+Requires the optional ``pyarrow`` dependency, imported on first export:
+
+    pip install iucn_red_list_client[export]
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, TypedDict, Union
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+else:
+    # Set by _require_pyarrow()
+    pa = None
+    pq = None
+
+# Constants
+DEFAULT_BATCH_SIZE = 10_000
+EXPORT_FORMATS = ('parquet', 'feather')
+FORMAT_SUFFIXES = {'.parquet': 'parquet', '.pq': 'parquet', '.feather': 'feather', '.arrow': 'feather'}
+
+# Exported columns and their Arrow type names, matching models.AssessmentSummary
+ASSESSMENT_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('assessment_id', 'int64'),
+    ('sis_taxon_id', 'int64'),
+    ('taxon_scientific_name', 'string'),
+    ('red_list_category_code', 'string'),
+    ('year_published', 'string'),
+    ('latest', 'bool'),
+    ('possibly_extinct', 'bool'),
+    ('possibly_extinct_in_the_wild', 'bool'),
+    ('url', 'string'),
+)
+
+_CASTS = {'int64': int, 'string': str, 'bool': bool}
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+
+class ExportStats(TypedDict):
+    """Summary of a completed export."""
+    path: str
+    format: str
+    rows: int
+    batches: int
+
+
+def assessment_schema() -> "pa.Schema":
+    """Return the Arrow schema of exported assessments."""
+    _require_pyarrow()
+    return pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in ASSESSMENT_COLUMNS])
+
+
+def resolve_export_format(path: Union[str, os.PathLike], file_format: Optional[str] = None) -> str:
+    """Return the export format, inferring it from the file suffix if not given."""
+    if file_format is None:
+        file_format = FORMAT_SUFFIXES.get(Path(path).suffix.lower())
+        if file_format is None:
+            raise ValueError(f"Cannot infer export format from {path}; use one of: {', '.join(EXPORT_FORMATS)}")
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {file_format} (choose from {', '.join(EXPORT_FORMATS)})")
+    return file_format
+
+
+def records_to_columns(records: Iterable[Any]) -> Dict[str, List[Any]]:
+    """Convert assessment dicts or models into column lists typed for the schema."""
+    columns: Dict[str, List[Any]] = {name: [] for name, _ in ASSESSMENT_COLUMNS}
+    for record in records:
+        get = record.get if isinstance(record, dict) else lambda name: getattr(record, name, None)
+        for name, type_name in ASSESSMENT_COLUMNS:
+            value = get(name)
+            if value is not None and type(value) is not _CASTS[type_name]:
+                value = _CASTS[type_name](value)
+            columns[name].append(value)
+    return columns
+
+
+def export_records(client: Any, endpoint_name: str, path: Union[str, os.PathLike],
+                   file_format: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                   compression: Optional[str] = None, prefetch: int = 1, **kwargs) -> ExportStats:
+    """Export every assessment of a paginated endpoint to a Parquet or Feather file.
+
+    The format is ``file_format`` or inferred from the suffix of ``path``.
+    ``kwargs`` are the endpoint parameters, as for ``iter_records``. Records
+    are written in batches of ``batch_size`` rows; ``compression`` is passed
+    to the writer (Parquet default: snappy, Feather default: none).
+    """
+    _require_pyarrow()
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    path = Path(path).expanduser()
+    file_format = resolve_export_format(path, file_format)
+    schema = assessment_schema()
+    partial = path.with_name(path.name + '.partial')
+
+    if file_format == 'parquet':
+        writer = pq.ParquetWriter(str(partial), schema, compression=compression or 'snappy')
+    else:
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        writer = pa.ipc.new_file(str(partial), schema, options=options)
+
+    stats: ExportStats = {'path': str(path), 'format': file_format, 'rows': 0, 'batches': 0}
+    batch: List[Any] = []
+
+    def flush() -> None:
+        writer.write_batch(pa.RecordBatch.from_pydict(records_to_columns(batch), schema=schema))
+        stats['rows'] += len(batch)
+        stats['batches'] += 1
+        batch.clear()
+
+    try:
+        for record in client.iter_records(endpoint_name, prefetch=prefetch, **kwargs):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        writer.close()
+    except BaseException:
+        writer.close()
+        partial.unlink(missing_ok=True)
+        raise
+
+    os.replace(partial, path)
+    logger.info(f"Exported {stats['rows']} records from {endpoint_name} to {path}")
+    return stats
+
+
+def _require_pyarrow() -> None:
+    """Import pyarrow, raising ImportError if it is not installed."""
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:  # pragma: no cover - exercised only without pyarrow
+            raise ImportError(
+                "Columnar export requires pyarrow. "
+                "Install it with: pip install iucn_red_list_client[export]"
+            ) from None
+        pa, pq = pyarrow, pyarrow.parquet
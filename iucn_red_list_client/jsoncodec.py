@@ -0,0 +1,122 @@
+"""
+JSON decoding and encoding backends for the IUCN Red List API client.
+
+Response bodies are decoded, and CLI output encoded, through a JSONCodec.
+``orjson`` or ``msgspec`` are used when installed and the standard library
+``json`` module otherwise. A backend is chosen by name, or with ``auto``
+(the default) for the fastest one available:
+
+    pip install orjson
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+# Constants
+AUTO_BACKEND = 'auto'
+AUTO_PREFERENCE = ('orjson', 'msgspec', 'json')
+PRETTY_INDENT = 2
+
+
+class JSONCodec:
+    """Standard library JSON backend, and the interface of the faster ones."""
+
+    name = 'json'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Return True if the backend's library is installed."""
+        return True
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        """Encode ``obj`` as JSON, indented by two spaces if ``pretty``.
+
+        Non-ASCII text is written as is, as the faster backends do.
+        """
+        if pretty:
+            return json.dumps(obj, indent=PRETTY_INDENT, ensure_ascii=False)
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON backend using ``orjson``."""
+
+    name = 'orjson'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return orjson is not None
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode('utf-8')
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON backend using ``msgspec``."""
+
+    name = 'msgspec'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return msgspec is not None
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return msgspec.json.decode(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        encoded = msgspec.json.encode(obj)
+        if pretty:
+            encoded = msgspec.json.format(encoded, indent=PRETTY_INDENT)
+        return encoded.decode('utf-8')
+
+
+BACKENDS: Dict[str, Type[JSONCodec]] = {
+    codec.name: codec for codec in (OrjsonCodec, MsgspecCodec, JSONCodec)
+}
+
+_instances: Dict[str, JSONCodec] = {}
+
+
+def available_backends() -> List[str]:
+    """Return the names of the installed backends, fastest first."""
+    return [name for name in AUTO_PREFERENCE if BACKENDS[name].is_available()]
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return the codec for a backend name, or the fastest installed one.
+
+    Raises ValueError for unknown names and ImportError when the requested
+    backend is not installed.
+    """
+    name = (name or AUTO_BACKEND).lower()
+    if name == AUTO_BACKEND:
+        name = available_backends()[0]
+    codec_class = BACKENDS.get(name)
+    if codec_class is None:
+        choices = ', '.join([AUTO_BACKEND, *AUTO_PREFERENCE])
+        raise ValueError(f"Unknown JSON backend: {name} (choose from {choices})")
+    if not codec_class.is_available():
+        raise ImportError(f"JSON backend '{name}' is not installed. Install it with: pip install {name}")
+    if name not in _instances:
+        _instances[name] = codec_class()
+    return _instances[name]
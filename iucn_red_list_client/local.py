@@ -0,0 +1,308 @@
+"""
+Offline species lookups from a local indexed store.
+
+A SpeciesStore is an SQLite database of taxon responses (as returned by
+``get_taxa_scientific_name`` and ``get_taxa_sis_sis_id``) and full assessment
+documents, indexed by normalized scientific name, SIS id and assessment id.
+It is filled with populate_store, from the taxa of a mirror (see
+``iucn_red_list_client.sync``) or a bulk fetch by name or SIS id.
+
+LocalIUCNClient answers ``call_endpoint`` from the store, so a lookup is an
+index probe instead of an API request. Given a ``fallback`` client, lookups
+missing from the store are passed to the API and their results stored.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypedDict, Union
+
+from .client import DEFAULT_BULK_WORKERS, resolve_endpoint
+from .jsoncodec import JSONCodec, get_codec
+from .models import convert_model
+from .names import name_key, normalize_name
+
+# Constants
+DEFAULT_STORE_PATH = Path.home() / '.cache' / 'iucn_red_list_client' / 'species.sqlite'
+NAME_ENDPOINT = 'get_taxa_scientific_name'
+SIS_ENDPOINT = 'get_taxa_sis_sis_id'
+ASSESSMENT_ENDPOINT = 'get_assessment_assessment_id'
+INDEXED_ENDPOINTS = (NAME_ENDPOINT, SIS_ENDPOINT, ASSESSMENT_ENDPOINT)
+POPULATE_BATCH_SIZE = 1000
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+
+class NotInStore(LookupError):
+    """Raised when a lookup is not in the local store and there is no fallback client."""
+
+
+class PopulateStats(TypedDict):
+    """Summary of a populate_store run."""
+    taxa: int
+    failed: int
+
+
+def taxon_name_key(taxon: Dict[str, Any]) -> Optional[str]:
+    """Return the lookup key of a taxon from its name parts, else its scientific name."""
+    if taxon.get('genus_name') and taxon.get('species_name'):
+        return name_key(taxon['genus_name'], taxon['species_name'],
+                        taxon.get('infra_name'), taxon.get('subpopulation_name'))
+    if taxon.get('scientific_name'):
+        return normalize_name(taxon['scientific_name'])
+    return None
+
+
+class SpeciesStore:
+    """SQLite store of taxon responses and assessments, indexed for offline lookups."""
+
+    def __init__(self, path: Union[str, os.PathLike] = DEFAULT_STORE_PATH,
+                 codec: Optional[JSONCodec] = None):
+        """Initialize the store, creating the database file if needed."""
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or get_codec()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS taxa ("
+            " sis_id INTEGER PRIMARY KEY,"
+            " name_key TEXT NOT NULL,"
+            " scientific_name TEXT,"
+            " response TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS taxa_name ON taxa (name_key);"
+            "CREATE TABLE IF NOT EXISTS taxon_assessments ("
+            " assessment_id INTEGER PRIMARY KEY,"
+            " sis_id INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS taxon_assessments_sis ON taxon_assessments (sis_id);"
+            "CREATE TABLE IF NOT EXISTS assessments ("
+            " assessment_id INTEGER PRIMARY KEY,"
+            " document TEXT NOT NULL);"
+        )
+
+    def add_taxa(self, responses: Iterable[Dict[str, Any]]) -> int:
+        """Store taxon responses in one transaction, replacing earlier ones of the same taxa.
+
+        Responses without a taxon SIS id and name are skipped. Returns the
+        number stored.
+        """
+        stored = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for response in responses:
+                    stored += self._write_taxon(response)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return stored
+
+    def add_taxon(self, response: Dict[str, Any]) -> bool:
+        """Store one taxon response; returns False if it was skipped."""
+        return self.add_taxa([response]) == 1
+
+    def _write_taxon(self, response: Dict[str, Any]) -> bool:
+        """Insert or replace a taxon response; the caller must hold the lock."""
+        taxon = response.get('taxon') or {}
+        sis_id, key = taxon.get('sis_id'), taxon_name_key(taxon)
+        if sis_id is None or key is None:
+            logger.warning(f"Not storing a taxon response without SIS id and name: {taxon}")
+            return False
+        self._conn.execute("DELETE FROM taxon_assessments WHERE sis_id = ?", (sis_id,))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO taxa (sis_id, name_key, scientific_name, response) VALUES (?, ?, ?, ?)",
+            (sis_id, key, taxon.get('scientific_name'), self.codec.dumps(response))
+        )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO taxon_assessments (assessment_id, sis_id) VALUES (?, ?)",
+            [(assessment['assessment_id'], sis_id) for assessment in response.get('assessments') or []
+             if assessment.get('assessment_id') is not None]
+        )
+        return True
+
+    def add_assessment(self, document: Dict[str, Any]) -> bool:
+        """Store a full assessment document; returns False if it has no assessment id."""
+        assessment_id = document.get('assessment_id')
+        if assessment_id is None:
+            return False
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO assessments (assessment_id, document) VALUES (?, ?)",
+                               (assessment_id, self.codec.dumps(document)))
+        return True
+
+    def _fetch(self, query: str, params: Tuple[Any, ...]) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return self.codec.loads(row[0]) if row else None
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the taxon response for a scientific name, or None."""
+        return self._fetch("SELECT response FROM taxa WHERE name_key = ? LIMIT 1", (normalize_name(name),))
+
+    def by_sis_id(self, sis_id: int) -> Optional[Dict[str, Any]]:
+        """Return the taxon response for a SIS id, or None."""
+        return self._fetch("SELECT response FROM taxa WHERE sis_id = ?", (int(sis_id),))
+
+    def by_assessment_id(self, assessment_id: int) -> Optional[Dict[str, Any]]:
+        """Return the taxon response listing an assessment, or None."""
+        return self._fetch(
+            "SELECT t.response FROM taxa t JOIN taxon_assessments a ON a.sis_id = t.sis_id"
+            " WHERE a.assessment_id = ?", (int(assessment_id),)
+        )
+
+    def assessment(self, assessment_id: int) -> Optional[Dict[str, Any]]:
+        """Return a stored full assessment document, or None."""
+        return self._fetch("SELECT document FROM assessments WHERE assessment_id = ?", (int(assessment_id),))
+
+    def scientific_names(self) -> List[str]:
+        """Return the scientific names of every stored taxon, e.g. to build a ``NameIndex``."""
+        with self._lock:
+            rows = self._conn.execute("SELECT scientific_name FROM taxa WHERE scientific_name IS NOT NULL"
+                                      " ORDER BY scientific_name").fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM taxa").fetchone()[0]
+
+
+def populate_store(client: Any, store: SpeciesStore, sis_ids: Iterable[int] = (),
+                   names: Iterable[Union[str, Tuple[str, ...]]] = (),
+                   max_workers: int = DEFAULT_BULK_WORKERS,
+                   batch_size: int = POPULATE_BATCH_SIZE) -> PopulateStats:
+    """Fetch taxa by SIS id and by name and store them.
+
+    Pass ``mirror.sis_ids()`` to index every taxon of a mirror. Requests run
+    on up to ``max_workers`` threads; failed lookups are logged and counted
+    instead of raised. Taxa are committed in transactions of up to
+    ``batch_size`` as they arrive, so memory stays bounded and an
+    interrupted run keeps what it fetched.
+    """
+    stats: PopulateStats = {'taxa': 0, 'failed': 0}
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        if batch:
+            stats['taxa'] += store.add_taxa(batch)
+            batch.clear()
+
+    def add(response: Optional[Dict[str, Any]]) -> None:
+        if response is None:
+            stats['failed'] += 1
+            return
+        batch.append(response)
+        if len(batch) >= batch_size:
+            flush()
+
+    def lookup(sis_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            return client.call_endpoint(SIS_ENDPOINT, sis_id=sis_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch taxon {sis_id}: {e}")
+            return None
+
+    try:
+        sis_ids = list(dict.fromkeys(sis_ids))
+        if sis_ids:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='iucn-populate') as executor:
+                # Ids are mapped a batch at a time so finished responses never pile up
+                for start in range(0, len(sis_ids), batch_size):
+                    for response in executor.map(lookup, sis_ids[start:start + batch_size]):
+                        add(response)
+
+        for _, result in client.iter_species_bulk(names, max_workers=max_workers):
+            if result['error'] is not None:
+                logger.warning(f"Failed to fetch {result['genus_name']} {result['species_name']}: {result['error']}")
+            add(result['result'])
+    finally:
+        flush()
+
+    logger.info(f"Populated species store: {stats}")
+    return stats
+
+
+class LocalIUCNClient:
+    """Client answering taxon and assessment lookups from a SpeciesStore.
+
+    Indexed endpoints are ``get_taxa_scientific_name``, ``get_taxa_sis_sis_id``
+    and ``get_assessment_assessment_id``. Other endpoints, and lookups missing
+    from the store, go to ``fallback`` (an IUCNRedListClient) if given and
+    raise NotInStore otherwise. With ``write_through`` (the default), taxa and
+    assessments fetched from the fallback are added to the store.
+    """
+
+    def __init__(self, store: SpeciesStore, fallback: Optional[Any] = None, write_through: bool = True):
+        """Initialize the client."""
+        self.store = store
+        self.fallback = fallback
+        self.write_through = write_through
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def call_endpoint(self, endpoint_name: str, model: Optional[type] = None, **kwargs) -> Any:
+        """Call an endpoint, from the store when possible.
+
+        Takes the same arguments as ``IUCNRedListClient.call_endpoint``;
+        arguments other than the endpoint parameters and ``model`` are passed
+        to the fallback client.
+        """
+        if endpoint_name not in INDEXED_ENDPOINTS:
+            return self._call_fallback(endpoint_name, model=model, **kwargs)
+
+        resolve_endpoint(endpoint_name, dict(kwargs))
+        result = self._lookup(endpoint_name, kwargs)
+        with self._stats_lock:
+            if result is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if result is None:
+            result = self._call_fallback(endpoint_name, **kwargs)
+            if self.write_through:
+                if endpoint_name == ASSESSMENT_ENDPOINT:
+                    self.store.add_assessment(result)
+                else:
+                    self.store.add_taxon(result)
+        return convert_model(result, model) if model is not None else result
+
+    def _lookup(self, endpoint_name: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the stored response for an indexed endpoint call, or None."""
+        if endpoint_name == NAME_ENDPOINT:
+            return self.store.by_name(name_key(params['genus_name'], params['species_name'],
+                                               params.get('infra_name'), params.get('subpopulation_name')))
+        if endpoint_name == SIS_ENDPOINT:
+            return self.store.by_sis_id(params['sis_id'])
+        return self.store.assessment(params['assessment_id'])
+
+    def _call_fallback(self, endpoint_name: str, **kwargs) -> Any:
+        """Pass a call to the fallback client, or raise NotInStore without one."""
+        if self.fallback is None:
+            params = ', '.join(f"{name}={value}" for name, value in kwargs.items() if name != 'model')
+            raise NotInStore(f"{endpoint_name}({params}) is not in the local store")
+        return self.fallback.call_endpoint(endpoint_name, **kwargs)
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return store hit/miss counters and the number of stored taxa."""
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'entries': len(self.store),
+        }
+
+    def close(self) -> None:
+        """Close the store."""
+        self.store.close()
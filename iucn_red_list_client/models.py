@@ -0,0 +1,179 @@
+"""
+Typed, compact models for the main IUCN Red List API payloads.
+
+Models hold the fields analyses use most: taxa, assessment summaries and the
+paginated assessment lists returned by collection endpoints. Fields not
+declared here are ignored, and declared fields missing from a response take
+their defaults. Instances use ``__slots__`` rather than per-object dicts,
+which cuts memory several times over when hundreds of thousands of
+assessments are kept, and make fields plain attributes.
+
+When ``msgspec`` is installed the models are ``msgspec.Struct`` types and
+responses are decoded straight from bytes into them; otherwise they are
+slotted classes filled from the decoded JSON:
+
+    pip install msgspec
+"""
+
+import typing
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+from .jsoncodec import JSONCodec, get_codec
+
+# Marker default for list fields, which start out as a new empty list
+EMPTY_LIST = object()
+
+FieldSpec = Tuple[str, Any, Any]
+Converter = Optional[Callable[[Any], Any]]
+
+
+class SlottedModel:
+    """Base class of the models when ``msgspec`` is not installed."""
+
+    __slots__ = ()
+    _fields: Tuple[FieldSpec, ...] = ()
+    _converters: Tuple[Tuple[str, Converter, Any], ...] = ()
+
+    def __init__(self, **kwargs):
+        """Initialize the model, using defaults for fields not given."""
+        for name, _, default in self._fields:
+            if name in kwargs:
+                value = kwargs.pop(name)
+            else:
+                value = [] if default is EMPTY_LIST else default
+            setattr(self, name, value)
+        if kwargs:
+            raise TypeError(f"Unexpected fields for {type(self).__name__}: {', '.join(kwargs)}")
+
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> "SlottedModel":
+        """Build a model from decoded JSON, converting nested models."""
+        model = object.__new__(cls)
+        for name, convert, default in cls._converters:
+            if name in data:
+                value = data[name]
+                if convert is not None and value is not None:
+                    value = convert(value)
+            else:
+                value = [] if default is EMPTY_LIST else default
+            setattr(model, name, value)
+        return model
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name, _, _ in self._fields)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name, _, _ in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+def _converter_for(kind: Any) -> Converter:
+    """Return a function converting decoded JSON to the declared type, or None if none is needed."""
+    if typing.get_origin(kind) is Union:
+        kind = next((arg for arg in typing.get_args(kind) if arg is not type(None)), Any)
+    if isinstance(kind, type) and issubclass(kind, SlottedModel):
+        return lambda value: kind._from_dict(value) if isinstance(value, dict) else value
+    if typing.get_origin(kind) is list:
+        convert_item = _converter_for(typing.get_args(kind)[0])
+        if convert_item is not None:
+            return lambda value: [convert_item(item) for item in value] if isinstance(value, list) else value
+    return None
+
+
+def _define(name: str, doc: str, fields: Sequence[FieldSpec]) -> type:
+    """Create a model type with the given ``(name, type, default)`` fields."""
+    if msgspec is not None:
+        return msgspec.defstruct(
+            name,
+            [
+                (field, kind, msgspec.field(default_factory=list) if default is EMPTY_LIST else default)
+                for field, kind, default in fields
+            ],
+            module=__name__,
+            namespace={'__doc__': doc},
+            kw_only=True,
+        )
+    return type(name, (SlottedModel,), {
+        '__doc__': doc,
+        '__module__': __name__,
+        '__slots__': tuple(field for field, _, _ in fields),
+        '_fields': tuple(fields),
+        '_converters': tuple((field, _converter_for(kind), default) for field, kind, default in fields),
+    })
+
+
+CommonName = _define('CommonName', "A common name of a taxon.", [
+    ('name', Optional[str], None),
+    ('language', Optional[str], None),
+    ('main', bool, False),
+])
+
+Taxon = _define('Taxon', "Taxonomic details of a species or infraspecific taxon.", [
+    ('sis_id', Optional[int], None),
+    ('scientific_name', Optional[str], None),
+    ('kingdom_name', Optional[str], None),
+    ('phylum_name', Optional[str], None),
+    ('class_name', Optional[str], None),
+    ('order_name', Optional[str], None),
+    ('family_name', Optional[str], None),
+    ('genus_name', Optional[str], None),
+    ('species_name', Optional[str], None),
+    ('infra_name', Optional[str], None),
+    ('subpopulation_name', Optional[str], None),
+    ('authority', Optional[str], None),
+    ('common_names', List[CommonName], EMPTY_LIST),
+])
+
+AssessmentSummary = _define('AssessmentSummary', "Summary of one assessment in a collection.", [
+    ('assessment_id', Optional[int], None),
+    ('sis_taxon_id', Optional[int], None),
+    ('taxon_scientific_name', Optional[str], None),
+    ('red_list_category_code', Optional[str], None),
+    ('year_published', Union[str, int, None], None),
+    ('latest', bool, False),
+    ('possibly_extinct', bool, False),
+    ('possibly_extinct_in_the_wild', bool, False),
+    ('url', Optional[str], None),
+])
+
+AssessmentList = _define('AssessmentList', "A page of assessments from a collection endpoint.", [
+    ('assessments', List[AssessmentSummary], EMPTY_LIST),
+])
+
+TaxonAssessments = _define('TaxonAssessments', "A taxon with its assessments, as returned by the taxa endpoints.", [
+    ('taxon', Optional[Taxon], None),
+    ('assessments', List[AssessmentSummary], EMPTY_LIST),
+])
+
+
+def decode_model(data: Union[bytes, str], model: Type[Any], codec: Optional[JSONCodec] = None) -> Any:
+    """Decode a JSON response body into ``model``.
+
+    With ``msgspec`` the body is decoded directly into the model; otherwise it
+    is decoded with ``codec`` (default: fastest installed) and converted.
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(data, type=model, strict=False)
+    return convert_model((codec or get_codec()).loads(data), model)
+
+
+def convert_model(data: Dict[str, Any], model: Type[Any]) -> Any:
+    """Convert an already decoded JSON object into ``model``."""
+    if msgspec is not None:
+        return msgspec.convert(data, type=model, strict=False)
+    return model._from_dict(data)
+
+
+def latest_assessment(assessments: Sequence[Any]) -> Optional[Any]:
+    """Return the assessment flagged as latest, else the first one, else None."""
+    for assessment in assessments:
+        if assessment.latest:
+            return assessment
+    return assessments[0] if assessments else None
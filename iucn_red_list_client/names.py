@@ -0,0 +1,226 @@
+"""
+Scientific name handling for the IUCN Red List API client.
+
+Names are compared in a normalized form so that differences in case,
+spacing and Unicode representation do not cause lookups to miss.
+parse_name splits a name as written in a species list, with authorities,
+hybrid signs, subgenera and infraspecific ranks, into the genus, species and
+infra names the API expects. NameIndex matches names against a local list of
+known taxa, exactly or by trigram similarity, so misspelled names can be
+corrected before any request is made.
+"""
+
+import difflib
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, TypedDict
+
+# Constants
+DEFAULT_CUTOFF = 0.8
+MAX_CANDIDATES = 20
+HYBRID_SIGNS = ('×', 'x')
+INFRA_RANKS = {
+    'subsp': 'subsp.', 'ssp': 'subsp.', 'subspecies': 'subsp.',
+    'var': 'var.', 'variety': 'var.', 'subvar': 'subvar.',
+    'f': 'f.', 'fo': 'f.', 'forma': 'f.',
+}
+QUALIFIERS = {'cf', 'aff', 'nr'}
+UNSPECIFIED = {'sp', 'spp', 'indet'}
+# Lower-case words that begin an authority rather than an infraspecific name
+AUTHORITY_PARTICLES = {'de', 'del', 'della', 'der', 'di', 'du', 'da', 'la', 'le', 'van', 'von',
+                       'ex', 'in', 'et', 'and', 'auct', 'nom', 'non', 'sensu', 'emend'}
+
+_EPITHET = re.compile(r"^[^\W\d_][\w'-]*$")
+
+
+class ParsedName(TypedDict):
+    """A scientific name split into the parts used by ``get_taxa_scientific_name``."""
+    genus_name: Optional[str]
+    species_name: Optional[str]
+    infra_name: Optional[str]
+    infra_rank: Optional[str]
+    hybrid: bool
+
+
+class NameMatch(TypedDict):
+    """The result of matching a name against a NameIndex."""
+    query: str
+    name: str
+    score: float
+    exact: bool
+    parsed: ParsedName
+
+
+def normalize_name(name: str) -> str:
+    """Return the lookup key of a scientific name: NFKC, single spaces, case-folded."""
+    return ' '.join(unicodedata.normalize('NFKC', name).split()).casefold()
+
+
+def name_key(genus_name: str, species_name: str, infra_name: Optional[str] = None,
+             subpopulation_name: Optional[str] = None) -> str:
+    """Return the lookup key of a name given as its parts."""
+    parts = [genus_name, species_name, infra_name, subpopulation_name]
+    return normalize_name(' '.join(part for part in parts if part))
+
+
+def _bare(token: str) -> str:
+    """Return a token without a trailing full stop, case-folded."""
+    return token.rstrip('.').casefold()
+
+
+def parse_name(name: str) -> ParsedName:
+    """Split a scientific name into genus, species and infraspecific name.
+
+    Authorities, subgenera in parentheses, qualifiers such as ``cf.`` and
+    hybrid signs are dropped; the genus is capitalized and epithets are
+    lower-cased. Rank words (``subsp.``, ``var.``, ``f.``) introduce the
+    infraspecific name, as does a third lower-case word, as in zoological
+    trinomials.
+    """
+    text = unicodedata.normalize('NFKC', name).replace('×', ' × ')
+    tokens = text.split()
+    parsed: ParsedName = {'genus_name': None, 'species_name': None, 'infra_name': None,
+                          'infra_rank': None, 'hybrid': False}
+    single_case = text.islower() or text.isupper()
+
+    position = 0
+
+    def skip_markers() -> None:
+        nonlocal position
+        while position < len(tokens):
+            token = tokens[position]
+            if token in HYBRID_SIGNS:
+                parsed['hybrid'] = True
+            elif _bare(token) not in QUALIFIERS:
+                return
+            position += 1
+
+    skip_markers()
+    if position >= len(tokens) or not _EPITHET.match(tokens[position]):
+        return parsed
+    parsed['genus_name'] = tokens[position].capitalize()
+    position += 1
+
+    # Subgenus, e.g. "Bombus (Psithyrus) rupestris"
+    if position < len(tokens) and tokens[position].startswith('(') and tokens[position][1:2].isupper():
+        while position < len(tokens) and not tokens[position].endswith(')'):
+            position += 1
+        position += 1
+
+    skip_markers()
+    if position >= len(tokens) or _bare(tokens[position]) in UNSPECIFIED or not _EPITHET.match(tokens[position]):
+        return parsed
+    parsed['species_name'] = tokens[position].lower()
+    position += 1
+
+    for index in range(position, len(tokens)):
+        token = tokens[index]
+        rank = INFRA_RANKS.get(_bare(token))
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+        if rank is not None and following is not None and _EPITHET.match(following):
+            parsed['infra_rank'], parsed['infra_name'] = rank, following.lower()
+            break
+        is_trinomial = (
+            index == position and _EPITHET.match(token) and len(token) > 1
+            and (token.islower() or single_case) and token.casefold() not in AUTHORITY_PARTICLES
+        )
+        if is_trinomial:
+            parsed['infra_name'] = token.lower()
+            break
+    return parsed
+
+
+def canonical_name(parsed: ParsedName) -> str:
+    """Return a parsed name as ``Genus species [rank] [infra]``."""
+    parts = [parsed['genus_name'], parsed['species_name'], parsed['infra_rank'], parsed['infra_name']]
+    return ' '.join(part for part in parts if part)
+
+
+def _match_key(parsed: ParsedName) -> str:
+    """Return the key names are matched on: genus, species and infra name, without rank."""
+    return name_key(parsed['genus_name'] or '', parsed['species_name'] or '', parsed['infra_name'])
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Return the character trigrams of a padded key."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Index of known scientific names for exact and fuzzy matching.
+
+    Names are parsed and keyed on genus, species and infra name. Lookups
+    try the key first, then score the names sharing the most trigrams with
+    it and return the best one at or above the cutoff.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        """Initialize the index with known names."""
+        self._names: List[str] = []
+        self._keys: List[str] = []
+        self._trigram_counts: List[int] = []
+        self._by_key: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> None:
+        """Add a known name; names without genus and species, and duplicates, are ignored."""
+        parsed = parse_name(name)
+        if not parsed['genus_name'] or not parsed['species_name']:
+            return
+        key = _match_key(parsed)
+        if key in self._by_key:
+            return
+        name_id = len(self._names)
+        trigrams = _trigrams(key)
+        self._names.append(' '.join(name.split()))
+        self._keys.append(key)
+        self._trigram_counts.append(len(trigrams))
+        self._by_key[key] = name_id
+        for trigram in trigrams:
+            self._postings.setdefault(trigram, []).append(name_id)
+
+    def _result(self, query: str, name_id: int, score: float) -> NameMatch:
+        name = self._names[name_id]
+        return {'query': query, 'name': name, 'score': score, 'exact': score == 1.0, 'parsed': parse_name(name)}
+
+    def match(self, name: str, cutoff: float = DEFAULT_CUTOFF) -> Optional[NameMatch]:
+        """Return the best match for ``name`` scoring at least ``cutoff`` (0-1), or None."""
+        parsed = parse_name(name)
+        if not parsed['genus_name'] or not parsed['species_name']:
+            return None
+        key = _match_key(parsed)
+        name_id = self._by_key.get(key)
+        if name_id is not None:
+            return self._result(name, name_id, 1.0)
+
+        trigrams = _trigrams(key)
+        shared: Counter = Counter()
+        for trigram in trigrams:
+            shared.update(self._postings.get(trigram, ()))
+        best_id, best_score = None, 0.0
+        for candidate, count in shared.most_common(MAX_CANDIDATES):
+            # Candidates sharing few trigrams are skipped before the costlier edit-based score
+            if 2 * count / (len(trigrams) + self._trigram_counts[candidate]) < cutoff / 2:
+                continue
+            score = difflib.SequenceMatcher(None, key, self._keys[candidate]).ratio()
+            if score > best_score:
+                best_id, best_score = candidate, score
+        if best_id is None or best_score < cutoff:
+            return None
+        return self._result(name, best_id, min(best_score, 0.999))
+
+    def resolve(self, name: str, cutoff: float = DEFAULT_CUTOFF) -> ParsedName:
+        """Return the parts of the best matching known name, else of ``name`` as parsed."""
+        matched = self.match(name, cutoff)
+        return matched['parsed'] if matched is not None else parse_name(name)
+
+    def __contains__(self, name: str) -> bool:
+        parsed = parse_name(name)
+        return _match_key(parsed) in self._by_key
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -0,0 +1,123 @@
+"""
+Client-side request rate limiting for the IUCN Red List API client.
+
+TokenBucket allows a sustained number of requests per second with short
+bursts. It adapts to the server: a throttled (HTTP 429) response halves
+the allowed rate and honours any ``Retry-After`` pause, and each successful
+response then steps the rate back up towards its configured maximum. One
+bucket can be shared by several threads, clients and asyncio tasks; 429s
+arriving together within one throttle window back off and pause only once.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Constants
+BACKOFF_FACTOR = 0.5
+MIN_RATE_FRACTION = 0.1
+RECOVERY_STEP = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Thread-safe adaptive token bucket rate limiter."""
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: Optional[float] = None):
+        """Initialize the bucket.
+
+        ``rate`` is the sustained rate in requests per second and ``burst``
+        the number of requests that may be sent back to back. After throttling
+        the rate never drops below ``min_rate`` (default: a tenth of ``rate``).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = burst
+        self.min_rate = min_rate if min_rate is not None else self.max_rate * MIN_RATE_FRACTION
+        self.throttle_count = 0
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        # Time tokens were last counted; lies in the future while paused by Retry-After
+        self._updated = time.monotonic()
+        # Further throttled responses before this time do not lower the rate again
+        self._backoff_until = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1.0
+            paused = max(0.0, self._updated - now)
+            if self._tokens >= 0:
+                return paused
+            return paused - self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        import asyncio
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a throttled response, pausing for ``retry_after`` seconds if given.
+
+        The rate is lowered once per throttle window, which lasts until the
+        pause ends or, without one, for one request interval at the lowered
+        rate. Pauses requested within a window overlap rather than add up.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.throttle_count += 1
+            if now >= self._backoff_until:
+                self.rate = max(self.min_rate, self.rate * BACKOFF_FACTOR)
+            if retry_after:
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = max(self._updated, now + retry_after)
+            self._backoff_until = max(self._backoff_until, self._updated, now + 1.0 / self.rate)
+
+    def succeeded(self) -> None:
+        """Step the rate back up towards its maximum after a successful response."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_STEP)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current and maximum rate and the number of throttled responses."""
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'max_rate': self.max_rate,
+                'burst': self.burst,
+                'throttle_count': self.throttle_count,
+            }
@@ -0,0 +1,115 @@
+"""
+Request coalescing for the IUCN Red List API client.
+
+SingleFlight lets concurrent identical calls share one execution: the first
+caller for a key runs the call, and callers arriving with the same key while
+it is in flight wait for it and receive the same result, or a copy of its
+exception. The clients key calls on the method, resolved URL, query
+parameters and model, so a burst of lookups of one popular species costs a
+single request and a single decode. One instance can be shared by several
+threads, clients and asyncio tasks.
+"""
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class SingleFlight:
+    """Thread-safe coalescing of concurrent identical calls.
+
+    Results are shared, not copied, so callers should treat them as
+    read-only. Asynchronous calls are coalesced per event loop; the shared
+    call keeps running if a waiting task is cancelled.
+    """
+
+    def __init__(self):
+        """Initialize the counters."""
+        self.calls = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._tasks: Dict[Tuple["asyncio.AbstractEventLoop", Hashable], "asyncio.Future"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, sharing the outcome of a call with the same key already in flight."""
+        with self._lock:
+            self.calls += 1
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            error = future.exception()
+            if error is None:
+                return future.result()
+            fresh = waiter_exception(error)
+            if fresh is error:
+                raise error
+            raise fresh from error
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        """Stop sharing a finished call, so later callers start a new one."""
+        with self._lock:
+            del self._calls[key]
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return ``await fn()``, sharing the outcome of a call with the same key already in flight."""
+        import asyncio
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            self.calls += 1
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda done: self._task_done(task_key, done))
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _task_done(self, task_key: Tuple["asyncio.AbstractEventLoop", Hashable], task: "asyncio.Future") -> None:
+        """Stop sharing a finished task."""
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every waiting task was cancelled
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of calls, how many shared another's result, and calls in flight."""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls) + len(self._tasks),
+            }
+
+
+def waiter_exception(error: BaseException) -> BaseException:
+    """Return a traceback-free copy of a shared call's exception for one waiting thread.
+
+    Re-raising the leader's instance from several threads would grow and
+    rewrite its traceback concurrently. Exceptions that cannot be copied are
+    shared as before.
+    """
+    try:
+        return copy.copy(error)
+    except Exception:
+        return error
@@ -0,0 +1,141 @@
+"""
+Incremental JSON decoding for large API responses.
+
+StreamingRecordDecoder pulls the elements of one JSON array out of a
+response body as its bytes arrive, so a page of assessments can be handed
+out record by record without buffering the whole body or building its full
+object tree. The array is either the value of a top-level key (such as
+``{"assessments": [...]}``) or the document itself; other top-level values
+are decoded and discarded.
+"""
+
+import codecs
+import json
+from typing import Any, List
+
+# Constants
+WHITESPACE = ' \t\n\r'
+NUMBER_CHARS = frozenset('.eE+-0123456789')
+COMPACT_THRESHOLD = 64 * 1024
+
+
+class _NeedMoreData(Exception):
+    """Raised when the buffered text ends inside a value."""
+
+
+class StreamingRecordDecoder:
+    """Push decoder returning array elements as soon as each one is complete."""
+
+    def __init__(self, key: str):
+        """Initialize the decoder for the array stored under ``key``."""
+        self.key = key
+        self.records_decoded = 0
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = 'start'
+        self._in_object = False
+        self._current_key = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the body and return the records completed by it."""
+        self._buffer += self._text.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Finish decoding, returning any remaining records.
+
+        Raises ValueError if the document is truncated or malformed.
+        """
+        self._buffer += self._text.decode(b'', final=True)
+        records = self._parse(final=True)
+        if self._state != 'done':
+            raise ValueError("Incomplete JSON document in streamed response")
+        return records
+
+    def _skip_whitespace(self) -> bool:
+        """Advance past whitespace; return False if the buffer is exhausted."""
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _decode_value(self, final: bool) -> Any:
+        """Decode the value at the current position, or raise _NeedMoreData if it is incomplete."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise ValueError("Malformed JSON document in streamed response")
+            raise _NeedMoreData
+        if not final and isinstance(value, (int, float)) and (
+                end == len(self._buffer) or self._buffer[end] in NUMBER_CHARS):
+            # A number cut short by the chunk boundary ("1." or "1e") may continue in the next chunk
+            raise _NeedMoreData
+        self._pos = end
+        return value
+
+    def _parse(self, final: bool) -> List[Any]:
+        """Run the state machine over the buffered text."""
+        records = []
+        try:
+            while self._skip_whitespace():
+                char = self._buffer[self._pos]
+                state = self._state
+
+                if state == 'start':
+                    if char == '{':
+                        self._in_object = True
+                        self._state = 'key'
+                    elif char == '[':
+                        self._state = 'item'
+                    else:
+                        raise ValueError("Streamed response is not a JSON object or array")
+                    self._pos += 1
+
+                elif state == 'key':
+                    if char == '}':
+                        self._state = 'done'
+                        self._pos += 1
+                    elif char == ',':
+                        self._pos += 1
+                    else:
+                        self._current_key = self._decode_value(final)
+                        self._state = 'colon'
+
+                elif state == 'colon':
+                    if char != ':':
+                        raise ValueError("Malformed JSON document in streamed response")
+                    self._state = 'value'
+                    self._pos += 1
+
+                elif state == 'value':
+                    if self._current_key == self.key and char == '[':
+                        self._state = 'item'
+                        self._pos += 1
+                    else:
+                        self._decode_value(final)
+                        self._state = 'key'
+
+                elif state == 'item':
+                    if char == ']':
+                        self._state = 'key' if self._in_object else 'done'
+                        self._pos += 1
+                    elif char == ',':
+                        self._pos += 1
+                    else:
+                        records.append(self._decode_value(final))
+                        self.records_decoded += 1
+
+                else:
+                    # Ignore trailing data after the document
+                    self._pos = len(self._buffer)
+        except _NeedMoreData:
+            pass
+
+        if self._pos > COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return records
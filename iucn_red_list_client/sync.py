@@ -0,0 +1,411 @@
+"""
+Local mirror of the latest IUCN Red List assessments.
+
+sync_mirror crawls collection endpoints (by default every kingdom) into a
+MirrorStore, an SQLite database of assessment summaries. Progress is
+checkpointed per collection after every page, so an interrupted sync resumes
+where it stopped. Refreshes are incremental:
+
+- If the Red List version (``get_information_red_list_version``) has not
+  changed since the last completed sync, no collection is fetched.
+- Otherwise each collection is re-fetched only for the ``year_published``
+  values from its last checkpoint onwards. Newer assessments replace older
+  ones for the same taxon and scope.
+
+A full re-crawl (``full=True``) also removes assessments that have
+disappeared from a collection.
+"""
+
+import datetime
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypedDict, Union
+from urllib.parse import urlencode
+
+from .client import page_records
+from .jsoncodec import JSONCodec, get_codec
+
+# Constants
+DEFAULT_MIRROR_PATH = Path.home() / '.cache' / 'iucn_red_list_client' / 'mirror.sqlite'
+DEFAULT_KINGDOMS = ('ANIMALIA', 'CHROMISTA', 'FUNGI', 'PLANTAE')
+KINGDOM_ENDPOINT = 'get_taxa_kingdom_kingdom_name'
+VERSION_ENDPOINT = 'get_information_red_list_version'
+
+# A collection endpoint and its parameters, e.g. ('get_countries_code', {'code': 'US'})
+Collection = Tuple[str, Dict[str, Any]]
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint(TypedDict):
+    """Sync progress of one collection."""
+    collection: str
+    endpoint: str
+    mode: str
+    sync_id: int
+    year: Optional[int]
+    next_page: int
+    max_year: Optional[int]
+    red_list_version: Optional[str]
+    complete: bool
+    records: int
+    updated: float
+
+
+class SyncStats(TypedDict):
+    """Summary of a sync run."""
+    red_list_version: Optional[str]
+    skipped: bool
+    collections_synced: int
+    collections_skipped: int
+    pages: int
+    records: int
+    removed: int
+    seconds: float
+
+
+def collection_key(endpoint_name: str, params: Dict[str, Any]) -> str:
+    """Return the identifier of a collection: endpoint name and sorted parameters."""
+    return f"{endpoint_name}?{urlencode(sorted((name, str(value)) for name, value in params.items()))}"
+
+
+def kingdom_collections(kingdoms: Iterable[str] = DEFAULT_KINGDOMS) -> List[Collection]:
+    """Return the per-kingdom collections that together cover every assessment."""
+    return [(KINGDOM_ENDPOINT, {'kingdom_name': kingdom}) for kingdom in kingdoms]
+
+
+def parse_red_list_version(result: Any) -> Optional[str]:
+    """Extract the version string from a ``get_information_red_list_version`` response."""
+    if isinstance(result, str):
+        return result
+    if isinstance(result, dict):
+        if 'red_list_version' in result:
+            return str(result['red_list_version'])
+        for value in result.values():
+            if isinstance(value, str):
+                return value
+    return None
+
+
+def _year(value: Any) -> Optional[int]:
+    """Return ``year_published`` as an integer, or None if it is not a year."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _scope_key(record: Dict[str, Any]) -> str:
+    """Return a key identifying the scopes (global, regional) of an assessment."""
+    scopes = record.get('scopes') or []
+    return ','.join(sorted(str(scope.get('code')) for scope in scopes if isinstance(scope, dict)))
+
+
+class MirrorStore:
+    """SQLite store of mirrored assessments and per-collection sync checkpoints."""
+
+    def __init__(self, path: Union[str, os.PathLike] = DEFAULT_MIRROR_PATH,
+                 codec: Optional[JSONCodec] = None):
+        """Initialize the store, creating the database file if needed."""
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or get_codec()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS assessments ("
+            " assessment_id INTEGER PRIMARY KEY,"
+            " sis_taxon_id INTEGER,"
+            " scientific_name TEXT,"
+            " scopes TEXT NOT NULL,"
+            " year_published INTEGER,"
+            " record TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS assessments_sis ON assessments (sis_taxon_id);"
+            "CREATE TABLE IF NOT EXISTS members ("
+            " collection TEXT NOT NULL,"
+            " assessment_id INTEGER NOT NULL,"
+            " sync_id INTEGER NOT NULL,"
+            " PRIMARY KEY (collection, assessment_id));"
+            "CREATE INDEX IF NOT EXISTS members_assessment ON members (assessment_id);"
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            " collection TEXT PRIMARY KEY,"
+            " endpoint TEXT NOT NULL,"
+            " mode TEXT NOT NULL,"
+            " sync_id INTEGER NOT NULL,"
+            " year INTEGER,"
+            " next_page INTEGER NOT NULL,"
+            " max_year INTEGER,"
+            " red_list_version TEXT,"
+            " complete INTEGER NOT NULL,"
+            " records INTEGER NOT NULL,"
+            " updated REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+        )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def red_list_version(self) -> Optional[str]:
+        """The Red List version of the last completed sync."""
+        with self._lock:
+            return self._get_meta('red_list_version')
+
+    def set_red_list_version(self, version: str) -> None:
+        """Record the Red List version of a completed sync."""
+        with self._lock:
+            self._set_meta('red_list_version', version)
+
+    def next_sync_id(self) -> int:
+        """Allocate an identifier for a new collection crawl."""
+        with self._lock:
+            sync_id = int(self._get_meta('sync_id') or 0) + 1
+            self._set_meta('sync_id', str(sync_id))
+            return sync_id
+
+    def checkpoint(self, collection: str) -> Optional[Checkpoint]:
+        """Return the checkpoint of a collection, or None if it was never synced."""
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM checkpoints WHERE collection = ?", (collection,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            checkpoint = dict(zip([column[0] for column in cursor.description], row))
+        checkpoint['complete'] = bool(checkpoint['complete'])
+        return checkpoint
+
+    def checkpoints(self) -> List[Checkpoint]:
+        """Return the checkpoints of every synced collection."""
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute("SELECT collection FROM checkpoints ORDER BY collection")]
+        return [self.checkpoint(key) for key in keys]
+
+    def save_checkpoint(self, checkpoint: Checkpoint) -> None:
+        """Store a checkpoint outside of a page write."""
+        with self._lock:
+            self._write_checkpoint(checkpoint)
+
+    def _write_checkpoint(self, checkpoint: Checkpoint) -> None:
+        """Insert or replace a checkpoint; the caller must hold the lock."""
+        columns = list(Checkpoint.__annotations__)
+        values = [checkpoint[column] for column in columns]
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO checkpoints ({', '.join(columns)})"
+            f" VALUES ({', '.join('?' for _ in columns)})",
+            [int(value) if isinstance(value, bool) else value for value in values]
+        )
+
+    def write_page(self, records: Sequence[Dict[str, Any]], checkpoint: Checkpoint) -> None:
+        """Store one page of a collection and advance its checkpoint atomically.
+
+        Each record replaces any other assessment of the same taxon and scope.
+        """
+        collection, sync_id = checkpoint['collection'], checkpoint['sync_id']
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for record in records:
+                    assessment_id = record.get('assessment_id')
+                    if assessment_id is None:
+                        continue
+                    sis_taxon_id = record.get('sis_taxon_id')
+                    scopes = _scope_key(record)
+                    if sis_taxon_id is not None:
+                        superseded = [row[0] for row in self._conn.execute(
+                            "SELECT assessment_id FROM assessments"
+                            " WHERE sis_taxon_id = ? AND scopes = ? AND assessment_id != ?",
+                            (sis_taxon_id, scopes, assessment_id)
+                        )]
+                        self._delete_assessments(superseded)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO assessments"
+                        " (assessment_id, sis_taxon_id, scientific_name, scopes, year_published, record)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (assessment_id, sis_taxon_id, record.get('taxon_scientific_name'), scopes,
+                         _year(record.get('year_published')), self.codec.dumps(record))
+                    )
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO members (collection, assessment_id, sync_id) VALUES (?, ?, ?)",
+                        (collection, assessment_id, sync_id)
+                    )
+                self._write_checkpoint(checkpoint)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _delete_assessments(self, assessment_ids: Sequence[int]) -> None:
+        """Delete assessments and their memberships; the caller must hold the lock."""
+        for assessment_id in assessment_ids:
+            self._conn.execute("DELETE FROM members WHERE assessment_id = ?", (assessment_id,))
+            self._conn.execute("DELETE FROM assessments WHERE assessment_id = ?", (assessment_id,))
+
+    def remove_stale(self, collection: str, sync_id: int) -> int:
+        """Drop members of a collection not seen by crawl ``sync_id`` and orphaned assessments.
+
+        Returns the number of assessments removed from the store.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM members WHERE collection = ? AND sync_id != ?",
+                                   (collection, sync_id))
+                removed = self._conn.execute(
+                    "DELETE FROM assessments WHERE assessment_id NOT IN (SELECT assessment_id FROM members)"
+                ).rowcount
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def get(self, assessment_id: int) -> Optional[Dict[str, Any]]:
+        """Return a mirrored assessment by id, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT record FROM assessments WHERE assessment_id = ?",
+                                     (assessment_id,)).fetchone()
+        return self.codec.loads(row[0]) if row else None
+
+    def by_sis_id(self, sis_id: int) -> List[Dict[str, Any]]:
+        """Return the mirrored assessments of a taxon."""
+        with self._lock:
+            rows = self._conn.execute("SELECT record FROM assessments WHERE sis_taxon_id = ?"
+                                      " ORDER BY assessment_id", (sis_id,)).fetchall()
+        return [self.codec.loads(row[0]) for row in rows]
+
+    def sis_ids(self) -> List[int]:
+        """Return the SIS ids of every mirrored taxon."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT sis_taxon_id FROM assessments"
+                                      " WHERE sis_taxon_id IS NOT NULL ORDER BY sis_taxon_id").fetchall()
+        return [row[0] for row in rows]
+
+    def scientific_names(self) -> List[str]:
+        """Return the scientific names of every mirrored taxon, e.g. to build a ``NameIndex``."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT scientific_name FROM assessments"
+                                      " WHERE scientific_name IS NOT NULL ORDER BY scientific_name").fetchall()
+        return [row[0] for row in rows]
+
+    def max_year(self, collection: str) -> Optional[int]:
+        """Return the newest ``year_published`` among a collection's assessments."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(a.year_published) FROM assessments a"
+                " JOIN members m ON m.assessment_id = a.assessment_id WHERE m.collection = ?",
+                (collection,)
+            ).fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM assessments").fetchone()[0]
+
+
+def sync_mirror(client: Any, store: MirrorStore, collections: Optional[Sequence[Collection]] = None,
+                full: bool = False, prefetch: int = 1) -> SyncStats:
+    """Bring the mirror up to date with the API.
+
+    ``collections`` defaults to every kingdom. With ``full=True`` every
+    collection is crawled from scratch and assessments no longer listed are
+    removed; otherwise unfinished crawls resume from their checkpoint and
+    finished ones are refreshed by ``year_published``.
+    """
+    started = time.perf_counter()
+    collections = list(collections) if collections is not None else kingdom_collections()
+    version = parse_red_list_version(client.call_endpoint(VERSION_ENDPOINT))
+    stats: SyncStats = {
+        'red_list_version': version,
+        'skipped': False,
+        'collections_synced': 0,
+        'collections_skipped': 0,
+        'pages': 0,
+        'records': 0,
+        'removed': 0,
+        'seconds': 0.0,
+    }
+
+    for endpoint_name, params in collections:
+        checkpoint = store.checkpoint(collection_key(endpoint_name, params))
+        up_to_date = (
+            not full and version is not None and checkpoint is not None
+            and checkpoint['complete'] and checkpoint['red_list_version'] == version
+        )
+        if up_to_date:
+            stats['collections_skipped'] += 1
+            continue
+        _sync_collection(client, store, endpoint_name, params, checkpoint, version, full, prefetch, stats)
+        stats['collections_synced'] += 1
+
+    stats['skipped'] = stats['collections_synced'] == 0
+    if version is not None:
+        store.set_red_list_version(version)
+    stats['seconds'] = time.perf_counter() - started
+    logger.info(f"Mirror sync finished: {stats}")
+    return stats
+
+
+def _sync_collection(client: Any, store: MirrorStore, endpoint_name: str, params: Dict[str, Any],
+                     checkpoint: Optional[Checkpoint], version: Optional[str], full: bool,
+                     prefetch: int, stats: SyncStats) -> None:
+    """Crawl or refresh one collection, checkpointing after every page."""
+    key = collection_key(endpoint_name, params)
+    resuming = checkpoint is not None and not checkpoint['complete'] and not full
+    if resuming:
+        logger.info(f"Resuming {checkpoint['mode']} sync of {key} at page {checkpoint['next_page']}")
+    else:
+        first_sync = full or checkpoint is None or checkpoint['max_year'] is None
+        checkpoint = {
+            'collection': key,
+            'endpoint': endpoint_name,
+            'mode': 'full' if first_sync else 'incremental',
+            'sync_id': store.next_sync_id(),
+            'year': None if first_sync else checkpoint['max_year'],
+            'next_page': 1,
+            'max_year': None if first_sync else checkpoint['max_year'],
+            'red_list_version': checkpoint['red_list_version'] if checkpoint else None,
+            'complete': False,
+            'records': 0,
+            'updated': time.time(),
+        }
+        store.save_checkpoint(checkpoint)
+
+    if checkpoint['mode'] == 'full':
+        passes = [None]
+    else:
+        passes = list(range(checkpoint['year'], datetime.date.today().year + 1))
+
+    for year in passes:
+        query = dict(params, latest='true')
+        if year is not None:
+            query['year_published'] = year
+            if checkpoint['year'] != year:
+                checkpoint.update(year=year, next_page=1)
+        page = checkpoint['next_page']
+        for result in client.iter_pages(endpoint_name, page=page, prefetch=prefetch, **query):
+            records = page_records(result)
+            page += 1
+            checkpoint.update(next_page=page, records=checkpoint['records'] + len(records), updated=time.time())
+            store.write_page(records, checkpoint)
+            stats['pages'] += 1
+            stats['records'] += len(records)
+
+    if checkpoint['mode'] == 'full':
+        stats['removed'] += store.remove_stale(key, checkpoint['sync_id'])
+    checkpoint.update(complete=True, red_list_version=version, max_year=store.max_year(key), updated=time.time())
+    store.save_checkpoint(checkpoint)
@@ -0,0 +1,68 @@
+"""
+Response compression negotiation and transfer accounting.
+
+The clients advertise every content coding their HTTP library can decode,
+most compact first: ``zstd`` (with the optional ``zstandard`` package),
+``br`` (with ``brotli`` or ``brotlicffi``), then ``gzip`` and ``deflate``.
+Large JSON collections typically shrink five- to tenfold on the wire.
+TransferMeter records, for every response, the bytes received on the wire
+and the bytes after decoding, so bandwidth savings can be checked.
+"""
+
+import logging
+import threading
+from typing import Any, Dict
+
+# Constants
+PREFERRED_ENCODINGS = ('zstd', 'br', 'gzip', 'deflate')
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+
+def negotiate_encodings(decodable: str) -> str:
+    """Return an ``Accept-Encoding`` value listing the preferred codings found in ``decodable``.
+
+    ``decodable`` is the comma-separated list of codings the HTTP library can
+    decode, as in its default ``Accept-Encoding`` header.
+    """
+    available = {token.strip().lower() for token in decodable.split(',')}
+    return ', '.join(encoding for encoding in PREFERRED_ENCODINGS if encoding in available)
+
+
+class TransferMeter:
+    """Thread-safe counters of wire and decoded response bytes, by content coding."""
+
+    def __init__(self):
+        """Initialize the counters."""
+        self._lock = threading.Lock()
+        self._encodings: Dict[str, Dict[str, int]] = {}
+
+    def record(self, url: str, encoding: str, wire_bytes: int, decoded_bytes: int) -> None:
+        """Count one response body."""
+        encoding = (encoding or 'identity').lower()
+        logger.debug(f"{url}: {wire_bytes} bytes on the wire, {decoded_bytes} decoded ({encoding})")
+        with self._lock:
+            counts = self._encodings.setdefault(encoding, {'responses': 0, 'wire_bytes': 0, 'decoded_bytes': 0})
+            counts['responses'] += 1
+            counts['wire_bytes'] += wire_bytes
+            counts['decoded_bytes'] += decoded_bytes
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        with self._lock:
+            self._encodings.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return response, wire byte and decoded byte totals, the bytes saved, and per-coding counts."""
+        with self._lock:
+            encodings = {encoding: dict(counts) for encoding, counts in self._encodings.items()}
+        wire_bytes = sum(counts['wire_bytes'] for counts in encodings.values())
+        decoded_bytes = sum(counts['decoded_bytes'] for counts in encodings.values())
+        return {
+            'responses': sum(counts['responses'] for counts in encodings.values()),
+            'wire_bytes': wire_bytes,
+            'decoded_bytes': decoded_bytes,
+            'saved_bytes': decoded_bytes - wire_bytes,
+            'encodings': encodings,
+        }
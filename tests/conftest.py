@@ -45,7 +45,7 @@ def mock_response():
     """Mock HTTP response."""
     response = Mock()
     response.status_code = 200
-    response.json.return_value = {"test": "data"}
+    response.content = b'{"test": "data"}'
     response.raise_for_status.return_value = None
     return response
 
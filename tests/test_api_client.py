@@ -1,8 +1,14 @@
 """Unit tests for the IUCN Red List API client."""
 
+import io
+import json
 import os
+import threading
+import time
 import pytest
+import requests
 from unittest.mock import Mock, patch, mock_open
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from iucn_red_list_client import IUCNRedListClient
@@ -47,6 +53,137 @@ class TestIUCNRedListClient:
             assert client.config["api_token"] == mock_api_token
             assert client.config["base_url"] == custom_url
 
+    @pytest.mark.unit
+    def test_default_pool_settings(self, mock_api_token):
+        """Test default connection pool and timeout settings."""
+        client = IUCNRedListClient(api_token=mock_api_token)
+        adapter = client.session.get_adapter('https://api.iucnredlist.org')
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 10
+        assert adapter._pool_block is False
+        assert client.timeout == (10.0, 30.0)
+
+    @pytest.mark.unit
+    def test_pool_settings_from_kwargs(self, mock_api_token):
+        """Test connection pool settings passed to the constructor."""
+        client = IUCNRedListClient(api_token=mock_api_token, pool_connections=4,
+                                   pool_maxsize=32, pool_block=True, timeout=12)
+        adapter = client.session.get_adapter('https://api.iucnredlist.org')
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+        assert client.timeout == (10.0, 12.0)
+
+    @pytest.mark.unit
+    def test_pool_settings_from_env(self, mock_api_token):
+        """Test connection pool settings from IUCN_* environment variables."""
+        with patch.dict(os.environ, {
+            "IUCN_API_TOKEN": mock_api_token,
+            "IUCN_POOL_CONNECTIONS": "2",
+            "IUCN_POOL_MAXSIZE": "64",
+            "IUCN_POOL_BLOCK": "true",
+            "IUCN_TIMEOUT": "5.5",
+        }):
+            client = IUCNRedListClient()
+        adapter = client.session.get_adapter('https://api.iucnredlist.org')
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is True
+        assert client.timeout == (5.5, 5.5)
+
+    @pytest.mark.unit
+    def test_kwargs_override_env(self, mock_api_token):
+        """Test that constructor settings apply on top of environment configuration."""
+        with patch.dict(os.environ, {"IUCN_API_TOKEN": mock_api_token, "IUCN_POOL_MAXSIZE": "64"}):
+            client = IUCNRedListClient(pool_maxsize=32, pool_block=True, timeout=60,
+                                       rate_limit=5, timeouts={'Taxa': 120})
+        adapter = client.session.get_adapter('https://api.iucnredlist.org')
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert client.timeout == (10.0, 60.0)
+        assert client.rate_limiter.max_rate == 5.0
+        assert client.timeout_for('get_taxa_sis_sis_id') == (10.0, 120.0)
+        assert client.session.headers['Authorization'] == mock_api_token
+
+    @pytest.mark.unit
+    def test_kwargs_keep_config_file(self, tmp_path):
+        """Test that constructor settings do not discard the config file."""
+        config_file = tmp_path / 'config.json'
+        config_file.write_text('{"api_token": "from_file", "timeout": 20}')
+        client = IUCNRedListClient(config_file=str(config_file), pool_maxsize=8)
+        assert client.config == {'api_token': 'from_file', 'timeout': 20, 'pool_maxsize': 8}
+        assert client.session.headers['Authorization'] == 'from_file'
+
+    @pytest.mark.unit
+    def test_explicit_api_token_wins(self, tmp_path):
+        """Test that an api_token keyword argument overrides the environment and config file."""
+        config_file = tmp_path / 'config.json'
+        config_file.write_text('{"api_token": "from_file"}')
+        client = IUCNRedListClient(config_file=str(config_file), api_token='explicit')
+        assert client.session.headers['Authorization'] == 'explicit'
+        with patch.dict(os.environ, {"IUCN_API_TOKEN": "from_env"}):
+            client = IUCNRedListClient(api_token='explicit')
+        assert client.session.headers['Authorization'] == 'explicit'
+
+    @pytest.mark.unit
+    def test_pool_capacity_warning(self, mock_api_token, caplog):
+        """Test that oversubscribing the pool is reported."""
+        client = IUCNRedListClient(api_token=mock_api_token, pool_maxsize=4)
+        with patch.object(client, 'call_endpoint', return_value={}):
+            client.lookup_species_bulk([f"Genus species{i}" for i in range(40)], max_workers=8)
+        assert caplog.text.count("exceed pool_maxsize=4") == 1
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_make_request_uses_configured_timeout(self, mock_request, mock_api_token, mock_response):
+        """Test that requests use the configured timeout."""
+        mock_request.return_value = mock_response
+        client = IUCNRedListClient(api_token=mock_api_token, timeout=7)
+        client._make_request("GET", "/test/path")
+        assert mock_request.call_args.kwargs['timeout'] == (7.0, 7.0)
+
+    @pytest.mark.unit
+    def test_split_timeouts(self, mock_api_token):
+        """Test separate connect and read timeouts."""
+        client = IUCNRedListClient(api_token=mock_api_token, connect_timeout=3, read_timeout=90)
+        assert client.timeout == (3.0, 90.0)
+
+    @pytest.mark.unit
+    def test_split_timeouts_from_env(self, mock_api_token):
+        """Test connect and read timeouts from environment variables."""
+        with patch.dict(os.environ, {
+            "IUCN_API_TOKEN": mock_api_token,
+            "IUCN_CONNECT_TIMEOUT": "2",
+            "IUCN_READ_TIMEOUT": "45",
+        }):
+            client = IUCNRedListClient()
+        assert client.timeout == (2.0, 45.0)
+
+    @pytest.mark.unit
+    def test_timeout_overrides_by_endpoint_and_tag(self, mock_api_token):
+        """Test per-endpoint and per-tag timeout overrides."""
+        client = IUCNRedListClient(api_token=mock_api_token, timeouts={
+            'get_countries_code': 120,
+            'Countries': [5, 60],
+        })
+        assert client.timeout_for('get_countries_code') == (10.0, 120.0)
+        assert client.timeout_for('get_countries') == (5.0, 60.0)
+        assert client.timeout_for('get_habitats') == (10.0, 30.0)
+        assert client.timeout_for('get_countries_code', timeout=(1, 2)) == (1.0, 2.0)
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_call_endpoint_timeout_argument(self, mock_request, mock_api_token, mock_response):
+        """Test that a per-call timeout reaches the request and is not sent as a parameter."""
+        mock_request.return_value = mock_response
+        client = IUCNRedListClient(api_token=mock_api_token, timeouts={'get_countries_code': 120})
+        client.call_endpoint('get_countries_code', code='US')
+        assert mock_request.call_args.kwargs['timeout'] == (10.0, 120.0)
+        client.call_endpoint('get_countries_code', code='US', timeout=5)
+        assert mock_request.call_args.kwargs['timeout'] == (10.0, 5.0)
+        assert 'timeout' not in mock_request.call_args.kwargs.get('params', {})
+
     @pytest.mark.unit
     def test_no_config_found(self):
         """Test client initialization with no configuration."""
@@ -79,7 +216,7 @@ class TestIUCNRedListClient:
     @patch('iucn_red_list_client.client.IUCNRedListClient._make_request')
     def test_call_endpoint_success(self, mock_make_request, client_with_mock_config, mock_response):
         """Test successful endpoint call."""
-        mock_response.json.return_value = {"result": "success"}
+        mock_response.content = b'{"result": "success"}'
         mock_make_request.return_value = mock_response
         
         result = client_with_mock_config.call_endpoint('get_countries')
@@ -97,7 +234,7 @@ class TestIUCNRedListClient:
     @patch('iucn_red_list_client.client.IUCNRedListClient._make_request')
     def test_call_endpoint_with_path_params(self, mock_make_request, client_with_mock_config, mock_response):
         """Test endpoint call with path parameters."""
-        mock_response.json.return_value = {"result": "success"}
+        mock_response.content = b'{"result": "success"}'
         mock_make_request.return_value = mock_response
         
         result = client_with_mock_config.call_endpoint('get_countries_code', code='US')
@@ -115,7 +252,7 @@ class TestIUCNRedListClient:
     @patch('iucn_red_list_client.client.IUCNRedListClient._make_request')
     def test_call_endpoint_with_query_params(self, mock_make_request, client_with_mock_config, mock_response):
         """Test endpoint call with query parameters."""
-        mock_response.json.return_value = {"result": "success"}
+        mock_response.content = b'{"result": "success"}'
         mock_make_request.return_value = mock_response
         
         result = client_with_mock_config.call_endpoint('get_taxa_scientific_name', 
@@ -131,6 +268,430 @@ class TestIUCNRedListClient:
             client_with_mock_config.call_endpoint('get_taxa_scientific_name', genus_name='Test')
 
 
+def _make_page(count, start=0):
+    """Build a fake page of assessment records."""
+    return {'assessments': [{'assessment_id': start + i} for i in range(count)]}
+
+
+class TestPagination:
+    """Test cases for the pagination iterators."""
+
+    @pytest.mark.unit
+    def test_iter_pages_stops_on_short_page(self, client_with_mock_config):
+        """Test that iteration stops after a short page."""
+        pages = [_make_page(100), _make_page(100, 100), _make_page(42, 200)]
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=pages) as mock_call:
+            result = list(client_with_mock_config.iter_pages('get_countries_code', code='US'))
+
+        assert len(result) == 3
+        assert [c.kwargs['page'] for c in mock_call.call_args_list] == [1, 2, 3]
+        assert all(c.kwargs['code'] == 'US' for c in mock_call.call_args_list)
+
+    @pytest.mark.unit
+    def test_iter_pages_stops_on_empty_page(self, client_with_mock_config):
+        """Test that iteration stops after an empty page."""
+        pages = [_make_page(100), _make_page(0)]
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=pages) as mock_call:
+            result = list(client_with_mock_config.iter_pages('get_taxa_kingdom_kingdom_name',
+                                                            kingdom_name='PLANTAE'))
+
+        assert len(result) == 2
+        assert mock_call.call_count == 2
+
+    @pytest.mark.unit
+    def test_iter_pages_custom_start_page(self, client_with_mock_config):
+        """Test starting iteration from a later page."""
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value=_make_page(5)) as mock_call:
+            list(client_with_mock_config.iter_pages('get_habitats_code', code='1_1', page='7'))
+
+        assert mock_call.call_args.kwargs['page'] == 7
+
+    @pytest.mark.unit
+    def test_iter_records(self, client_with_mock_config):
+        """Test that records are streamed across pages in order."""
+        pages = [_make_page(100), _make_page(3, 100)]
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=pages):
+            records = list(client_with_mock_config.iter_records('get_countries_code', code='US'))
+
+        assert [r['assessment_id'] for r in records] == list(range(103))
+
+    @pytest.mark.unit
+    def test_iter_pages_is_lazy(self, client_with_mock_config):
+        """Test that pages are only fetched as they are consumed."""
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value=_make_page(100)) as mock_call:
+            iterator = client_with_mock_config.iter_pages('get_countries_code', code='US')
+            next(iterator)
+            next(iterator)
+
+        assert mock_call.call_count == 2
+
+    @pytest.mark.unit
+    def test_iter_pages_not_paginated(self, client_with_mock_config):
+        """Test that non-paginated endpoints are rejected."""
+        with pytest.raises(ValueError, match="not paginated"):
+            list(client_with_mock_config.iter_pages('get_countries'))
+
+    @pytest.mark.unit
+    def test_iter_pages_unknown_endpoint(self, client_with_mock_config):
+        """Test that unknown endpoints are rejected."""
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            list(client_with_mock_config.iter_pages('unknown_endpoint'))
+
+
+def _streamed_response(document):
+    """Build an unread requests.Response whose body is ``document`` as JSON."""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(document).encode())
+    return response
+
+
+class TestStreaming:
+    """Test cases for streamed decoding of responses."""
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_call_endpoint_stream(self, mock_request, client_with_mock_config):
+        """Test that records are decoded before the body is fully read."""
+        page = {'assessments': [{'assessment_id': i, 'notes': 'x' * 1000} for i in range(300)]}
+        response = _streamed_response(page)
+        response.close = Mock()
+        mock_request.return_value = response
+
+        records = client_with_mock_config.call_endpoint('get_countries_code', code='US', stream=True)
+        assert mock_request.call_args.kwargs['stream'] is True
+        first = next(records)
+        assert first['assessment_id'] == 0
+        assert response.raw.tell() < len(response.raw.getvalue())
+
+        rest = list(records)
+        assert [r['assessment_id'] for r in rest] == list(range(1, 300))
+        response.close.assert_called_once()
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_call_endpoint_stream_raises_http_errors_eagerly(self, mock_request, client_with_mock_config):
+        """Test that HTTP errors surface from the call, not from iteration."""
+        response = _streamed_response({'error': 'not found'})
+        response.status_code = 404
+        mock_request.return_value = response
+
+        with pytest.raises(requests.HTTPError):
+            client_with_mock_config.call_endpoint('get_countries_code', code='XX', stream=True)
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_call_endpoint_stream_bypasses_caches(self, mock_request, mock_api_token):
+        """Test that streamed calls neither read nor fill the caches."""
+        from iucn_red_list_client import MemoryCache
+        memory_cache = MemoryCache()
+        client = IUCNRedListClient(api_token=mock_api_token, memory_cache=memory_cache)
+        mock_request.side_effect = [_streamed_response(_make_page(2)), _streamed_response(_make_page(2))]
+
+        assert len(list(client.call_endpoint('get_countries_code', code='US', stream=True))) == 2
+        assert len(list(client.call_endpoint('get_countries_code', code='US', stream=True))) == 2
+        assert mock_request.call_count == 2
+        assert len(memory_cache) == 0
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_iter_records_stream(self, mock_request, client_with_mock_config):
+        """Test streamed iteration across pages."""
+        mock_request.side_effect = [
+            _streamed_response(_make_page(100)),
+            _streamed_response(_make_page(7, 100)),
+        ]
+
+        records = list(client_with_mock_config.iter_records('get_countries_code', code='US', stream=True))
+        assert [r['assessment_id'] for r in records] == list(range(107))
+        assert [c.kwargs['params']['page'] for c in mock_request.call_args_list] == [1, 2]
+
+    @pytest.mark.unit
+    def test_iter_records_stream_rejects_prefetch(self, client_with_mock_config):
+        """Test that streaming cannot be combined with prefetch."""
+        with pytest.raises(ValueError, match="prefetch"):
+            list(client_with_mock_config.iter_records('get_countries_code', code='US',
+                                                      stream=True, prefetch=4))
+
+
+class TestPrefetchPagination:
+    """Test cases for concurrent page prefetching."""
+
+    @staticmethod
+    def _fake_collection(total_pages, last_count=10, delay=0.0):
+        """Build a thread-safe fake call_endpoint serving a fixed collection."""
+        requested = []
+        lock = threading.Lock()
+
+        def fake_call(endpoint_name, page, **kwargs):
+            with lock:
+                requested.append(page)
+            time.sleep(delay)
+            if page < total_pages:
+                return _make_page(100, (page - 1) * 100)
+            if page == total_pages:
+                return _make_page(last_count, (page - 1) * 100)
+            return _make_page(0)
+
+        return fake_call, requested
+
+    @pytest.mark.unit
+    def test_prefetch_yields_pages_in_order(self, client_with_mock_config):
+        """Test that prefetched pages are yielded in page order."""
+        fake_call, _ = self._fake_collection(total_pages=12, delay=0.01)
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            records = list(client_with_mock_config.iter_records('get_taxa_class_class_name',
+                                                              class_name='INSECTA', prefetch=4))
+
+        assert [r['assessment_id'] for r in records] == list(range(1110))
+
+    @pytest.mark.unit
+    def test_prefetch_bounds_wasted_requests(self, client_with_mock_config):
+        """Test that few requests are issued past the last page."""
+        fake_call, requested = self._fake_collection(total_pages=20)
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            list(client_with_mock_config.iter_pages('get_countries_code', code='US', prefetch=4))
+
+        assert sorted(requested)[:20] == list(range(1, 21))
+        assert len(requested) <= 20 + 3
+
+    @pytest.mark.unit
+    def test_prefetch_single_page_collection(self, client_with_mock_config):
+        """Test that a one-page collection issues a single request."""
+        fake_call, requested = self._fake_collection(total_pages=1)
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            pages = list(client_with_mock_config.iter_pages('get_countries_code', code='US', prefetch=8))
+
+        assert len(pages) == 1
+        assert requested == [1]
+
+    @pytest.mark.unit
+    def test_prefetch_stats(self, client_with_mock_config):
+        """Test that prefetch statistics are recorded."""
+        fake_call, _ = self._fake_collection(total_pages=16, delay=0.02)
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            list(client_with_mock_config.iter_pages('get_countries_code', code='US', prefetch=4))
+
+        stats = client_with_mock_config.pagination_stats
+        assert stats['prefetch'] == 4
+        assert stats['pages_fetched'] >= 16
+        assert 1 < stats['max_in_flight'] <= 4
+        assert stats['saved_seconds'] > 0
+        assert stats['fetch_seconds'] > stats['elapsed_seconds']
+
+    @pytest.mark.unit
+    def test_sequential_stats(self, client_with_mock_config):
+        """Test that sequential walks also record statistics."""
+        fake_call, _ = self._fake_collection(total_pages=3)
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            list(client_with_mock_config.iter_pages('get_countries_code', code='US'))
+
+        stats = client_with_mock_config.pagination_stats
+        assert stats['pages_fetched'] == 3
+        assert stats['max_in_flight'] == 1
+
+    @pytest.mark.unit
+    def test_prefetch_propagates_errors(self, client_with_mock_config):
+        """Test that a failing page fetch is raised to the caller."""
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError, match="boom"):
+                list(client_with_mock_config.iter_pages('get_countries_code', code='US', prefetch=3))
+
+    @pytest.mark.unit
+    def test_prefetch_invalid(self, client_with_mock_config):
+        """Test that a non-positive prefetch depth is rejected."""
+        with pytest.raises(ValueError, match="prefetch"):
+            list(client_with_mock_config.iter_pages('get_countries_code', code='US', prefetch=0))
+
+
+class TestBulkLookup:
+    """Test cases for bulk species lookups."""
+
+    @pytest.mark.unit
+    def test_bulk_results_in_input_order(self, client_with_mock_config):
+        """Test that results are returned in input order."""
+        def fake_call(endpoint_name, genus_name, species_name):
+            time.sleep(0.01 if genus_name == 'Quercus' else 0)
+            return {'taxon': {'scientific_name': f"{genus_name} {species_name}"}}
+
+        names = ['Quercus alba', ('Acer', 'rubrum'), 'Pinus strobus']
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            results = client_with_mock_config.lookup_species_bulk(names, max_workers=3)
+
+        assert [r['result']['taxon']['scientific_name'] for r in results] == [
+            'Quercus alba', 'Acer rubrum', 'Pinus strobus'
+        ]
+        assert all(r['error'] is None for r in results)
+
+    @pytest.mark.unit
+    def test_bulk_deduplicates_pairs(self, client_with_mock_config):
+        """Test that duplicate genus/species pairs are fetched once."""
+        names = ['Quercus alba', 'quercus ALBA', ('Quercus', 'alba'), 'Acer rubrum']
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value={'ok': True}) as mock_call:
+            results = client_with_mock_config.lookup_species_bulk(names)
+
+        assert mock_call.call_count == 2
+        assert len(results) == 4
+        # Names given as strings are parsed and their case normalized
+        assert (results[1]['genus_name'], results[1]['species_name']) == ('Quercus', 'alba')
+
+    @pytest.mark.unit
+    def test_bulk_keeps_infraspecific_names(self, client_with_mock_config):
+        """Test that subspecies are looked up and deduplicated apart from their species."""
+        names = ['Panthera leo persica', ('Panthera', 'leo', 'Persica'), 'Panthera leo', 'Quercus alba var. minor']
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value={'ok': True}) as mock_call:
+            results = client_with_mock_config.lookup_species_bulk(names, max_workers=1)
+
+        calls = sorted(tuple(sorted(call.kwargs.items())) for call in mock_call.call_args_list)
+        assert calls == [
+            (('genus_name', 'Panthera'), ('infra_name', 'persica'), ('species_name', 'leo')),
+            (('genus_name', 'Panthera'), ('species_name', 'leo')),
+            (('genus_name', 'Quercus'), ('infra_name', 'minor'), ('species_name', 'alba')),
+        ]
+        assert [result['infra_name'] for result in results] == ['persica', 'Persica', None, 'minor']
+
+    @pytest.mark.unit
+    def test_bulk_per_item_errors(self, client_with_mock_config):
+        """Test that failures are reported per item instead of raised."""
+        def fake_call(endpoint_name, genus_name, species_name):
+            if genus_name == 'Unknown':
+                raise Exception("404 Client Error")
+            return {'ok': True}
+
+        names = ['Unknown species', 'Quercus', 'Quercus alba']
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            results = client_with_mock_config.lookup_species_bulk(names)
+
+        assert results[0]['result'] is None
+        assert '404' in results[0]['error']
+        assert results[1]['error'] == 'Invalid species name'
+        assert results[2]['result'] == {'ok': True}
+
+    @pytest.mark.unit
+    def test_bulk_bounded_parallelism(self, client_with_mock_config):
+        """Test that at most max_workers lookups run at once."""
+        state = {'in_flight': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def fake_call(endpoint_name, genus_name, species_name):
+            with lock:
+                state['in_flight'] += 1
+                state['peak'] = max(state['peak'], state['in_flight'])
+            time.sleep(0.01)
+            with lock:
+                state['in_flight'] -= 1
+            return {}
+
+        names = [f"Genus species{i}" for i in range(30)]
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            client_with_mock_config.lookup_species_bulk(names, max_workers=4)
+
+        assert 1 < state['peak'] <= 4
+
+    @pytest.mark.unit
+    def test_bulk_rate_limit(self, client_with_mock_config):
+        """Test that the rate limit spaces out requests."""
+        names = [f"Genus species{i}" for i in range(6)]
+        started = time.monotonic()
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value={}):
+            client_with_mock_config.lookup_species_bulk(names, max_workers=6, rate_limit=50)
+
+        assert time.monotonic() - started >= 5 / 50 * 0.9
+
+    @pytest.mark.unit
+    def test_bulk_empty(self, client_with_mock_config):
+        """Test bulk lookup with no names."""
+        assert client_with_mock_config.lookup_species_bulk([]) == []
+
+    @pytest.mark.unit
+    def test_iter_bulk_yields_in_completion_order(self, client_with_mock_config):
+        """Test that results are yielded as lookups complete, with their input index."""
+        def fake_call(endpoint_name, genus_name, species_name):
+            time.sleep(0.05 if genus_name == 'Quercus' else 0)
+            return {'name': f"{genus_name} {species_name}"}
+
+        names = ['Quercus alba', 'Acer rubrum', 'Bad', 'acer RUBRUM']
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            results = list(client_with_mock_config.iter_species_bulk(names, max_workers=2))
+
+        indexes = [index for index, _ in results]
+        assert indexes[0] == 2
+        assert sorted(indexes) == [0, 1, 2, 3]
+        assert indexes[-1] == 0
+        assert dict(results)[3]['result'] == {'name': 'Acer rubrum'}
+
+    @pytest.mark.unit
+    def test_iter_bulk_dedupe_window(self, client_with_mock_config):
+        """Test that only the last dedupe_size outcomes are reused."""
+        names = ['Aa bb', 'Cc dd', 'Ee ff', 'Aa bb']
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value={}) as mock_call:
+            list(client_with_mock_config.iter_species_bulk(names, max_workers=1, dedupe_size=1))
+        assert mock_call.call_count == 4
+
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value={}) as mock_call:
+            list(client_with_mock_config.iter_species_bulk(names, max_workers=1, dedupe_size=None))
+        assert mock_call.call_count == 3
+
+    @pytest.mark.unit
+    def test_iter_bulk_consumes_names_lazily(self, client_with_mock_config):
+        """Test that only a bounded number of names is read ahead."""
+        consumed = []
+
+        def names():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"Genus species{i}"
+
+        with patch.object(client_with_mock_config, 'call_endpoint', return_value={}):
+            iterator = client_with_mock_config.iter_species_bulk(names(), max_workers=2)
+            next(iterator)
+            assert len(consumed) <= 5
+            iterator.close()
+        assert len(consumed) < 1000
+
+    @pytest.mark.unit
+    def test_iter_bulk_read_ahead_waits_for_slow_lookup(self, client_with_mock_config):
+        """Test that duplicates and cached names do not run ahead of a slow lookup unbounded."""
+        consumed = []
+
+        def names():
+            yield 'Slow species'
+            for i in range(100000):
+                consumed.append(i)
+                yield 'Quick species'
+
+        def fake_call(endpoint_name, genus_name, species_name):
+            time.sleep(0.2 if genus_name == 'Slow' else 0)
+            return {}
+
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=fake_call):
+            for index, _ in client_with_mock_config.iter_species_bulk(names(), max_workers=2, read_ahead=50):
+                if index == 0:
+                    break
+        assert len(consumed) <= 50
+
+    @pytest.mark.unit
+    def test_iter_bulk_close_cancels_queued_lookups(self, client_with_mock_config):
+        """Test that closing early cancels queued lookups without Python 3.9-only shutdown arguments."""
+        calls = []
+
+        def slow_call(*args, **kwargs):
+            calls.append(kwargs)
+            time.sleep(0.02)
+            return {}
+
+        names = [f"Genus species{i}" for i in range(50)]
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=slow_call), \
+                patch.object(ThreadPoolExecutor, 'shutdown', autospec=True,
+                             side_effect=ThreadPoolExecutor.shutdown) as shutdown:
+            iterator = client_with_mock_config.iter_species_bulk(names, max_workers=1)
+            next(iterator)
+            iterator.close()
+
+        assert shutdown.call_args.kwargs == {'wait': True}
+        assert len(calls) < 10
+
+
 class TestHelperFunctions:
     """Test cases for helper functions."""
 
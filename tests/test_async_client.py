@@ -0,0 +1,228 @@
+"""Tests for the asyncio API client."""
+
+import asyncio
+import gzip
+import json
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from iucn_red_list_client import AsyncIUCNRedListClient, SingleFlight, TokenBucket
+
+
+def _make_client(handler, **kwargs):
+    """Create an async client backed by a mock transport."""
+    return AsyncIUCNRedListClient(
+        api_token="test_token_12345",
+        transport=httpx.MockTransport(handler),
+        **kwargs
+    )
+
+
+def _page(count, start=0):
+    """Build a fake page of assessment records."""
+    return {'assessments': [{'assessment_id': start + i} for i in range(count)]}
+
+
+class TestAsyncIUCNRedListClient:
+    """Test cases for AsyncIUCNRedListClient."""
+
+    @pytest.mark.unit
+    def test_call_endpoint_resolves_path_and_query(self):
+        """Test that paths and query params are resolved from the registry."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"result": "success"})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.call_endpoint('get_taxa_scientific_name',
+                                                  genus_name='Panthera', species_name='leo')
+
+        assert asyncio.run(run()) == {"result": "success"}
+        request = seen[0]
+        assert request.url.path == '/api/v4/taxa/scientific_name'
+        assert dict(request.url.params) == {'genus_name': 'Panthera', 'species_name': 'leo'}
+        assert request.headers['Authorization'] == 'test_token_12345'
+
+    @pytest.mark.unit
+    def test_call_endpoint_path_params(self):
+        """Test endpoint call with path parameters."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.path)
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with _make_client(handler) as client:
+                await client.call_endpoint('get_countries_code', code='US')
+
+        asyncio.run(run())
+        assert seen == ['/api/v4/countries/US']
+
+    @pytest.mark.unit
+    def test_call_endpoint_timeouts(self):
+        """Test that configured and per-call timeouts reach the transport."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.extensions['timeout'])
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with _make_client(handler, connect_timeout=3,
+                                    timeouts={'Countries': 90}) as client:
+                await client.call_endpoint('get_habitats')
+                await client.call_endpoint('get_countries')
+                await client.call_endpoint('get_countries', timeout=(1, 2))
+
+        asyncio.run(run())
+        assert (seen[0]['connect'], seen[0]['read']) == (3.0, 30.0)
+        assert (seen[1]['connect'], seen[1]['read']) == (3.0, 90.0)
+        assert (seen[2]['connect'], seen[2]['read']) == (1.0, 2.0)
+
+    @pytest.mark.unit
+    def test_call_endpoint_validation(self):
+        """Test that endpoint validation matches the sync client."""
+        async def run(name, **kwargs):
+            async with _make_client(lambda request: httpx.Response(200, json={})) as client:
+                await client.call_endpoint(name, **kwargs)
+
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            asyncio.run(run('unknown_endpoint'))
+        with pytest.raises(ValueError, match="Missing required path parameter"):
+            asyncio.run(run('get_countries_code'))
+        with pytest.raises(ValueError, match="Missing required query parameter"):
+            asyncio.run(run('get_taxa_scientific_name', genus_name='Test'))
+
+    @pytest.mark.unit
+    def test_http_error_raised(self):
+        """Test that HTTP errors are raised to the caller."""
+        async def run():
+            async with _make_client(lambda request: httpx.Response(404)) as client:
+                await client.call_endpoint('get_countries')
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    @pytest.mark.unit
+    def test_retry_on_throttle(self):
+        """Test that throttled responses are retried after Retry-After."""
+        responses = [
+            httpx.Response(429, headers={'Retry-After': '0'}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+
+        async def run():
+            async with _make_client(lambda request: responses.pop(0)) as client:
+                return await client.call_endpoint('get_countries')
+
+        assert asyncio.run(run()) == {"ok": True}
+
+    @pytest.mark.unit
+    def test_retry_on_throttle_with_rate_limiter(self):
+        """Test that throttled responses slow down a shared rate limiter."""
+        responses = [
+            httpx.Response(429, headers={'Retry-After': '0'}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+        bucket = TokenBucket(1000.0, burst=10)
+
+        async def run():
+            async with _make_client(lambda request: responses.pop(0), rate_limiter=bucket) as client:
+                return await client.call_endpoint('get_countries')
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert bucket.throttle_count == 1
+
+    @pytest.mark.unit
+    def test_async_pagination(self):
+        """Test that async iteration walks pages until a short page."""
+        def handler(request):
+            page = int(request.url.params['page'])
+            count = 100 if page < 3 else 7
+            return httpx.Response(200, content=json.dumps(_page(count, (page - 1) * 100)))
+
+        async def run():
+            async with _make_client(handler) as client:
+                return [record async for record in client.iter_records('get_countries_code', code='US')]
+
+        records = asyncio.run(run())
+        assert [r['assessment_id'] for r in records] == list(range(207))
+
+    @pytest.mark.unit
+    def test_async_pagination_not_paginated(self):
+        """Test that non-paginated endpoints are rejected."""
+        async def run():
+            async with _make_client(lambda request: httpx.Response(200, json={})) as client:
+                async for _ in client.iter_pages('get_countries'):
+                    pass
+
+        with pytest.raises(ValueError, match="not paginated"):
+            asyncio.run(run())
+
+    @pytest.mark.unit
+    def test_concurrency_is_bounded(self):
+        """Test that the semaphore bounds requests in flight."""
+        state = {'in_flight': 0, 'peak': 0}
+
+        async def handler(request):
+            state['in_flight'] += 1
+            state['peak'] = max(state['peak'], state['in_flight'])
+            await asyncio.sleep(0.01)
+            state['in_flight'] -= 1
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with _make_client(handler, max_concurrency=5) as client:
+                await asyncio.gather(*(client.call_endpoint('get_taxa_sis_sis_id', sis_id=i)
+                                       for i in range(40)))
+
+        asyncio.run(run())
+        assert 1 < state['peak'] <= 5
+
+    @pytest.mark.unit
+    def test_identical_calls_are_coalesced(self):
+        """Test that concurrent identical calls share one request and result."""
+        paths = []
+
+        async def handler(request):
+            paths.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={'taxon': {'sis_id': int(request.url.path.rsplit('/', 1)[1])}})
+
+        async def run():
+            async with _make_client(handler, single_flight=SingleFlight()) as client:
+                results = await asyncio.gather(*(client.call_endpoint('get_taxa_sis_sis_id', sis_id=i % 2)
+                                                 for i in range(10)))
+                return results, client.single_flight.stats()
+
+        results, stats = asyncio.run(run())
+        assert len(paths) == 2
+        assert results[0] is results[2] and results[1]['taxon']['sis_id'] == 1
+        assert stats == {'calls': 10, 'coalesced': 8, 'in_flight': 0}
+
+    @pytest.mark.unit
+    def test_transfer_accounting(self):
+        """Test that compressed responses are counted on the wire and decoded."""
+        body = json.dumps({'assessments': [{'assessment_id': i} for i in range(200)]}).encode()
+        compressed = gzip.compress(body)
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers['Accept-Encoding'])
+            return httpx.Response(200, stream=httpx.ByteStream(compressed), headers={'Content-Encoding': 'gzip'})
+
+        async def run():
+            async with _make_client(handler) as client:
+                result = await client.call_endpoint('get_countries_code', code='US')
+                return result, client.transfer.stats()
+
+        result, stats = asyncio.run(run())
+        assert len(result['assessments']) == 200
+        assert 'gzip' in seen[0]
+        assert stats['encodings']['gzip'] == {'responses': 1, 'wire_bytes': len(compressed),
+                                              'decoded_bytes': len(body)}
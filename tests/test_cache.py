@@ -0,0 +1,434 @@
+"""Tests for response caching."""
+
+import json
+import sqlite3
+import threading
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from iucn_red_list_client import IUCNRedListClient
+from iucn_red_list_client.cache import MemoryCache, SQLiteCache, make_cache_key
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    """Create an SQLite cache in a temporary directory."""
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    yield cache
+    cache.close()
+
+
+def _json_response(data):
+    """Build a mock response carrying a JSON body."""
+    body = json.dumps(data).encode()
+    response = Mock(status_code=200, headers={})
+    response.content = body
+    return response
+
+
+class TestCacheKey:
+    """Test cases for cache key construction."""
+
+    @pytest.mark.unit
+    def test_params_are_sorted(self):
+        """Test that parameter order does not affect the key."""
+        first = make_cache_key('get', '/api/v4/countries/US', {'page': 2, 'latest': True})
+        second = make_cache_key('GET', '/api/v4/countries/US', {'latest': True, 'page': 2})
+        assert first == second
+
+    @pytest.mark.unit
+    def test_distinct_requests(self):
+        """Test that different paths and params produce different keys."""
+        assert make_cache_key('GET', '/a', {'page': 1}) != make_cache_key('GET', '/a', {'page': 2})
+        assert make_cache_key('GET', '/a') != make_cache_key('GET', '/b')
+
+
+class TestSQLiteCache:
+    """Test cases for SQLiteCache."""
+
+    @pytest.mark.unit
+    def test_set_and_get(self, sqlite_cache):
+        """Test storing and retrieving a body."""
+        sqlite_cache.set('key', b'{"a": 1}', 60)
+        assert sqlite_cache.get('key') == b'{"a": 1}'
+        assert sqlite_cache.get('missing') is None
+        assert sqlite_cache.cache_info()['hits'] == 1
+        assert sqlite_cache.cache_info()['misses'] == 1
+
+    @pytest.mark.unit
+    def test_expiry(self, sqlite_cache):
+        """Test that expired entries are treated as misses."""
+        with patch('iucn_red_list_client.cache.time.time', return_value=1000.0):
+            sqlite_cache.set('key', b'data', 10)
+        with patch('iucn_red_list_client.cache.time.time', return_value=1005.0):
+            assert sqlite_cache.get('key') == b'data'
+        with patch('iucn_red_list_client.cache.time.time', return_value=1011.0):
+            assert sqlite_cache.get('key') is None
+        assert len(sqlite_cache) == 0
+
+    @pytest.mark.unit
+    def test_lru_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted over the byte budget."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite", max_bytes=250)
+        clock = {'now': 1000.0}
+
+        def tick():
+            clock['now'] += 1
+            return clock['now']
+
+        with patch('iucn_red_list_client.cache.time.time', side_effect=tick):
+            cache.set('a', b'x' * 100, 60)
+            cache.set('b', b'x' * 100, 60)
+            cache.get('a')
+            cache.set('c', b'x' * 100, 60)
+
+            assert cache.get('b') is None
+            assert cache.get('a') is not None
+            assert cache.get('c') is not None
+        assert cache.cache_info()['bytes'] <= 250
+        cache.close()
+
+    @pytest.mark.unit
+    def test_oversized_value_not_stored(self, tmp_path):
+        """Test that bodies larger than the budget are not stored."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite", max_bytes=10)
+        cache.set('big', b'x' * 100, 60)
+        assert len(cache) == 0
+        cache.close()
+
+    @pytest.mark.unit
+    def test_persistence(self, tmp_path):
+        """Test that entries survive reopening the database."""
+        path = tmp_path / "cache.sqlite"
+        cache = SQLiteCache(path)
+        cache.set('key', b'data', 60)
+        cache.close()
+
+        reopened = SQLiteCache(path)
+        assert reopened.get('key') == b'data'
+        reopened.close()
+
+    @pytest.mark.unit
+    def test_ttl_policy(self, sqlite_cache):
+        """Test TTL lookup by endpoint name, then tag, then default."""
+        sqlite_cache.ttls = {'get_countries': 10, 'Taxa': 20, 'Information': 0}
+        sqlite_cache.default_ttl = 30
+        assert sqlite_cache.ttl_for('get_countries', ['Countries']) == 10
+        assert sqlite_cache.ttl_for('get_taxa_kingdom', ['Taxa']) == 20
+        assert sqlite_cache.ttl_for('get_information_api_version', ['Information']) == 0
+        assert sqlite_cache.ttl_for('get_threats', ['Threats']) == 30
+
+    @pytest.mark.unit
+    def test_clear(self, sqlite_cache):
+        """Test removing all entries."""
+        sqlite_cache.set('key', b'data', 60)
+        sqlite_cache.clear()
+        assert len(sqlite_cache) == 0
+
+
+    @pytest.mark.unit
+    def test_expired_entries_with_validators_kept_for_revalidation(self, sqlite_cache):
+        """Test that expired entries with validators can be revalidated and refreshed."""
+        with patch('iucn_red_list_client.cache.time.time', return_value=1000.0):
+            sqlite_cache.set_validated('key', b'data', 10, {'etag': '"v1"'})
+            sqlite_cache.set('plain', b'data', 10)
+        with patch('iucn_red_list_client.cache.time.time', return_value=1011.0):
+            assert sqlite_cache.get('key') is None
+            assert sqlite_cache.get('plain') is None
+            assert sqlite_cache.get_stale('key') == (b'data', {'etag': '"v1"'})
+            assert sqlite_cache.get_stale('plain') is None
+            sqlite_cache.refresh('key', 10, {'last_modified': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+            assert sqlite_cache.get('key') == b'data'
+        assert sqlite_cache.get_stale('key')[1] == {'etag': '"v1"', 'last_modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+    @pytest.mark.unit
+    def test_adds_validator_columns_to_old_database(self, tmp_path):
+        """Test opening a database created before validators were stored."""
+        path = tmp_path / "cache.sqlite"
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+                     " size INTEGER NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)")
+        conn.execute("INSERT INTO responses VALUES ('old', x'00', 1, 1e12, 0)")
+        conn.commit()
+        conn.close()
+
+        cache = SQLiteCache(path)
+        assert cache.get('old') == b'\x00'
+        cache.set_validated('new', b'data', 60, {'etag': 'W/"1"'})
+        assert cache.get('new') == b'data'
+        cache.close()
+
+
+class TestMemoryCache:
+    """Test cases for MemoryCache."""
+
+    @pytest.mark.unit
+    def test_set_and_get(self):
+        """Test storing and retrieving decoded values."""
+        cache = MemoryCache()
+        cache.set('key', {'a': 1}, 60)
+        assert cache.get('key') == {'a': 1}
+        assert cache.get('missing') is None
+        assert cache.cache_info()['hits'] == 1
+        assert cache.cache_info()['misses'] == 1
+
+    @pytest.mark.unit
+    def test_expiry(self):
+        """Test that expired entries are treated as misses."""
+        cache = MemoryCache()
+        with patch('iucn_red_list_client.cache.time.monotonic', return_value=100.0):
+            cache.set('key', 'value', 10)
+        with patch('iucn_red_list_client.cache.time.monotonic', return_value=111.0):
+            assert cache.get('key') is None
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_max_entries_lru(self):
+        """Test least recently used eviction by entry count."""
+        cache = MemoryCache(max_entries=2)
+        cache.set('a', 1, 60)
+        cache.set('b', 2, 60)
+        cache.get('a')
+        cache.set('c', 3, 60)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.cache_info()['evictions'] == 1
+
+    @pytest.mark.unit
+    def test_max_bytes(self):
+        """Test eviction by byte budget."""
+        cache = MemoryCache(max_bytes=100)
+        cache.set('a', 'x', 60, size=60)
+        cache.set('b', 'y', 60, size=60)
+
+        assert cache.get('a') is None
+        assert cache.cache_info()['bytes'] == 60
+
+    @pytest.mark.unit
+    def test_negative_entries(self):
+        """Test that not-found errors are cached for negative_ttl."""
+        cache = MemoryCache(negative_ttl=30)
+        error = requests.HTTPError("404 Client Error")
+        cache.set_negative('key', error)
+
+        assert cache.get('key') is error
+        assert cache.cache_info()['negative_hits'] == 1
+
+    @pytest.mark.unit
+    def test_negative_caching_disabled(self):
+        """Test that negative caching can be turned off."""
+        cache = MemoryCache(negative_ttl=0)
+        cache.set_negative('key', requests.HTTPError())
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_thread_safety(self):
+        """Test concurrent writers keep the cache within its limits."""
+        cache = MemoryCache(max_entries=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.set(f"{offset}-{i}", i, 60, size=1)
+                cache.get(f"{offset}-{i // 2}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        assert info['entries'] == 50
+        assert info['bytes'] == 50
+        assert info['hits'] + info['misses'] == 8 * 500
+
+
+class TestClientCaching:
+    """Test cases for caching in IUCNRedListClient."""
+
+    @pytest.mark.unit
+    def test_repeated_call_served_from_cache(self, mock_config, sqlite_cache):
+        """Test that a repeated call does not touch the network."""
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(cache=sqlite_cache)
+
+        with patch.object(client, '_make_request', return_value=_json_response({"result": "ok"})) as mock_request:
+            first = client.call_endpoint('get_red_list_categories')
+            second = client.call_endpoint('get_red_list_categories')
+
+        assert first == second == {"result": "ok"}
+        mock_request.assert_called_once()
+        assert sqlite_cache.cache_info()['hits'] == 1
+
+    @pytest.mark.unit
+    def test_negative_hits_raise_fresh_errors(self, mock_config):
+        """Test that each negative cache hit raises a new, traceback-free HTTPError."""
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(memory_cache=MemoryCache(negative_ttl=30))
+        not_found = requests.HTTPError("404 Client Error", response=Mock(status_code=404))
+
+        with patch.object(client, '_make_request', side_effect=not_found) as mock_request:
+            errors = []
+            for _ in range(3):
+                with pytest.raises(requests.HTTPError) as excinfo:
+                    client.call_endpoint('get_taxa_sis_sis_id', sis_id=1)
+                errors.append(excinfo.value)
+
+        mock_request.assert_called_once()
+        assert errors[0] is not_found
+        assert len({id(error) for error in errors}) == 3
+        assert [str(error) for error in errors] == ["404 Client Error"] * 3
+        assert all(error.response is not_found.response for error in errors)
+        depths = []
+        for error in errors[1:]:
+            traceback, depth = error.__traceback__, 0
+            while traceback is not None:
+                traceback, depth = traceback.tb_next, depth + 1
+            depths.append(depth)
+        assert depths[0] == depths[1]
+        cached = client.memory_cache.get(next(iter(client.memory_cache._entries)))
+        assert cached.__traceback__ is None
+
+    @pytest.mark.unit
+    def test_cache_shared_across_clients(self, mock_config, sqlite_cache):
+        """Test that a new client reuses responses stored by an earlier one."""
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            first_client = IUCNRedListClient(cache=sqlite_cache)
+            second_client = IUCNRedListClient(cache=sqlite_cache)
+
+        with patch.object(first_client, '_make_request', return_value=_json_response({"n": 1})):
+            first_client.call_endpoint('get_countries_code', code='US', page=2)
+        with patch.object(second_client, '_make_request') as mock_request:
+            result = second_client.call_endpoint('get_countries_code', page=2, code='US')
+
+        assert result == {"n": 1}
+        mock_request.assert_not_called()
+
+    @pytest.mark.unit
+    def test_zero_ttl_bypasses_cache(self, mock_config, tmp_path):
+        """Test that endpoints with a zero TTL are never cached."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite", ttls={'Information': 0})
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(cache=cache)
+
+        with patch.object(client, '_make_request', return_value=_json_response({})) as mock_request:
+            client.call_endpoint('get_information_api_version')
+            client.call_endpoint('get_information_api_version')
+
+        assert mock_request.call_count == 2
+        assert len(cache) == 0
+        cache.close()
+
+    @pytest.mark.unit
+    def test_memory_cache_memoizes_results(self, mock_config):
+        """Test that repeated calls return the memoized result."""
+        memory_cache = MemoryCache()
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(memory_cache=memory_cache)
+
+        with patch.object(client, '_make_request', return_value=_json_response({"sis_id": 1})) as mock_request:
+            first = client.call_endpoint('get_taxa_sis_sis_id', sis_id=1)
+            second = client.call_endpoint('get_taxa_sis_sis_id', sis_id=1)
+            client.call_endpoint('get_taxa_sis_sis_id', sis_id=2)
+
+        assert first is second
+        assert mock_request.call_count == 2
+        assert client.cache_info()['memory_cache']['hits'] == 1
+
+    @pytest.mark.unit
+    def test_memory_cache_tag_policy(self, mock_config):
+        """Test that tag policies can exclude endpoints from memoization."""
+        memory_cache = MemoryCache(ttls={'Taxa': 0})
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(memory_cache=memory_cache)
+
+        with patch.object(client, '_make_request', return_value=_json_response({})) as mock_request:
+            client.call_endpoint('get_taxa_sis_sis_id', sis_id=1)
+            client.call_endpoint('get_taxa_sis_sis_id', sis_id=1)
+            client.call_endpoint('get_assessment_assessment_id', assessment_id=5)
+            client.call_endpoint('get_assessment_assessment_id', assessment_id=5)
+
+        assert mock_request.call_count == 3
+
+    @pytest.mark.unit
+    def test_memory_cache_negative_404(self, mock_config):
+        """Test that 404s for unknown taxa are cached and re-raised."""
+        memory_cache = MemoryCache()
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(memory_cache=memory_cache)
+
+        not_found = Mock(status_code=404)
+        error = requests.HTTPError("404 Client Error", response=not_found)
+        with patch.object(client, '_make_request', side_effect=error) as mock_request:
+            for _ in range(3):
+                with pytest.raises(requests.HTTPError):
+                    client.call_endpoint('get_taxa_scientific_name', genus_name='Unknown', species_name='taxon')
+
+        mock_request.assert_called_once()
+        assert memory_cache.cache_info()['negative_hits'] == 2
+
+    @pytest.mark.unit
+    def test_server_errors_not_cached(self, mock_config):
+        """Test that errors other than 404 are not cached."""
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(memory_cache=MemoryCache())
+
+        error = requests.HTTPError("500 Server Error", response=Mock(status_code=500))
+        with patch.object(client, '_make_request', side_effect=error) as mock_request:
+            for _ in range(2):
+                with pytest.raises(requests.HTTPError):
+                    client.call_endpoint('get_taxa_sis_sis_id', sis_id=1)
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.unit
+    def test_memory_cache_filled_from_disk_cache(self, mock_config, sqlite_cache):
+        """Test that disk cache hits are promoted into the memory cache."""
+        memory_cache = MemoryCache()
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(cache=sqlite_cache, memory_cache=memory_cache)
+
+        with patch.object(client, '_make_request', return_value=_json_response({"a": 1})):
+            client.call_endpoint('get_threats')
+        memory_cache.clear()
+        with patch.object(client, '_make_request') as mock_request:
+            client.call_endpoint('get_threats')
+            client.call_endpoint('get_threats')
+
+        mock_request.assert_not_called()
+        assert sqlite_cache.cache_info()['hits'] == 1
+        assert memory_cache.cache_info()['hits'] == 1
+
+    @pytest.mark.unit
+    def test_expired_response_revalidated_with_conditional_get(self, mock_config, sqlite_cache):
+        """Test that an expired response is revalidated and a 304 serves the stored body."""
+        with patch.object(IUCNRedListClient, '_load_config', return_value=mock_config):
+            client = IUCNRedListClient(cache=sqlite_cache)
+
+        first = _json_response({"categories": ["LC"]})
+        first.headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        not_modified = Mock(status_code=304, headers={'ETag': '"v1"'}, content=b'')
+        changed = _json_response({"categories": ["LC", "NT"]})
+        changed.headers = {'ETag': '"v2"'}
+
+        with patch.object(client, '_make_request', side_effect=[first, not_modified, changed]) as mock_request:
+            with patch('iucn_red_list_client.cache.time.time', return_value=1000.0):
+                client.call_endpoint('get_red_list_categories')
+            with patch('iucn_red_list_client.cache.time.time', return_value=1000.0 + 25 * 3600):
+                assert client.call_endpoint('get_red_list_categories') == {"categories": ["LC"]}
+                assert client.call_endpoint('get_red_list_categories') == {"categories": ["LC"]}
+            with patch('iucn_red_list_client.cache.time.time', return_value=1000.0 + 50 * 3600):
+                assert client.call_endpoint('get_red_list_categories') == {"categories": ["LC", "NT"]}
+
+        assert 'headers' not in mock_request.call_args_list[0].kwargs
+        assert mock_request.call_args_list[1].kwargs['headers'] == {
+            'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        assert mock_request.call_args_list[2].kwargs['headers'] == {
+            'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        info = sqlite_cache.cache_info()
+        assert (info['hits'], info['revalidated'], info['fetched']) == (1, 1, 2)
+        assert sqlite_cache.get_stale(make_cache_key(
+            'GET', 'https://api.iucnredlist.org/api/v4/red_list_categories/'))[1] == {'etag': '"v2"'}
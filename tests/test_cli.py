@@ -3,6 +3,7 @@
 import pytest
 import sys
 from unittest.mock import patch, Mock
+from iucn_red_list_client import jsoncodec
 from iucn_red_list_client.cli import main, create_argument_parser
 
 
@@ -75,6 +76,92 @@ class TestCLI:
         captured = capsys.readouterr()
         assert '"test": "data"' in captured.out
 
+    @pytest.mark.unit
+    @patch('sys.argv', ['iucn-client', 'get_countries', '--json-backend', 'json'])
+    @patch('iucn_red_list_client.cli.IUCNRedListClient')
+    def test_main_json_backend(self, mock_client_class, capsys):
+        """Test selecting the JSON backend from the command line."""
+        mock_client = Mock()
+        mock_client.call_endpoint.return_value = {"name": "León"}
+        mock_client_class.return_value = mock_client
+        
+        main()
+        captured = capsys.readouterr()
+        assert mock_client_class.call_args.kwargs['json_backend'] == 'json'
+        assert '"name": "León"' in captured.out
+
+    @pytest.mark.unit
+    @patch('sys.argv', ['iucn-client', 'get_countries_code', '-p', 'code=US',
+                        '--export', 'us.parquet', '--prefetch', '4'])
+    @patch('iucn_red_list_client.cli.export_records')
+    @patch('iucn_red_list_client.cli.IUCNRedListClient')
+    def test_main_export(self, mock_client_class, mock_export, capsys):
+        """Test exporting a collection from the command line."""
+        mock_export.return_value = {'path': 'us.parquet', 'format': 'parquet', 'rows': 250, 'batches': 1}
+        
+        main()
+        captured = capsys.readouterr()
+        mock_export.assert_called_once_with(mock_client_class.return_value, 'get_countries_code', 'us.parquet',
+                                            file_format=None, prefetch=4, code='US')
+        assert 'Exported 250 records to us.parquet' in captured.out
+
+    @pytest.mark.unit
+    @patch('iucn_red_list_client.cli.sync_mirror')
+    @patch('iucn_red_list_client.cli.IUCNRedListClient')
+    def test_main_sync(self, mock_client_class, mock_sync, tmp_path, capsys):
+        """Test the sync command."""
+        store = tmp_path / 'mirror.sqlite'
+        mock_sync.return_value = {'red_list_version': '2025-1', 'skipped': True}
+        
+        with patch('sys.argv', ['iucn-client', 'sync', '--store', str(store), '--kingdom', 'FUNGI', '--full']):
+            main()
+        captured = capsys.readouterr()
+        args, kwargs = mock_sync.call_args
+        assert args[0] is mock_client_class.return_value
+        assert args[1].path == store
+        assert kwargs['collections'] == [('get_taxa_kingdom_kingdom_name', {'kingdom_name': 'FUNGI'})]
+        assert kwargs['full'] is True
+        assert '"red_list_version": "2025-1"' in captured.out
+
+    @pytest.mark.unit
+    @patch('iucn_red_list_client.cli.sync_mirror')
+    @patch('iucn_red_list_client.cli.IUCNRedListClient')
+    def test_main_sync_bypasses_cache_and_closes_store(self, mock_client_class, mock_sync, tmp_path):
+        """Test that sync ignores --cache and closes the mirror even when it fails."""
+        store = tmp_path / 'mirror.sqlite'
+        mock_sync.side_effect = ConnectionError("connection lost")
+        argv = ['iucn-client', 'sync', '--store', str(store), '--cache', str(tmp_path / 'cache.sqlite')]
+        
+        with patch('sys.argv', argv), patch('iucn_red_list_client.cli.MirrorStore') as mock_store:
+            with pytest.raises(SystemExit):
+                main()
+        assert mock_client_class.call_args.kwargs['cache'] is None
+        assert not (tmp_path / 'cache.sqlite').exists()
+        mock_store.return_value.close.assert_called_once_with()
+
+    @pytest.mark.unit
+    @patch('iucn_red_list_client.cli.SQLiteCache')
+    @patch('iucn_red_list_client.cli.IUCNRedListClient')
+    def test_main_closes_cache(self, mock_client_class, mock_cache_class, capsys):
+        """Test that the response cache is closed after an endpoint call."""
+        mock_client_class.return_value.call_endpoint.return_value = {}
+        with patch('sys.argv', ['iucn-client', 'get_countries', '--cache', 'cache.sqlite']):
+            main()
+        assert mock_client_class.call_args.kwargs['cache'] is mock_cache_class.return_value
+        mock_cache_class.return_value.close.assert_called_once_with()
+
+    @pytest.mark.unit
+    @patch('sys.argv', ['iucn-client', 'get_countries', '--json-backend', 'orjson'])
+    @patch('iucn_red_list_client.cli.IUCNRedListClient')
+    def test_main_missing_json_backend(self, mock_client_class, caplog):
+        """Test that an uninstalled JSON backend is reported as a CLI error."""
+        with patch.object(jsoncodec, 'orjson', None):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 1
+        assert "JSON backend 'orjson' is not installed" in caplog.text
+        mock_client_class.assert_not_called()
+
     @pytest.mark.unit
     @patch('sys.argv', ['iucn-client', 'get_countries'])
     @patch('iucn_red_list_client.cli.IUCNRedListClient')
@@ -0,0 +1,58 @@
+"""Tests for precompiled endpoint dispatch."""
+
+import pytest
+
+from iucn_red_list_client.api_endpoints import API_ENDPOINTS
+from iucn_red_list_client.client import resolve_endpoint
+from iucn_red_list_client.dispatch import coerce_boolean, coerce_integer, endpoint_spec
+
+
+class TestEndpointSpec:
+    """Test cases for compiled endpoint specs."""
+
+    @pytest.mark.unit
+    def test_every_endpoint_compiles(self):
+        """Test that each registry entry compiles and its path template round-trips."""
+        for name, endpoint in API_ENDPOINTS.items():
+            spec = endpoint_spec(name)
+            kwargs = {param: f'<{param}>' for param in endpoint['path_params']}
+            kwargs.update((param['name'], 'x') for param in endpoint['query_params'] if param['required'])
+            method, path, _ = spec.resolve(kwargs)
+            assert method == endpoint['method']
+            assert path == endpoint['path'].format(**{param: f'<{param}>' for param in endpoint['path_params']})
+            assert spec.paginated == any(param['name'] == 'page' for param in endpoint['query_params'])
+        assert endpoint_spec('get_taxa_sis_sis_id') is endpoint_spec('get_taxa_sis_sis_id')
+
+    @pytest.mark.unit
+    def test_resolve_pops_and_coerces(self):
+        """Test that endpoint parameters are consumed and query values typed."""
+        kwargs = {'latest': 'True', 'code': 'US', 'page': '3', 'year_published': 2020, 'timeout': 5}
+        method, path, query = resolve_endpoint('get_countries_code', kwargs)
+
+        assert (method, path) == ('GET', '/api/v4/countries/US')
+        assert query == {'latest': 'true', 'page': 3, 'year_published': 2020}
+        assert list(query) == [name for name in endpoint_spec('get_countries_code').query_params if name in query]
+        assert kwargs == {'timeout': 5}
+
+    @pytest.mark.unit
+    def test_missing_and_unknown(self):
+        """Test the errors for missing parameters and unknown endpoints."""
+        with pytest.raises(ValueError, match="Missing required path parameter: sis_id"):
+            resolve_endpoint('get_taxa_sis_sis_id', {})
+        with pytest.raises(ValueError, match="Missing required query parameter: species_name"):
+            resolve_endpoint('get_taxa_scientific_name', {'genus_name': 'Panthera'})
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            resolve_endpoint('get_nothing', {})
+
+    @pytest.mark.unit
+    def test_coercers(self):
+        """Test integer and boolean coercion and their errors."""
+        assert coerce_integer('page', ' 7 ') == 7
+        assert [coerce_boolean('latest', value) for value in (True, 'YES', 1, False, 'off', '0')] == \
+            ['true', 'true', 'true', 'false', 'false', 'false']
+        with pytest.raises(ValueError, match="page must be an integer"):
+            coerce_integer('page', 'two')
+        with pytest.raises(ValueError, match="page must be an integer"):
+            coerce_integer('page', True)
+        with pytest.raises(ValueError, match="latest must be a boolean"):
+            coerce_boolean('latest', 'maybe')
@@ -0,0 +1,86 @@
+"""Tests for the generated typed endpoint methods."""
+
+import asyncio
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from iucn_red_list_client import IUCNRedListClient
+from iucn_red_list_client.api_endpoints import API_ENDPOINTS
+from iucn_red_list_client.client import resolve_endpoint
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_generator():
+    """Import tools/generate_methods.py, which is not part of the package."""
+    spec = importlib.util.spec_from_file_location('generate_methods', ROOT / 'tools' / 'generate_methods.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _sample_kwargs(endpoint_info):
+    """Build path and query arguments for every parameter of an endpoint."""
+    samples = {'integer': '7', 'boolean': 'yes', 'string': 'x'}
+    path_kwargs = {name: f'<{name}>' for name in endpoint_info['path_params']}
+    query_kwargs = {param['name']: samples[param['type']] for param in endpoint_info['query_params']}
+    return path_kwargs, query_kwargs
+
+
+class TestEndpointMethods:
+    """Test cases for EndpointMethods and AsyncEndpointMethods."""
+
+    @pytest.mark.unit
+    def test_generated_module_is_current(self):
+        """Test that endpoints.py matches the generator output for API_ENDPOINTS."""
+        generator = _load_generator()
+        assert generator.OUTPUT_PATH.read_text() == generator.render(API_ENDPOINTS)
+
+    @pytest.mark.unit
+    def test_methods_match_call_endpoint(self, mock_api_token):
+        """Test that each method resolves its call exactly as call_endpoint does."""
+        client = IUCNRedListClient(api_token=mock_api_token)
+        for name, endpoint_info in API_ENDPOINTS.items():
+            path_kwargs, query_kwargs = _sample_kwargs(endpoint_info)
+            with patch.object(client, '_call_resolved') as call:
+                getattr(client, name)(*path_kwargs.values(), timeout=5, **query_kwargs)
+            method, path, query_params = resolve_endpoint(name, {**path_kwargs, **query_kwargs})
+            call.assert_called_once_with(name, tuple(endpoint_info['tags']), method, path, query_params,
+                                         5, False, None)
+
+    @pytest.mark.unit
+    def test_coercion_errors_and_required_params(self, mock_api_token):
+        """Test that bad query values fail before any request is made."""
+        client = IUCNRedListClient(api_token=mock_api_token)
+        with patch.object(client, '_make_request') as request:
+            with pytest.raises(ValueError, match="page must be an integer"):
+                client.get_countries_code('US', page='two')
+            with pytest.raises(TypeError):
+                client.get_taxa_scientific_name(genus_name='Panthera')
+        request.assert_not_called()
+
+    @pytest.mark.unit
+    def test_async_methods(self):
+        """Test that the async client awaits the resolved call."""
+        pytest.importorskip("httpx")
+        from iucn_red_list_client import AsyncIUCNRedListClient
+
+        client = AsyncIUCNRedListClient(api_token='token')
+        with patch.object(client, '_call_resolved', new=AsyncMock(return_value={'ok': True})) as call:
+            result = asyncio.run(client.get_taxa_sis_sis_id(15951, model=None))
+        assert result == {'ok': True}
+        call.assert_awaited_once_with('get_taxa_sis_sis_id', ('Taxa',), 'GET', '/api/v4/taxa/sis/15951', {},
+                                      None, None)
+
+    @pytest.mark.unit
+    def test_registry_not_imported(self):
+        """Test that the package and its methods load without API_ENDPOINTS."""
+        code = ("import sys, iucn_red_list_client.endpoints; "
+                "print('iucn_red_list_client.api_endpoints' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'False'
@@ -0,0 +1,114 @@
+"""Tests for columnar export of assessment collections."""
+
+import importlib.util
+import sys
+import pytest
+from unittest.mock import Mock, patch
+
+from iucn_red_list_client import export
+from iucn_red_list_client.export import export_records, records_to_columns, resolve_export_format
+from iucn_red_list_client.models import AssessmentSummary
+
+requires_pyarrow = pytest.mark.skipif(importlib.util.find_spec('pyarrow') is None,
+                                      reason="pyarrow is not installed")
+
+
+def _records(count, start=0):
+    """Build fake assessment records."""
+    return [
+        {'assessment_id': start + i, 'sis_taxon_id': 10 + i, 'year_published': 2020,
+         'red_list_category_code': 'VU', 'latest': True, 'scopes': [{'code': '1'}]}
+        for i in range(count)
+    ]
+
+
+def _client(records):
+    """Build a client stub whose iter_records yields ``records``."""
+    client = Mock()
+    client.iter_records.side_effect = lambda *args, **kwargs: iter(records)
+    return client
+
+
+class TestExportHelpers:
+    """Test cases for export helpers that do not need pyarrow."""
+
+    @pytest.mark.unit
+    def test_resolve_export_format(self):
+        """Test inferring and validating the export format."""
+        assert resolve_export_format('out.parquet') == 'parquet'
+        assert resolve_export_format('out.FEATHER') == 'feather'
+        assert resolve_export_format('out.bin', 'feather') == 'feather'
+        with pytest.raises(ValueError, match="Cannot infer"):
+            resolve_export_format('out.csv')
+        with pytest.raises(ValueError, match="Unknown export format"):
+            resolve_export_format('out.parquet', 'orc')
+
+    @pytest.mark.unit
+    def test_records_to_columns(self):
+        """Test converting dicts and models to typed columns."""
+        columns = records_to_columns([
+            _records(1)[0],
+            AssessmentSummary(assessment_id=7, possibly_extinct=True),
+        ])
+
+        assert columns['assessment_id'] == [0, 7]
+        assert columns['year_published'] == ['2020', None]
+        assert columns['possibly_extinct'] == [None, True]
+        assert 'scopes' not in columns
+
+    @pytest.mark.unit
+    def test_requires_pyarrow(self, tmp_path):
+        """Test the error raised when pyarrow is missing."""
+        with patch.object(export, 'pa', None), patch.dict(sys.modules, {'pyarrow': None}):
+            with pytest.raises(ImportError, match="pip install"):
+                export_records(_client([]), 'get_countries_code', tmp_path / 'out.parquet', code='US')
+
+
+@requires_pyarrow
+class TestExportRecords:
+    """Test cases for writing Parquet and Feather files."""
+
+    @pytest.mark.unit
+    def test_export_parquet_in_batches(self, tmp_path):
+        """Test that records are written in bounded batches."""
+        import pyarrow.parquet as pq
+        client = _client(_records(250))
+        path = tmp_path / 'us.parquet'
+
+        stats = export_records(client, 'get_countries_code', path, batch_size=100, prefetch=4, code='US')
+
+        assert stats == {'path': str(path), 'format': 'parquet', 'rows': 250, 'batches': 3}
+        client.iter_records.assert_called_once_with('get_countries_code', prefetch=4, code='US')
+        table = pq.read_table(path)
+        assert table.schema == export.assessment_schema()
+        assert table.num_rows == 250
+        assert pq.ParquetFile(path).metadata.num_row_groups == 3
+        assert table.column('assessment_id').to_pylist() == list(range(250))
+        assert not (tmp_path / 'us.parquet.partial').exists()
+
+    @pytest.mark.unit
+    def test_export_feather(self, tmp_path):
+        """Test writing an Arrow IPC (Feather v2) file."""
+        import pyarrow.feather as feather
+        path = tmp_path / 'plants.feather'
+
+        stats = export_records(_client(_records(5)), 'get_taxa_kingdom_kingdom_name', path,
+                               kingdom_name='PLANTAE')
+
+        assert stats['rows'] == 5
+        assert feather.read_table(path).column('year_published').to_pylist() == ['2020'] * 5
+
+    @pytest.mark.unit
+    def test_export_failure_leaves_no_file(self, tmp_path):
+        """Test that a failed export removes its partial output."""
+        def records():
+            yield from _records(3)
+            raise RuntimeError("connection lost")
+
+        client = Mock()
+        client.iter_records.return_value = records()
+        path = tmp_path / 'out.parquet'
+
+        with pytest.raises(RuntimeError):
+            export_records(client, 'get_countries_code', path, batch_size=2, code='US')
+        assert list(tmp_path.iterdir()) == []
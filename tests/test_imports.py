@@ -0,0 +1,65 @@
+"""Tests for lazy imports; timing budgets are checked by benchmarks/bench_import.py."""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import iucn_red_list_client
+from iucn_red_list_client import IUCNRedListClient
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_benchmark():
+    """Import benchmarks/bench_import.py, which holds the budgets."""
+    spec = importlib.util.spec_from_file_location('bench_import', ROOT / 'benchmarks' / 'bench_import.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestLazyImports:
+    """Test cases for deferred imports."""
+
+    @pytest.mark.unit
+    def test_package_attributes(self):
+        """Test that public names resolve lazily and unknown names still fail."""
+        assert 'SQLiteCache' in dir(iucn_red_list_client)
+        assert iucn_red_list_client.TokenBucket.__module__ == 'iucn_red_list_client.ratelimit'
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            iucn_red_list_client.Missing
+
+    @pytest.mark.unit
+    def test_session_created_on_first_use(self, mock_api_token):
+        """Test that the HTTP session and truststore wait for the first request."""
+        with patch('iucn_red_list_client.client.inject_truststore') as inject:
+            client = IUCNRedListClient(api_token=mock_api_token)
+            assert client._session is None
+            inject.assert_not_called()
+
+            session = client.session
+            inject.assert_called_once_with()
+            assert client.session is session
+            assert session.headers['Authorization'] == mock_api_token
+
+    @pytest.mark.unit
+    def test_imports_skip_heavy_modules(self):
+        """Test that importing the package, client or CLI loads no HTTP stack, pyarrow or registry."""
+        bench = _load_benchmark()
+        for module in bench.IMPORT_BUDGETS_MS:
+            _, loaded = bench.measure_import(module)
+            assert loaded == [], f"{module} loaded {loaded}"
+
+    @pytest.mark.unit
+    def test_list_endpoints_without_http_stack(self):
+        """Test that --list-endpoints works without importing requests."""
+        code = ("import sys; sys.argv = ['iucn-client', '--list-endpoints']; "
+                "from iucn_red_list_client.cli import main; main(); "
+                "assert 'requests' not in sys.modules")
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert 'get_countries_code (GET)' in result.stdout
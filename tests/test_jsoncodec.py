@@ -0,0 +1,83 @@
+"""Tests for the pluggable JSON backends."""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+from iucn_red_list_client import IUCNRedListClient
+from iucn_red_list_client import jsoncodec
+from iucn_red_list_client.jsoncodec import JSONCodec, available_backends, get_codec
+
+SAMPLE = {
+    'assessment_id': 12345,
+    'taxon': {'scientific_name': 'Panthera leo', 'common_names': ['Lion', 'León']},
+    'red_list_category': {'code': 'VU'},
+    'population_trend': None,
+    'possibly_extinct': False,
+    'score': 0.25,
+}
+
+
+class TestJSONCodec:
+    """Test cases for the JSON codec backends."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", available_backends())
+    def test_round_trip(self, name):
+        """Test that every installed backend round-trips a payload."""
+        codec = get_codec(name)
+        assert codec.name == name
+        assert codec.loads(json.dumps(SAMPLE).encode()) == SAMPLE
+        assert codec.loads(json.dumps(SAMPLE)) == SAMPLE
+        assert json.loads(codec.dumps(SAMPLE)) == SAMPLE
+        pretty = codec.dumps(SAMPLE, pretty=True)
+        assert json.loads(pretty) == SAMPLE
+        assert '\n  "assessment_id": 12345' in pretty
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", available_backends())
+    def test_output_matches_across_backends(self, name):
+        """Test that every backend prints the same text, non-ASCII included."""
+        payload = {'taxon': {'scientific_name': 'Bothrops jararacuçu', 'common_names': ['Jararacuçu']}}
+        codec = get_codec(name)
+        assert codec.dumps(payload) == get_codec('json').dumps(payload)
+        assert codec.dumps(payload, pretty=True) == get_codec('json').dumps(payload, pretty=True)
+        assert 'jararacuçu' in codec.dumps(payload, pretty=True)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", available_backends())
+    def test_decode_errors_are_value_errors(self, name):
+        """Test that malformed input raises ValueError on every backend."""
+        with pytest.raises(ValueError):
+            get_codec(name).loads(b'{"assessments": [')
+
+    @pytest.mark.unit
+    def test_auto_prefers_fastest_installed(self):
+        """Test that auto picks the first installed backend."""
+        assert get_codec().name == available_backends()[0]
+        assert get_codec('auto').name == available_backends()[0]
+        assert available_backends()[-1] == 'json'
+
+    @pytest.mark.unit
+    def test_auto_falls_back_to_stdlib(self):
+        """Test the fallback when no fast backend is installed."""
+        with patch.object(jsoncodec, 'orjson', None), patch.object(jsoncodec, 'msgspec', None):
+            assert available_backends() == ['json']
+            assert type(get_codec()) is JSONCodec
+            with pytest.raises(ImportError, match="not installed"):
+                get_codec('orjson')
+
+    @pytest.mark.unit
+    def test_unknown_backend(self):
+        """Test that unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_codec('simplejson')
+
+    @pytest.mark.unit
+    def test_client_backend_selection(self, mock_api_token):
+        """Test choosing the backend per client, by argument or configuration."""
+        assert IUCNRedListClient(api_token=mock_api_token).json_codec.name == available_backends()[0]
+        assert IUCNRedListClient(api_token=mock_api_token, json_backend='json').json_codec.name == 'json'
+        with patch.dict(os.environ, {"IUCN_API_TOKEN": mock_api_token, "IUCN_JSON_BACKEND": "json"}):
+            assert IUCNRedListClient().json_codec.name == 'json'
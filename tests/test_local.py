@@ -0,0 +1,216 @@
+"""Tests for the offline species store and LocalIUCNClient."""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from iucn_red_list_client.local import (
+    LocalIUCNClient,
+    NotInStore,
+    SpeciesStore,
+    populate_store,
+    taxon_name_key,
+)
+from iucn_red_list_client.models import TaxonAssessments
+from iucn_red_list_client.sync import MirrorStore
+
+
+def _taxon_response(sis_id, genus='Panthera', species='leo', infra=None):
+    """Build a fake taxon response."""
+    return {
+        'taxon': {'sis_id': sis_id, 'scientific_name': ' '.join(filter(None, [genus, species, infra])),
+                  'genus_name': genus, 'species_name': species, 'infra_name': infra},
+        'assessments': [{'assessment_id': sis_id * 10, 'sis_taxon_id': sis_id, 'latest': True}],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A species store holding Panthera leo and Panthera leo persica."""
+    store = SpeciesStore(tmp_path / 'species.sqlite')
+    store.add_taxa([_taxon_response(15951), _taxon_response(15952, infra='persica')])
+    yield store
+    store.close()
+
+
+class TestSpeciesStore:
+    """Test the indexed store."""
+
+    @pytest.mark.unit
+    def test_lookups_by_each_key(self, store):
+        """Test lookups by normalized name, SIS id and assessment id."""
+        assert store.by_name('  PANTHERA   Leo ')['taxon']['sis_id'] == 15951
+        assert store.by_name('Panthera leo persica')['taxon']['sis_id'] == 15952
+        assert store.by_sis_id(15952)['taxon']['infra_name'] == 'persica'
+        assert store.by_assessment_id(159510)['taxon']['sis_id'] == 15951
+        assert store.by_name('Panthera tigris') is None
+        assert len(store) == 2
+
+    @pytest.mark.unit
+    def test_replacing_a_taxon_reindexes_it(self, store):
+        """Test that a newer response replaces the old one and its assessment ids."""
+        response = _taxon_response(15951)
+        response['assessments'] = [{'assessment_id': 999}]
+        assert store.add_taxon(response)
+        assert store.by_assessment_id(159510) is None
+        assert store.by_assessment_id(999)['taxon']['sis_id'] == 15951
+
+    @pytest.mark.unit
+    def test_skips_responses_without_taxon(self, store):
+        """Test that responses without SIS id and name are not stored."""
+        assert not store.add_taxon({'taxon': {'sis_id': 1}})
+        assert store.add_taxa([{}, _taxon_response(3, 'Lynx', 'lynx')]) == 1
+
+    @pytest.mark.unit
+    def test_name_key_falls_back_to_scientific_name(self):
+        """Test the key of a taxon without name parts."""
+        assert taxon_name_key({'scientific_name': 'Lynx  Lynx'}) == 'lynx lynx'
+        assert taxon_name_key({}) is None
+
+
+class TestLocalIUCNClient:
+    """Test answering call_endpoint from the store."""
+
+    @pytest.mark.unit
+    def test_answers_indexed_endpoints_locally(self, store):
+        """Test name and SIS id lookups without a fallback client."""
+        client = LocalIUCNClient(store)
+        result = client.call_endpoint('get_taxa_scientific_name', genus_name='panthera',
+                                      species_name='leo', infra_name='persica')
+        assert result['taxon']['sis_id'] == 15952
+        assert client.call_endpoint('get_taxa_sis_sis_id', sis_id=15951)['taxon']['genus_name'] == 'Panthera'
+        assert client.cache_info() == {'hits': 2, 'misses': 0, 'entries': 2}
+
+    @pytest.mark.unit
+    def test_decodes_into_model(self, store):
+        """Test that model= converts the stored response."""
+        client = LocalIUCNClient(store)
+        result = client.call_endpoint('get_taxa_sis_sis_id', sis_id=15951, model=TaxonAssessments)
+        assert result.taxon.sis_id == 15951
+        assert result.assessments[0].assessment_id == 159510
+
+    @pytest.mark.unit
+    def test_miss_without_fallback_raises(self, store):
+        """Test that misses and other endpoints raise NotInStore."""
+        client = LocalIUCNClient(store)
+        with pytest.raises(NotInStore):
+            client.call_endpoint('get_taxa_sis_sis_id', sis_id=1)
+        with pytest.raises(NotInStore):
+            client.call_endpoint('get_countries')
+        with pytest.raises(ValueError):
+            client.call_endpoint('get_taxa_scientific_name', genus_name='Panthera')
+
+    @pytest.mark.unit
+    def test_miss_falls_through_and_writes_through(self, store):
+        """Test that misses go to the fallback client and are stored."""
+        fallback = Mock()
+        fallback.call_endpoint.side_effect = [
+            _taxon_response(15955, species='tigris'),
+            {'assessment_id': 42, 'criteria': 'A2'},
+        ]
+        client = LocalIUCNClient(store, fallback=fallback)
+
+        result = client.call_endpoint('get_taxa_scientific_name', genus_name='Panthera',
+                                      species_name='tigris', timeout=5)
+        assert result['taxon']['sis_id'] == 15955
+        fallback.call_endpoint.assert_called_with('get_taxa_scientific_name', genus_name='Panthera',
+                                                  species_name='tigris', timeout=5)
+        assert client.call_endpoint('get_assessment_assessment_id', assessment_id=42)['criteria'] == 'A2'
+
+        # Both are now answered locally
+        assert client.call_endpoint('get_taxa_scientific_name', genus_name='Panthera',
+                                    species_name='Tigris')['taxon']['sis_id'] == 15955
+        assert client.call_endpoint('get_assessment_assessment_id', assessment_id=42)['criteria'] == 'A2'
+        assert fallback.call_endpoint.call_count == 2
+        assert client.cache_info()['hits'] == 2
+
+    @pytest.mark.unit
+    def test_counters_under_concurrent_lookups(self, store):
+        """Test that hits and misses are not lost when threads share the client."""
+        client = LocalIUCNClient(store, fallback=Mock(**{'call_endpoint.return_value': {}}), write_through=False)
+
+        def lookup(i):
+            if i % 2:
+                client.call_endpoint('get_taxa_sis_sis_id', sis_id=15951)
+            else:
+                client.call_endpoint('get_assessment_assessment_id', assessment_id=1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lookup, range(400)))
+        info = client.cache_info()
+        assert (info['hits'], info['misses']) == (200, 200)
+
+    @pytest.mark.unit
+    def test_unindexed_endpoints_use_fallback(self, store):
+        """Test that other endpoints are passed to the fallback client."""
+        fallback = Mock()
+        fallback.call_endpoint.return_value = {'countries': []}
+        client = LocalIUCNClient(store, fallback=fallback)
+        assert client.call_endpoint('get_countries') == {'countries': []}
+        fallback.call_endpoint.assert_called_once_with('get_countries', model=None)
+
+
+class TestPopulateStore:
+    """Test filling the store from the API."""
+
+    @pytest.mark.unit
+    def test_populate_from_mirror_and_names(self, tmp_path):
+        """Test populating by the SIS ids of a mirror and by names."""
+        mirror = MirrorStore(tmp_path / 'mirror.sqlite')
+        checkpoint = {'collection': 'c', 'endpoint': 'e', 'mode': 'full', 'sync_id': 1, 'year': None,
+                      'next_page': 2, 'max_year': None, 'red_list_version': None, 'complete': False,
+                      'records': 2, 'updated': 0.0}
+        mirror.write_page([{'assessment_id': 1, 'sis_taxon_id': 7, 'taxon_scientific_name': 'Genus species7'},
+                           {'assessment_id': 2, 'sis_taxon_id': 8}], checkpoint)
+        assert mirror.sis_ids() == [7, 8]
+        assert mirror.scientific_names() == ['Genus species7']
+
+        client = Mock()
+
+        def call_endpoint(endpoint_name, sis_id):
+            if sis_id == 8:
+                raise ConnectionError("connection lost")
+            return _taxon_response(sis_id, 'Genus', f'species{sis_id}')
+
+        client.call_endpoint.side_effect = call_endpoint
+        client.iter_species_bulk.return_value = iter([
+            (0, {'genus_name': 'Lynx', 'species_name': 'lynx', 'infra_name': None,
+                 'result': _taxon_response(9, 'Lynx', 'lynx'), 'error': None}),
+            (1, {'genus_name': None, 'species_name': None, 'infra_name': None, 'result': None,
+                 'error': 'Invalid species name'}),
+        ])
+
+        species = SpeciesStore(tmp_path / 'species.sqlite')
+        stats = populate_store(client, species, sis_ids=mirror.sis_ids(), names=['Lynx lynx', 'x'])
+        assert stats == {'taxa': 2, 'failed': 2}
+        assert species.by_name('Genus species7')['taxon']['sis_id'] == 7
+        assert species.by_name('lynx lynx')['taxon']['sis_id'] == 9
+        assert species.scientific_names() == ['Genus species7', 'Lynx lynx']
+        species.close()
+        mirror.close()
+
+    @pytest.mark.unit
+    def test_populate_commits_in_batches(self, tmp_path):
+        """Test that taxa are written in bounded transactions as they arrive."""
+        client = Mock()
+        client.call_endpoint.side_effect = lambda endpoint_name, sis_id: _taxon_response(sis_id, 'Genus', f's{sis_id}')
+        client.iter_species_bulk.return_value = iter(
+            (i, {'genus_name': 'Lynx', 'species_name': f's{i}', 'infra_name': None,
+                 'result': _taxon_response(100 + i, 'Lynx', f's{i}'), 'error': None})
+            for i in range(3)
+        )
+        species = SpeciesStore(tmp_path / 'species.sqlite')
+        add_taxa = species.add_taxa
+        sizes = []
+
+        def record_batch(responses):
+            sizes.append(len(responses))
+            return add_taxa(responses)
+
+        with patch.object(species, 'add_taxa', side_effect=record_batch):
+            stats = populate_store(client, species, sis_ids=range(1, 8), names=['x'] * 3, batch_size=4)
+
+        assert stats == {'taxa': 10, 'failed': 0}
+        assert sizes == [4, 4, 2]
+        assert len(species) == 10
+        species.close()
@@ -0,0 +1,129 @@
+"""Tests for the typed response models."""
+
+import json
+import sys
+import pytest
+from unittest.mock import Mock, patch
+
+from iucn_red_list_client import IUCNRedListClient, MemoryCache
+from iucn_red_list_client.models import (
+    AssessmentList,
+    AssessmentSummary,
+    CommonName,
+    Taxon,
+    TaxonAssessments,
+    convert_model,
+    decode_model,
+    latest_assessment,
+)
+
+
+@pytest.fixture
+def taxon_body(sample_assessment_response):
+    """A get_taxa_scientific_name response body with common names."""
+    data = dict(sample_assessment_response)
+    data['taxon'] = dict(data['taxon'], family_name='FAGACEAE', common_names=[
+        {'name': 'Eastern oak', 'language': 'eng', 'main': False},
+        {'name': 'White oak', 'language': 'eng', 'main': True},
+    ])
+    data['assessments'] = data['assessments'] + [{
+        'assessment_id': 111, 'latest': False, 'year_published': '2004',
+        'red_list_category_code': 'LC', 'sis_taxon_id': 12345, 'scopes': [{'code': '1'}],
+    }]
+    return json.dumps(data).encode()
+
+
+class TestModels:
+    """Test cases for model decoding."""
+
+    @pytest.mark.unit
+    def test_decode_taxon_assessments(self, taxon_body):
+        """Test decoding a nested response into models."""
+        result = decode_model(taxon_body, TaxonAssessments)
+
+        assert isinstance(result.taxon, Taxon)
+        assert result.taxon.scientific_name == 'Test species'
+        assert result.taxon.family_name == 'FAGACEAE'
+        assert result.taxon.common_names[1] == CommonName(name='White oak', language='eng', main=True)
+        assert [a.assessment_id for a in result.assessments] == [67890, 111]
+        assert all(isinstance(a, AssessmentSummary) for a in result.assessments)
+
+    @pytest.mark.unit
+    def test_missing_and_unknown_fields(self):
+        """Test that missing fields take defaults and unknown fields are dropped."""
+        result = decode_model(b'{"assessments": [{"assessment_id": 1, "extra": {"a": 1}}], "x": 2}',
+                              AssessmentList)
+
+        record = result.assessments[0]
+        assert record.assessment_id == 1
+        assert record.latest is False
+        assert record.url is None
+        assert not hasattr(record, 'extra')
+        assert decode_model(b'{}', AssessmentList).assessments == []
+        assert decode_model(b'{"taxon": null}', TaxonAssessments).taxon is None
+
+    @pytest.mark.unit
+    def test_list_defaults_are_not_shared(self):
+        """Test that each instance gets its own empty list."""
+        first, second = Taxon(), Taxon()
+        first.common_names.append(CommonName(name='x'))
+        assert second.common_names == []
+
+    @pytest.mark.unit
+    def test_models_are_slotted(self):
+        """Test that models carry no per-instance dict."""
+        record = convert_model({'assessment_id': 1, 'latest': True}, AssessmentSummary)
+        assert not hasattr(record, '__dict__')
+        assert sys.getsizeof(record) < sys.getsizeof({'assessment_id': 1, 'latest': True})
+
+    @pytest.mark.unit
+    def test_latest_assessment(self, taxon_body):
+        """Test picking the latest assessment."""
+        result = decode_model(taxon_body, TaxonAssessments)
+        assert latest_assessment(result.assessments).assessment_id == 67890
+        assert latest_assessment(result.assessments[1:]).assessment_id == 111
+        assert latest_assessment([]) is None
+
+
+class TestClientModels:
+    """Test cases for decoding client responses into models."""
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_call_endpoint_model(self, mock_request, mock_api_token, taxon_body):
+        """Test call_endpoint(model=...) and memoization per model."""
+        response = Mock(status_code=200, content=taxon_body)
+        mock_request.return_value = response
+        client = IUCNRedListClient(api_token=mock_api_token, memory_cache=MemoryCache())
+
+        typed = client.call_endpoint('get_taxa_scientific_name', genus_name='Test',
+                                     species_name='species', model=TaxonAssessments)
+        plain = client.call_endpoint('get_taxa_scientific_name', genus_name='Test', species_name='species')
+        again = client.call_endpoint('get_taxa_scientific_name', genus_name='Test',
+                                     species_name='species', model=TaxonAssessments)
+
+        assert isinstance(typed, TaxonAssessments)
+        assert isinstance(plain, dict)
+        assert again is typed
+        assert mock_request.call_count == 2
+
+    @pytest.mark.unit
+    def test_iter_records_model(self, client_with_mock_config):
+        """Test that paginated walks yield model records."""
+        pages = [
+            convert_model({'assessments': [{'assessment_id': i} for i in range(100)]}, AssessmentList),
+            convert_model({'assessments': [{'assessment_id': 100}]}, AssessmentList),
+        ]
+        with patch.object(client_with_mock_config, 'call_endpoint', side_effect=pages) as mock_call:
+            records = list(client_with_mock_config.iter_records('get_countries_code', code='US',
+                                                                model=AssessmentList))
+
+        assert [r.assessment_id for r in records] == list(range(101))
+        assert mock_call.call_args.kwargs['model'] is AssessmentList
+
+    @pytest.mark.unit
+    def test_stream_rejects_model(self, client_with_mock_config):
+        """Test that streaming cannot be combined with a model."""
+        with pytest.raises(ValueError, match="model"):
+            client_with_mock_config.call_endpoint('get_countries_code', code='US',
+                                                  stream=True, model=AssessmentList)
@@ -0,0 +1,94 @@
+"""Tests for scientific name parsing and matching."""
+
+import pytest
+
+from iucn_red_list_client.names import (
+    NameIndex,
+    canonical_name,
+    name_key,
+    normalize_name,
+    parse_name,
+)
+
+
+def _parts(name):
+    """Return the genus, species and infra name of a parsed name."""
+    parsed = parse_name(name)
+    return parsed['genus_name'], parsed['species_name'], parsed['infra_name']
+
+
+class TestParseName:
+    """Test splitting names into genus, species and infra name."""
+
+    @pytest.mark.unit
+    def test_normalization(self):
+        """Test that keys ignore case, spacing and Unicode form."""
+        assert normalize_name('  Panthera\tLEO ') == 'panthera leo'
+        assert name_key('Panthera', 'leo', 'persica') == 'panthera leo persica'
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('name, expected', [
+        ('Quercus alba', ('Quercus', 'alba', None)),
+        ('QUERCUS ALBA', ('Quercus', 'alba', None)),
+        ('Quercus alba L.', ('Quercus', 'alba', None)),
+        ('Rhinolophus ferrumequinum (Schreber, 1774)', ('Rhinolophus', 'ferrumequinum', None)),
+        ('Aus bus de Candolle', ('Aus', 'bus', None)),
+        ('Panthera leo persica', ('Panthera', 'leo', 'persica')),
+        ('Quercus alba var. minor Sarg.', ('Quercus', 'alba', 'minor')),
+        ('Rosa canina subsp. dumalis', ('Rosa', 'canina', 'dumalis')),
+        ('Bombus (Psithyrus) rupestris', ('Bombus', 'rupestris', None)),
+        ('Acer cf. rubrum', ('Acer', 'rubrum', None)),
+        ('Quercus sp.', ('Quercus', None, None)),
+        ('', (None, None, None)),
+    ])
+    def test_parts(self, name, expected):
+        """Test parsing names as written in species lists."""
+        assert _parts(name) == expected
+
+    @pytest.mark.unit
+    def test_hybrids(self):
+        """Test that hybrid signs are dropped and flagged."""
+        for name in ('Salix ×sepulcralis', 'Salix x sepulcralis', '× Cupressocyparis leylandii'):
+            parsed = parse_name(name)
+            assert parsed['hybrid'] is True
+            assert parsed['species_name'] in ('sepulcralis', 'leylandii')
+
+    @pytest.mark.unit
+    def test_canonical_name(self):
+        """Test formatting a parsed name with its rank."""
+        assert canonical_name(parse_name('quercus ALBA var minor')) == 'Quercus alba var. minor'
+
+
+class TestNameIndex:
+    """Test exact and fuzzy matching against known names."""
+
+    @pytest.fixture
+    def index(self):
+        return NameIndex(['Quercus alba', 'Panthera leo', 'Panthera leo persica', 'Acer rubrum',
+                          'Panthera leo', 'Quercus'])
+
+    @pytest.mark.unit
+    def test_exact_matches(self, index):
+        """Test that parsed names match exactly regardless of case and authority."""
+        matched = index.match('PANTHERA LEO (Linnaeus, 1758)')
+        assert matched['name'] == 'Panthera leo'
+        assert matched['exact'] is True and matched['score'] == 1.0
+        assert 'quercus alba L.' in index
+        assert len(index) == 4
+
+    @pytest.mark.unit
+    def test_fuzzy_matches(self, index):
+        """Test that misspellings resolve to the closest known name."""
+        assert index.match('Pantera leo')['name'] == 'Panthera leo'
+        matched = index.match('Panthera leo persika')
+        assert matched['name'] == 'Panthera leo persica'
+        assert matched['exact'] is False and 0.8 <= matched['score'] < 1.0
+        assert index.resolve('Acer ruber')['species_name'] == 'rubrum'
+
+    @pytest.mark.unit
+    def test_no_match_below_cutoff(self, index):
+        """Test that unrelated names do not match."""
+        assert index.match('Ursus arctos') is None
+        assert index.match('Acer ruber', cutoff=0.95) is None
+        assert index.match('Quercus') is None
+        assert index.resolve('Ursus arctos')['genus_name'] == 'Ursus'
@@ -0,0 +1,265 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import pytest
+from unittest.mock import Mock, patch
+
+from iucn_red_list_client import IUCNRedListClient
+from iucn_red_list_client.ratelimit import TokenBucket, parse_retry_after
+
+
+def _response(status_code, headers=None):
+    """Build a mock HTTP response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    @pytest.mark.unit
+    def test_burst_is_immediate(self):
+        """Test that a full burst is not delayed."""
+        bucket = TokenBucket(1.0, burst=5)
+        started = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        assert time.monotonic() - started < 0.05
+
+    @pytest.mark.unit
+    def test_sustained_rate(self):
+        """Test that requests beyond the burst are spaced at the rate."""
+        bucket = TokenBucket(100.0, burst=1)
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        assert time.monotonic() - started >= 0.045
+
+    @pytest.mark.unit
+    def test_shared_across_threads(self):
+        """Test that one bucket paces requests from several threads."""
+        bucket = TokenBucket(200.0, burst=1)
+        started = time.monotonic()
+        threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - started >= 19 / 200 * 0.9
+
+    @pytest.mark.unit
+    def test_async_acquire(self):
+        """Test that async tasks share the bucket without blocking the loop."""
+        bucket = TokenBucket(100.0, burst=2)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 4 / 100 * 0.9
+
+    @pytest.mark.unit
+    def test_throttle_halves_rate_and_recovers(self):
+        """Test adaptive backoff on throttling and recovery on success."""
+        bucket = TokenBucket(10.0)
+        bucket.throttled()
+        assert bucket.rate == 5.0
+        # The throttle window lasts one request interval at the lowered rate
+        time.sleep(1 / 5.0)
+        bucket.throttled()
+        assert bucket.rate == 2.5
+        for _ in range(100):
+            bucket.succeeded()
+        assert bucket.rate == 10.0
+        assert bucket.stats()['throttle_count'] == 2
+
+    @pytest.mark.unit
+    def test_throttle_respects_min_rate(self):
+        """Test that the rate never drops below the floor."""
+        bucket = TokenBucket(10.0, min_rate=4.0)
+        for _ in range(3):
+            bucket.throttled()
+            time.sleep(1 / bucket.rate)
+        assert bucket.rate == 4.0
+
+    @pytest.mark.unit
+    def test_retry_after_pauses_bucket(self):
+        """Test that Retry-After delays the next request."""
+        bucket = TokenBucket(100.0, burst=10)
+        bucket.throttled(retry_after=0.1)
+        started = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - started >= 0.09
+
+    @pytest.mark.unit
+    def test_simultaneous_throttles_pause_once(self):
+        """Test that 429s from many threads at once back off and pause only once."""
+        bucket = TokenBucket(10.0, burst=10)
+        barrier = threading.Barrier(16)
+
+        def throttle():
+            barrier.wait()
+            bucket.throttled(retry_after=0.3)
+
+        threads = [threading.Thread(target=throttle) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert bucket.rate == 5.0
+        assert bucket.stats()['throttle_count'] == 16
+
+        started = time.monotonic()
+        bucket.acquire()
+        assert 0.25 <= time.monotonic() - started < 0.3 + 2 / 5.0
+
+    @pytest.mark.unit
+    def test_throttle_during_pause_extends_it(self):
+        """Test that a later, longer Retry-After moves the pause deadline."""
+        bucket = TokenBucket(100.0, burst=10)
+        bucket.throttled(retry_after=0.05)
+        bucket.throttled(retry_after=0.15)
+        assert bucket.rate == 50.0
+        started = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - started >= 0.14
+
+    @pytest.mark.unit
+    def test_invalid_settings(self):
+        """Test that invalid rates and bursts are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1.0, burst=0)
+
+
+class TestParseRetryAfter:
+    """Test cases for Retry-After parsing."""
+
+    @pytest.mark.unit
+    def test_seconds(self):
+        """Test a delay given in seconds."""
+        assert parse_retry_after('3') == 3.0
+
+    @pytest.mark.unit
+    def test_http_date(self):
+        """Test a delay given as an HTTP date."""
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+    @pytest.mark.unit
+    def test_missing_or_invalid(self):
+        """Test missing and unparseable values."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('soon') is None
+
+
+class TestClientRateLimiting:
+    """Test cases for rate limiting in IUCNRedListClient."""
+
+    @pytest.mark.unit
+    def test_rate_limiter_from_config(self):
+        """Test that rate_limit and rate_burst settings create a limiter."""
+        client = IUCNRedListClient(api_token='token', rate_limit=5, rate_burst=3)
+        assert client.rate_limiter.max_rate == 5.0
+        assert client.rate_limiter.burst == 3
+        assert 429 not in client.session.get_adapter('https://').max_retries.status_forcelist
+
+    @pytest.mark.unit
+    def test_rate_limiter_from_env(self, monkeypatch):
+        """Test that IUCN_RATE_LIMIT and IUCN_RATE_BURST configure the limiter."""
+        monkeypatch.setenv('IUCN_API_TOKEN', 'token')
+        monkeypatch.setenv('IUCN_RATE_LIMIT', '2.5')
+        monkeypatch.setenv('IUCN_RATE_BURST', '4')
+        client = IUCNRedListClient()
+        assert client.rate_limiter.max_rate == 2.5
+        assert client.rate_limiter.burst == 4
+
+    @pytest.mark.unit
+    def test_no_rate_limiter_by_default(self):
+        """Test that rate limiting is off unless configured."""
+        client = IUCNRedListClient(api_token='token')
+        assert client.rate_limiter is None
+        assert 429 in client.session.get_adapter('https://').max_retries.status_forcelist
+
+    @pytest.mark.unit
+    def test_shared_rate_limiter(self):
+        """Test that clients can share one limiter."""
+        bucket = TokenBucket(10.0)
+        first = IUCNRedListClient(api_token='token', rate_limiter=bucket)
+        second = IUCNRedListClient(api_token='token', rate_limiter=bucket)
+        assert first.rate_limiter is second.rate_limiter is bucket
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_throttled_request_is_retried(self, mock_request):
+        """Test that a 429 slows the limiter and the request is retried."""
+        mock_request.side_effect = [
+            _response(429, {'Retry-After': '0'}),
+            _response(200),
+        ]
+        bucket = TokenBucket(1000.0, burst=10)
+        client = IUCNRedListClient(api_token='token', rate_limiter=bucket)
+
+        response = client._make_request('GET', '/api/v4/countries/')
+
+        assert response.status_code == 200
+        assert mock_request.call_count == 2
+        assert bucket.throttle_count == 1
+        assert bucket.rate < bucket.max_rate
+
+    @pytest.mark.unit
+    def test_retry_after_429_reaches_limiter(self):
+        """Test that a real 429 with Retry-After is not retried inside urllib3."""
+        statuses = [429, 429, 200]
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status = statuses.pop(0)
+                body = b'{}'
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', '0')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            bucket = TokenBucket(20.0, burst=10)
+            client = IUCNRedListClient(api_token='token', rate_limiter=bucket,
+                                       base_url=f'http://127.0.0.1:{server.server_port}')
+            response = client._make_request('GET', '/api/v4/countries/')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 200
+        assert not client.session.get_adapter('http://').max_retries.respect_retry_after_header
+        assert bucket.throttle_count == 2
+        assert bucket.rate < bucket.max_rate
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_persistent_throttling_raises(self, mock_request):
+        """Test that throttling beyond the retry budget surfaces the 429."""
+        throttled = _response(429)
+        throttled.raise_for_status.side_effect = Exception("429 Too Many Requests")
+        mock_request.return_value = throttled
+        client = IUCNRedListClient(api_token='token', rate_limiter=TokenBucket(1000.0, burst=10))
+
+        with pytest.raises(Exception, match="429"):
+            client._make_request('GET', '/api/v4/countries/')
+        assert mock_request.call_count == 4
@@ -0,0 +1,164 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from iucn_red_list_client import IUCNRedListClient, SingleFlight
+
+
+def _run_threads(count, target):
+    """Run ``target`` on ``count`` threads and return their results in start order."""
+    results = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.unit
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers arriving while a call is in flight get its result."""
+        flight = SingleFlight()
+        executions = []
+
+        def slow():
+            executions.append(1)
+            time.sleep(0.1)
+            return {'value': 1}
+
+        results = _run_threads(8, lambda: flight.do('key', slow))
+
+        assert len(executions) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {'calls': 8, 'coalesced': 7, 'in_flight': 0}
+
+    @pytest.mark.unit
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that a finished call is not shared with later callers."""
+        flight = SingleFlight()
+        assert flight.do('key', lambda: 1) == 1
+        assert flight.do('key', lambda: 2) == 2
+        assert flight.do('other', lambda: 3) == 3
+        assert flight.stats()['coalesced'] == 0
+
+    @pytest.mark.unit
+    def test_exception_is_shared(self):
+        """Test that every waiting caller receives the call's exception."""
+        flight = SingleFlight()
+
+        def failing():
+            time.sleep(0.1)
+            raise ConnectionError("connection lost")
+
+        results = _run_threads(4, lambda: flight.do('key', failing))
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert flight.stats()['in_flight'] == 0
+        assert flight.do('key', lambda: 'recovered') == 'recovered'
+
+    @pytest.mark.unit
+    def test_waiters_get_their_own_exception(self):
+        """Test that waiting threads raise copies, leaving the leader's traceback alone."""
+        flight = SingleFlight()
+        error = requests.HTTPError("404 Client Error", response=Mock(status_code=404))
+
+        def failing():
+            time.sleep(0.1)
+            raise error
+
+        results = _run_threads(6, lambda: flight.do('key', failing))
+
+        leader = [result for result in results if result is error]
+        waiters = [result for result in results if result is not error]
+        assert len(leader) == 1 and len(waiters) == 5
+        assert len({id(result) for result in waiters}) == 5
+        for result in waiters:
+            assert type(result) is requests.HTTPError
+            assert result.args == error.args and result.response is error.response
+            assert result.__cause__ is error
+
+    @pytest.mark.unit
+    def test_async_calls_share_one_task(self):
+        """Test coalescing of asyncio calls, surviving cancellation of a waiter."""
+        flight = SingleFlight()
+        executions = []
+
+        async def slow():
+            executions.append(1)
+            await asyncio.sleep(0.05)
+            return {'value': 1}
+
+        async def run():
+            cancelled = asyncio.ensure_future(flight.do_async('key', slow))
+            waiters = [flight.do_async('key', slow) for _ in range(4)]
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await asyncio.gather(*waiters)
+
+        results = asyncio.run(run())
+
+        assert len(executions) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {'calls': 5, 'coalesced': 4, 'in_flight': 0}
+
+
+class TestClientSingleFlight:
+    """Test cases for coalescing in IUCNRedListClient."""
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_identical_calls_share_one_request(self, mock_request):
+        """Test that concurrent identical calls send one GET and share the decoded result."""
+        def request(**kwargs):
+            time.sleep(0.1)
+            response = Mock(status_code=200, content=b'{"taxon": {"sis_id": 15951}}')
+            response.raise_for_status.return_value = None
+            return response
+
+        mock_request.side_effect = request
+        client = IUCNRedListClient(api_token='token', single_flight=SingleFlight())
+
+        results = _run_threads(6, lambda: client.call_endpoint(
+            'get_taxa_scientific_name', genus_name='Panthera', species_name='leo'))
+
+        assert mock_request.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert results[0] == {'taxon': {'sis_id': 15951}}
+        assert client.single_flight.stats()['coalesced'] == 5
+
+    @pytest.mark.unit
+    @patch('requests.Session.request')
+    def test_different_params_are_not_coalesced(self, mock_request):
+        """Test that calls for different species are sent separately."""
+        def request(**kwargs):
+            time.sleep(0.05)
+            response = Mock(status_code=200, content=b'{}')
+            response.raise_for_status.return_value = None
+            return response
+
+        mock_request.side_effect = request
+        client = IUCNRedListClient(api_token='token', single_flight=SingleFlight())
+
+        _run_threads(2, lambda: [
+            client.call_endpoint('get_taxa_scientific_name', genus_name='Panthera', species_name=species)
+            for species in ('leo', 'tigris')
+        ])
+
+        assert mock_request.call_count == 2
+        assert client.single_flight.stats()['calls'] == 4
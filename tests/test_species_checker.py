@@ -1,5 +1,6 @@
 """Tests for the species conservation status checker."""
 
+import time
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch, mock_open
@@ -10,13 +11,43 @@ import os
 # Add examples directory to path for importing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'examples'))
 
+import check_species_status as species_checker
 from check_species_status import (
+    CheckpointJournal,
+    OUTPUT_COLUMNS,
+    ResultWriter,
+    count_results,
+    format_results,
+    open_input_file,
     parse_scientific_name,
     check_species_status,
     get_status_descriptions,
     is_threatened,
+    process_species_list,
     read_input_file
 )
+from iucn_red_list_client import IUCNRedListClient
+from iucn_red_list_client.names import NameIndex
+
+
+def fake_bulk(responses, checked, reverse=True, interrupt_after=None):
+    """Build a fake iter_species_bulk answering from ``responses`` keyed by (genus, species[, infra]).
+
+    Names are recorded in ``checked`` and, with ``reverse``, answered last
+    first; ``interrupt_after`` raises KeyboardInterrupt after that many results.
+    """
+    def iter_species_bulk(names, max_workers=None, rate_limit=None):
+        names = list(names)
+        checked.append(names)
+        indexes = range(len(names) - 1, -1, -1) if reverse else range(len(names))
+        for count, index in enumerate(indexes):
+            if count == interrupt_after:
+                raise KeyboardInterrupt
+            genus, species, infra = names[index]
+            result, error = responses[(genus, species, infra) if infra else (genus, species)]
+            yield index, {'genus_name': genus, 'species_name': species, 'infra_name': infra,
+                          'result': result, 'error': error}
+    return iter_species_bulk
 
 
 class TestSpeciesChecker:
@@ -25,30 +56,32 @@ class TestSpeciesChecker:
     @pytest.mark.unit
     def test_parse_scientific_name_valid(self):
         """Test parsing valid scientific names."""
-        genus, species = parse_scientific_name("Quercus alba")
+        genus, species, infra = parse_scientific_name("Quercus alba")
         assert genus == "Quercus"
         assert species == "alba"
+        assert infra is None
 
     @pytest.mark.unit
     def test_parse_scientific_name_single_word(self):
         """Test parsing single word (genus only)."""
-        genus, species = parse_scientific_name("Quercus")
+        genus, species, _ = parse_scientific_name("Quercus")
         assert genus == "Quercus"
         assert species is None
 
     @pytest.mark.unit
     def test_parse_scientific_name_empty(self):
         """Test parsing empty string."""
-        genus, species = parse_scientific_name("")
+        genus, species, _ = parse_scientific_name("")
         assert genus is None
         assert species is None
 
     @pytest.mark.unit
     def test_parse_scientific_name_trinomial(self):
         """Test parsing trinomial name (genus species subspecies)."""
-        genus, species = parse_scientific_name("Quercus alba var. minor")
+        genus, species, infra = parse_scientific_name("Quercus alba var. minor")
         assert genus == "Quercus"
         assert species == "alba"
+        assert infra == "minor"
 
     @pytest.mark.unit
     def test_get_status_descriptions(self):
@@ -77,6 +110,22 @@ class TestSpeciesChecker:
         assert is_threatened('LC') is False
         assert is_threatened('NT') is False
 
+    @pytest.mark.unit
+    def test_format_and_count_results(self):
+        """Test the column-wise status descriptions, threatened flags and summary counts."""
+        results = pd.DataFrame([
+            {'row_number': 2, 'scientific_name': 'Panthera leo', 'red_list_category': 'VU', 'status': 'found'},
+            {'row_number': 3, 'scientific_name': 'Lynx lynx', 'red_list_category': 'LC', 'status': 'found'},
+            {'row_number': 4, 'scientific_name': 'Genus x', 'red_list_category': 'Error', 'status': 'error'},
+        ])
+        formatted = format_results(results, {'VU': 'Vulnerable', 'LC': 'Least Concern'})
+
+        assert list(formatted.columns) == OUTPUT_COLUMNS
+        assert list(formatted['conservation_status']) == ['Vulnerable', 'Least Concern', 'Error']
+        assert list(formatted['is_threatened']) == [True, False, False]
+        assert count_results(results, formatted) == {('found', True): 1, ('found', False): 1,
+                                                     ('error', False): 1}
+
     @pytest.mark.unit
     def test_read_input_file_csv(self, tmp_path):
         """Test reading CSV input file."""
@@ -164,3 +213,207 @@ class TestSpeciesChecker:
         
         assert result['status'] == 'found'
         assert result['red_list_category'] == 'VU'  # Should use first assessment
+
+    @pytest.mark.unit
+    @patch('check_species_status.IUCNRedListClient')
+    def test_process_species_list_uses_bulk_lookup(self, mock_client_class, tmp_path,
+                                                   sample_assessment_response):
+        """Test that the species list is checked through the bulk lookup API."""
+        input_file = tmp_path / "species.csv"
+        input_file.write_text("species\nTest species\nUnknown thing\nBadname\n")
+        output_file = tmp_path / "results.csv"
+        
+        mock_client = Mock()
+        mock_client.call_endpoint.return_value = {'red_list_categories': []}
+        checked = []
+        mock_client.iter_species_bulk.side_effect = fake_bulk({
+            ('Test', 'species'): (sample_assessment_response, None),
+            ('Unknown', 'thing'): (None, '404 Client Error'),
+        }, checked)
+        mock_client_class.return_value = mock_client
+        
+        process_species_list(str(input_file), str(output_file), max_workers=4, rate_limit=5.0)
+        
+        assert checked == [[('Test', 'species', None), ('Unknown', 'thing', None)]]
+        assert mock_client.iter_species_bulk.call_args[1] == {'max_workers': 4, 'rate_limit': 5.0}
+        results = pd.read_csv(output_file)
+        assert list(results['scientific_name']) == ['Test species', 'Unknown thing']
+        assert list(results['conservation_status']) == ['VU', 'Error']
+
+    @pytest.mark.unit
+    def test_parse_scientific_name_with_authority_and_hybrid(self):
+        """Test that authorities, hybrid signs and odd casing are handled."""
+        assert parse_scientific_name("QUERCUS ALBA L.") == ("Quercus", "alba", None)
+        assert parse_scientific_name("Salix ×sepulcralis Simonk.") == ("Salix", "sepulcralis", None)
+
+    @pytest.mark.unit
+    @patch('check_species_status.IUCNRedListClient')
+    def test_process_species_list_corrects_names(self, mock_client_class, tmp_path):
+        """Test that misspelled names are matched to known names before lookup."""
+        input_file = tmp_path / "species.csv"
+        input_file.write_text("species\nQuercus albaa\nAcer rubrum Marshall\n")
+        mock_client = Mock()
+        mock_client.call_endpoint.return_value = {'red_list_categories': []}
+        checked = []
+        mock_client.iter_species_bulk.side_effect = fake_bulk({
+            ('Quercus', 'alba'): (None, '404'),
+            ('Acer', 'rubrum'): (None, '404'),
+        }, checked)
+        mock_client_class.return_value = mock_client
+
+        process_species_list(str(input_file), str(tmp_path / "results.csv"),
+                             name_index=NameIndex(['Quercus alba', 'Acer rubrum']))
+
+        assert checked == [[('Quercus', 'alba', None), ('Acer', 'rubrum', None)]]
+
+    @pytest.mark.unit
+    @patch('check_species_status.IUCNRedListClient')
+    def test_process_species_list_keeps_infraspecific_names(self, mock_client_class, tmp_path,
+                                                            sample_assessment_response):
+        """Test that subspecies are looked up and reported as such, not at species level."""
+        input_file = tmp_path / "species.csv"
+        input_file.write_text("species\nPanthera leo persica\nPanthera leo\nQuercus alba var. minorr\n")
+        output_file = tmp_path / "results.csv"
+        mock_client = Mock()
+        mock_client.call_endpoint.return_value = {'red_list_categories': []}
+        checked = []
+        mock_client.iter_species_bulk.side_effect = fake_bulk({
+            ('Panthera', 'leo', 'persica'): (None, '404'),
+            ('Panthera', 'leo'): (sample_assessment_response, None),
+            ('Quercus', 'alba', 'minor'): (None, '404'),
+        }, checked)
+        mock_client_class.return_value = mock_client
+
+        # The index only knows species and one variety: subspecies are never corrected to a species
+        process_species_list(str(input_file), str(output_file),
+                             name_index=NameIndex(['Panthera leo', 'Quercus alba var. minor']))
+
+        assert checked == [[('Panthera', 'leo', 'persica'), ('Panthera', 'leo', None), ('Quercus', 'alba', 'minor')]]
+        results = pd.read_csv(output_file)
+        assert list(results['scientific_name'])[::2] == ['Panthera leo persica', 'Quercus alba minor']
+
+    @pytest.mark.unit
+    @patch('check_species_status.IUCNRedListClient')
+    def test_process_species_list_resumes_from_journal(self, mock_client_class, tmp_path,
+                                                       sample_assessment_response):
+        """Test that journaled rows are not looked up again and results keep input order."""
+        input_file = tmp_path / "species.csv"
+        input_file.write_text("species\nTest species\nUnknown thing\n")
+        output_file = tmp_path / "results.csv"
+        mock_client = Mock()
+        mock_client.call_endpoint.return_value = {'red_list_categories': []}
+        responses = {
+            ('Test', 'species'): (sample_assessment_response, None),
+            ('Unknown', 'thing'): (None, '404 Client Error'),
+        }
+        checked = []
+        runs = [fake_bulk(responses, checked, reverse=False, interrupt_after=1), fake_bulk(responses, checked)]
+        mock_client.iter_species_bulk.side_effect = lambda *args, **kwargs: runs.pop(0)(*args, **kwargs)
+        mock_client_class.return_value = mock_client
+
+        # The first run is interrupted after one lookup
+        with pytest.raises(KeyboardInterrupt):
+            process_species_list(str(input_file), str(output_file))
+        journal = Path(f"{output_file}.journal.jsonl")
+        assert len(journal.read_text().splitlines()) == 1
+        assert list(pd.read_csv(output_file)['scientific_name']) == ['Test species']
+
+        process_species_list(str(input_file), str(output_file), resume=True)
+
+        assert checked[1] == [('Unknown', 'thing', None)]
+        results = pd.read_csv(output_file)
+        assert list(results['scientific_name']) == ['Test species', 'Unknown thing']
+        assert len(journal.read_text().splitlines()) == 2
+
+    @pytest.mark.unit
+    @patch('check_species_status.IUCNRedListClient')
+    def test_slow_first_row_bounds_buffered_rows(self, mock_client_class, tmp_path):
+        """Test that rows waiting behind a slow first lookup stay within the read-ahead window."""
+        input_file = tmp_path / "species.csv"
+        input_file.write_text("species\nSlow species\n" + "Quick species\n" * 2000)
+        output_file = tmp_path / "results.csv"
+        client = IUCNRedListClient(api_token='test')
+        pulled = []
+        pulled_when_first_done = []
+
+        def fake_call(endpoint_name, genus_name, species_name):
+            time.sleep(0.2 if genus_name == 'Slow' else 0)
+            return {}
+
+        def iter_species_bulk(names, **kwargs):
+            def counted():
+                for name in names:
+                    pulled.append(name)
+                    yield name
+            for index, result in client.iter_species_bulk(counted(), read_ahead=50, **kwargs):
+                if index == 0:
+                    pulled_when_first_done.append(len(pulled))
+                yield index, result
+
+        mock_client = Mock()
+        mock_client.call_endpoint.return_value = {'red_list_categories': []}
+        mock_client.iter_species_bulk.side_effect = iter_species_bulk
+        mock_client_class.return_value = mock_client
+
+        with patch.object(client, 'call_endpoint', side_effect=fake_call):
+            process_species_list(str(input_file), str(output_file))
+
+        # Rows completed after row 1 wait in the in-order buffer; there are at most read_ahead of them
+        assert pulled_when_first_done[0] <= 51
+        assert len(pd.read_csv(output_file)) == 2001
+
+    @pytest.mark.unit
+    def test_journal_drops_incomplete_last_line(self, tmp_path):
+        """Test that a line torn by a crash is discarded before appending."""
+        path = tmp_path / "run.journal.jsonl"
+        path.write_text('{"row_number": 1, "input_genus": "A", "input_species": "b"}\n{"row_nu')
+        journal = CheckpointJournal(str(path), resume=True)
+        assert journal.get(1, 'A', 'b') is not None
+        assert journal.get(1, 'A', 'c') is None
+        journal.record({'row_number': 2, 'input_genus': 'C', 'input_species': 'd'})
+        journal.close()
+        assert CheckpointJournal(str(path), resume=True).completed.keys() == {1, 2}
+
+    @pytest.mark.unit
+    def test_journal_reads_results_back_from_disk(self, tmp_path):
+        """Test that resuming keeps only line offsets in memory, not results."""
+        path = tmp_path / "run.journal.jsonl"
+        journal = CheckpointJournal(str(path))
+        for row_number in (3, 1, 2):
+            journal.record({'row_number': row_number, 'input_genus': 'A', 'input_species': f"s{row_number}",
+                            'scientific_name': f"A s{row_number}"})
+        journal.close()
+
+        journal = CheckpointJournal(str(path), resume=True)
+        assert all(isinstance(offset, int) for offset in journal.completed.values())
+        assert [journal.get(row, 'A', f"s{row}")['scientific_name'] for row in (1, 2, 3)] == ['A s1', 'A s2', 'A s3']
+        assert journal.get(2, 'A', 's2', 'infra') is None
+        assert journal.get(4, 'A', 's4') is None
+        journal.close()
+
+    @pytest.mark.unit
+    def test_open_input_file_reads_csv_in_chunks(self, tmp_path):
+        """Test that CSV input is read lazily in chunks with continuous row indexes."""
+        csv_file = tmp_path / "species.csv"
+        csv_file.write_text("species,notes\n" + "".join(f"Genus species{i},\n" for i in range(5)))
+
+        columns, chunks = open_input_file(str(csv_file), chunk_rows=2)
+        chunks = list(chunks)
+
+        assert columns == ['species', 'notes']
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert list(chunks[-1].index) == [4]
+        assert chunks[0].iloc[0]['notes'] == ''
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(species_checker.openpyxl is None, reason="openpyxl not installed")
+    def test_excel_output_and_input_stream(self, tmp_path):
+        """Test writing results to .xlsx in write-only mode and reading them back by chunk."""
+        xlsx_file = tmp_path / "results.xlsx"
+        writer = ResultWriter(str(xlsx_file))
+        writer.write(pd.DataFrame([{column: f"value {i}" for column in OUTPUT_COLUMNS} for i in range(3)]))
+        writer.close()
+
+        columns, chunks = open_input_file(str(xlsx_file), chunk_rows=2)
+        assert columns == OUTPUT_COLUMNS
+        assert [list(chunk['url']) for chunk in chunks] == [['value 0', 'value 1'], ['value 2']]
@@ -0,0 +1,108 @@
+"""Tests for incremental JSON decoding of streamed responses."""
+
+import json
+import pytest
+
+from iucn_red_list_client.streaming import StreamingRecordDecoder
+
+
+def _decode(body, chunk_size, key='assessments'):
+    """Feed ``body`` to a decoder in chunks and collect every record."""
+    decoder = StreamingRecordDecoder(key)
+    records = []
+    for start in range(0, len(body), chunk_size):
+        records.extend(decoder.feed(body[start:start + chunk_size]))
+    records.extend(decoder.close())
+    return records
+
+
+class TestStreamingRecordDecoder:
+    """Test cases for StreamingRecordDecoder."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 100000])
+    def test_decodes_records_at_any_chunk_size(self, chunk_size):
+        """Test that chunk boundaries never change the decoded records."""
+        document = {
+            'filters': {'code': 'US', 'nested': [1, {'assessments': 'x'}]},
+            'assessments': [
+                {'assessment_id': i, 'name': 'Bothrops jararacuçu', 'score': 12.5 * i, 'flags': [True, None]}
+                for i in range(20)
+            ],
+            'total': 12345,
+        }
+        body = json.dumps(document, indent=1).encode('utf-8')
+        assert _decode(body, chunk_size) == document['assessments']
+
+    @pytest.mark.unit
+    def test_records_arrive_before_end_of_body(self):
+        """Test that completed records are returned before the body ends."""
+        body = json.dumps({'assessments': [{'id': 1}, {'id': 2}, {'id': 3}]}).encode()
+        split = body.index(b'{"id": 2}')
+        decoder = StreamingRecordDecoder('assessments')
+        assert decoder.feed(body[:split]) == [{'id': 1}]
+        assert decoder.feed(body[split:]) == [{'id': 2}, {'id': 3}]
+        assert decoder.close() == []
+
+    @pytest.mark.unit
+    def test_numbers_split_across_chunks(self):
+        """Test that a number is not returned until it is known to be complete."""
+        decoder = StreamingRecordDecoder('assessments')
+        assert decoder.feed(b'{"assessments": [12') == []
+        assert decoder.feed(b'34, 5') == [1234]
+        assert decoder.feed(b']}') == [5]
+        assert decoder.close() == []
+
+    @pytest.mark.unit
+    def test_floats_and_exponents_split_at_every_offset(self):
+        """Test that splitting a body anywhere inside a float or exponent decodes it intact."""
+        values = [1.5, -0.25, 12.0, 1e5, 2.5e-3, -3E+10, 7, 0]
+        body = b'{"assessments":[1.5,-0.25,12.0,1e5,2.5e-3,-3E+10,7,0]}'
+        for split in range(1, len(body)):
+            decoder = StreamingRecordDecoder('assessments')
+            records = decoder.feed(body[:split]) + decoder.feed(body[split:]) + decoder.close()
+            assert records == values, f"split at {split}"
+
+    @pytest.mark.unit
+    def test_number_split_after_decimal_point(self):
+        """Test that "1." followed by "5" decodes to 1.5, not 1."""
+        decoder = StreamingRecordDecoder('assessments')
+        assert decoder.feed(b'{"assessments":[1.') == []
+        assert decoder.feed(b'5]}') == [1.5]
+        assert decoder.close() == []
+
+    @pytest.mark.unit
+    def test_top_level_array(self):
+        """Test that a bare array is streamed element by element."""
+        assert _decode(b'[{"a": 1}, {"b": 2}]', 4) == [{'a': 1}, {'b': 2}]
+
+    @pytest.mark.unit
+    def test_missing_key_yields_nothing(self):
+        """Test documents without the records key."""
+        assert _decode(b'{"result": [1, 2], "assessments": null}', 5) == []
+
+    @pytest.mark.unit
+    def test_truncated_document(self):
+        """Test that a truncated body is reported on close."""
+        decoder = StreamingRecordDecoder('assessments')
+        assert decoder.feed(b'{"assessments": [{"id": 1}, {"id"') == [{'id': 1}]
+        with pytest.raises(ValueError, match="Malformed"):
+            decoder.close()
+
+    @pytest.mark.unit
+    def test_unexpected_document(self):
+        """Test that non-JSON bodies are rejected."""
+        decoder = StreamingRecordDecoder('assessments')
+        with pytest.raises(ValueError, match="not a JSON object or array"):
+            decoder.feed(b'<html>')
+
+    @pytest.mark.unit
+    def test_buffer_stays_bounded(self):
+        """Test that consumed text is dropped from the buffer."""
+        record = json.dumps({'description': 'x' * 1000})
+        decoder = StreamingRecordDecoder('assessments')
+        decoder.feed(b'{"assessments": [')
+        for _ in range(1000):
+            decoder.feed(record.encode() + b', ')
+        assert len(decoder._buffer) < 2 * 64 * 1024
+        assert decoder.records_decoded == 1000
@@ -0,0 +1,166 @@
+"""Tests for the local mirror sync."""
+
+import datetime
+import pytest
+
+from iucn_red_list_client.sync import (
+    MirrorStore,
+    collection_key,
+    kingdom_collections,
+    parse_red_list_version,
+    sync_mirror,
+)
+
+THIS_YEAR = datetime.date.today().year
+
+
+def _assessment(assessment_id, sis_id, year, scope='1'):
+    """Build a fake assessment summary."""
+    return {'assessment_id': assessment_id, 'sis_taxon_id': sis_id, 'year_published': str(year),
+            'taxon_scientific_name': f'Taxon {sis_id}', 'latest': True, 'scopes': [{'code': scope}]}
+
+
+class FakeAPI:
+    """Client stand-in serving paginated kingdom collections."""
+
+    def __init__(self, kingdoms, version='2024-1', page_size=100):
+        self.kingdoms = kingdoms
+        self.version = version
+        self.page_size = page_size
+        self.requests = []
+        self.fail_after = None
+
+    def call_endpoint(self, endpoint_name, **kwargs):
+        assert endpoint_name == 'get_information_red_list_version'
+        return {'red_list_version': self.version}
+
+    def iter_pages(self, endpoint_name, page=1, prefetch=1, **query):
+        assert endpoint_name == 'get_taxa_kingdom_kingdom_name'
+        assert query.pop('latest') == 'true'
+        records = self.kingdoms[query['kingdom_name']]
+        if 'year_published' in query:
+            records = [r for r in records if int(r['year_published']) == query['year_published']]
+        while True:
+            if self.fail_after is not None and len(self.requests) >= self.fail_after:
+                raise ConnectionError("connection lost")
+            self.requests.append(dict(query, page=page))
+            chunk = records[(page - 1) * self.page_size:page * self.page_size]
+            yield {'assessments': chunk}
+            if len(chunk) < self.page_size:
+                return
+            page += 1
+
+
+@pytest.fixture
+def store(tmp_path):
+    """An empty mirror store."""
+    store = MirrorStore(tmp_path / 'mirror.sqlite')
+    yield store
+    store.close()
+
+
+class TestSyncMirror:
+    """Test cases for sync_mirror."""
+
+    @pytest.mark.unit
+    def test_initial_full_sync(self, store):
+        """Test that the first sync crawls every page of every collection."""
+        api = FakeAPI({
+            'PLANTAE': [_assessment(i, 1000 + i, 2020) for i in range(250)],
+            'FUNGI': [_assessment(900, 5, 2019)],
+        }, page_size=100)
+
+        stats = sync_mirror(api, store, kingdom_collections(['PLANTAE', 'FUNGI']))
+
+        assert stats['records'] == 251
+        assert stats['pages'] == 4
+        assert stats['collections_synced'] == 2
+        assert len(store) == 251
+        assert store.get(900)['taxon_scientific_name'] == 'Taxon 5'
+        assert store.red_list_version == '2024-1'
+        checkpoint = store.checkpoint(collection_key('get_taxa_kingdom_kingdom_name', {'kingdom_name': 'PLANTAE'}))
+        assert checkpoint['complete'] and checkpoint['max_year'] == 2020 and checkpoint['records'] == 250
+
+    @pytest.mark.unit
+    def test_unchanged_version_skips_all_work(self, store):
+        """Test that nothing is fetched when the Red List version is unchanged."""
+        api = FakeAPI({'PLANTAE': [_assessment(1, 1, 2020)]})
+        sync_mirror(api, store, kingdom_collections(['PLANTAE']))
+        api.requests.clear()
+
+        stats = sync_mirror(api, store, kingdom_collections(['PLANTAE']))
+
+        assert stats['skipped'] is True
+        assert stats['collections_skipped'] == 1
+        assert api.requests == []
+
+    @pytest.mark.unit
+    def test_incremental_refresh_fetches_recent_years(self, store):
+        """Test that a new version only fetches years since the checkpoint."""
+        api = FakeAPI({'PLANTAE': [_assessment(1, 10, THIS_YEAR - 3), _assessment(2, 20, THIS_YEAR - 1),
+                                   _assessment(3, 30, THIS_YEAR - 1, scope='2')]})
+        sync_mirror(api, store, kingdom_collections(['PLANTAE']))
+        api.requests.clear()
+
+        # Taxon 20 is reassessed globally; its regional assessment is untouched
+        api.version = '2024-2'
+        api.kingdoms['PLANTAE'] = [_assessment(1, 10, THIS_YEAR - 3), _assessment(4, 20, THIS_YEAR),
+                                   _assessment(3, 30, THIS_YEAR - 1, scope='2')]
+        stats = sync_mirror(api, store, kingdom_collections(['PLANTAE']))
+
+        assert sorted({r['year_published'] for r in api.requests}) == [THIS_YEAR - 1, THIS_YEAR]
+        assert stats['records'] == 2
+        assert store.get(2) is None
+        assert store.get(4)['year_published'] == str(THIS_YEAR)
+        assert [r['assessment_id'] for r in store.by_sis_id(20)] == [4]
+        assert store.get(1) is not None and store.get(3) is not None
+        assert store.red_list_version == '2024-2'
+
+    @pytest.mark.unit
+    def test_interrupted_sync_resumes_from_checkpoint(self, store):
+        """Test that a failed crawl resumes at the next unfetched page."""
+        api = FakeAPI({'PLANTAE': [_assessment(i, i, 2020) for i in range(35)]}, page_size=10)
+        api.fail_after = 2
+        with pytest.raises(ConnectionError):
+            sync_mirror(api, store, kingdom_collections(['PLANTAE']))
+        assert len(store) == 20
+
+        api.fail_after = None
+        api.requests.clear()
+        stats = sync_mirror(api, store, kingdom_collections(['PLANTAE']))
+
+        assert [r['page'] for r in api.requests] == [3, 4]
+        assert stats['records'] == 15
+        assert len(store) == 35
+
+    @pytest.mark.unit
+    def test_full_sync_removes_vanished_assessments(self, store):
+        """Test that a full re-crawl drops assessments no longer listed."""
+        api = FakeAPI({'PLANTAE': [_assessment(1, 1, 2020), _assessment(2, 2, 2020)]})
+        sync_mirror(api, store, kingdom_collections(['PLANTAE']))
+
+        api.kingdoms['PLANTAE'] = [_assessment(1, 1, 2020)]
+        stats = sync_mirror(api, store, kingdom_collections(['PLANTAE']), full=True)
+
+        assert stats['removed'] == 1
+        assert store.get(2) is None
+        assert len(store) == 1
+
+    @pytest.mark.unit
+    def test_shared_assessments_survive_full_sync_of_one_collection(self, store):
+        """Test that an assessment listed by another collection is kept."""
+        api = FakeAPI({'PLANTAE': [_assessment(1, 1, 2020)], 'FUNGI': [_assessment(1, 1, 2020)]})
+        sync_mirror(api, store, kingdom_collections(['PLANTAE', 'FUNGI']))
+
+        api.kingdoms['PLANTAE'] = []
+        sync_mirror(api, store, kingdom_collections(['PLANTAE']), full=True)
+
+        assert store.get(1) is not None
+
+    @pytest.mark.unit
+    def test_parse_red_list_version(self):
+        """Test extracting the version from the information endpoint."""
+        assert parse_red_list_version({'red_list_version': '2025-1'}) == '2025-1'
+        assert parse_red_list_version({'version': '2025-2'}) == '2025-2'
+        assert parse_red_list_version('2025-1') == '2025-1'
+        assert parse_red_list_version([]) is None
@@ -0,0 +1,101 @@
+"""Tests for compression negotiation and transfer accounting."""
+
+import gzip
+import io
+import json
+import pytest
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+
+from iucn_red_list_client import IUCNRedListClient
+from iucn_red_list_client.transfer import TransferMeter, negotiate_encodings
+
+BODY = json.dumps({'assessments': [{'assessment_id': i, 'latest': True} for i in range(200)]}).encode()
+
+
+def _gzip_response(body=BODY):
+    """Build an unread requests.Response carrying ``body`` gzip-compressed."""
+    compressed = gzip.compress(body)
+    response = requests.Response()
+    response.status_code = 200
+    response.url = 'https://api.iucnredlist.org/api/v4/countries/US'
+    response.headers = CaseInsensitiveDict({'Content-Encoding': 'gzip', 'Content-Length': str(len(compressed))})
+    response.raw = urllib3.HTTPResponse(body=io.BytesIO(compressed), headers=response.headers,
+                                        preload_content=False, decode_content=True)
+    return response, len(compressed)
+
+
+class TestNegotiation:
+    """Test cases for Accept-Encoding negotiation."""
+
+    @pytest.mark.unit
+    def test_preferred_order_of_decodable_codings(self):
+        """Test that decodable codings are listed most compact first."""
+        assert negotiate_encodings('gzip,deflate') == 'gzip, deflate'
+        assert negotiate_encodings('gzip, deflate, br, zstd') == 'zstd, br, gzip, deflate'
+        assert negotiate_encodings('identity, gzip, compress') == 'gzip'
+
+    @pytest.mark.unit
+    def test_client_header(self, mock_api_token):
+        """Test the negotiated header and the accept_encoding override."""
+        client = IUCNRedListClient(api_token=mock_api_token)
+        assert client.session.headers['Accept-Encoding'].startswith(('zstd', 'br', 'gzip'))
+        client = IUCNRedListClient(api_token=mock_api_token, accept_encoding='identity')
+        assert client.session.headers['Accept-Encoding'] == 'identity'
+
+    @pytest.mark.unit
+    def test_accept_encoding_from_env(self, monkeypatch):
+        """Test that IUCN_ACCEPT_ENCODING sets the header."""
+        monkeypatch.setenv('IUCN_API_TOKEN', 'token')
+        monkeypatch.setenv('IUCN_ACCEPT_ENCODING', 'gzip')
+        assert IUCNRedListClient().session.headers['Accept-Encoding'] == 'gzip'
+
+
+class TestTransferMeter:
+    """Test cases for TransferMeter."""
+
+    @pytest.mark.unit
+    def test_totals_by_encoding(self):
+        """Test wire, decoded and saved byte totals."""
+        meter = TransferMeter()
+        meter.record('/a', 'gzip', 100, 900)
+        meter.record('/b', 'GZIP', 50, 450)
+        meter.record('/c', None, 30, 30)
+        stats = meter.stats()
+        assert (stats['responses'], stats['wire_bytes'], stats['decoded_bytes'], stats['saved_bytes']) == \
+            (3, 180, 1380, 1200)
+        assert stats['encodings']['gzip'] == {'responses': 2, 'wire_bytes': 150, 'decoded_bytes': 1350}
+        assert stats['encodings']['identity']['responses'] == 1
+        meter.reset()
+        assert meter.stats()['responses'] == 0
+
+
+class TestClientTransfer:
+    """Test cases for transfer accounting in IUCNRedListClient."""
+
+    @pytest.mark.unit
+    def test_buffered_response_hook(self, mock_api_token):
+        """Test that the response hook counts compressed and decoded bytes."""
+        client = IUCNRedListClient(api_token=mock_api_token)
+        assert client._record_transfer in client.session.hooks['response']
+        response, wire_bytes = _gzip_response()
+
+        client._record_transfer(response, stream=False)
+
+        stats = client.transfer.stats()
+        assert stats['encodings']['gzip'] == {'responses': 1, 'wire_bytes': wire_bytes, 'decoded_bytes': len(BODY)}
+        assert stats['saved_bytes'] == len(BODY) - wire_bytes > 0
+
+    @pytest.mark.unit
+    def test_streamed_response_counted_when_consumed(self, mock_api_token):
+        """Test that streamed bodies are counted once read, not by the hook."""
+        client = IUCNRedListClient(api_token=mock_api_token)
+        response, wire_bytes = _gzip_response()
+
+        client._record_transfer(response, stream=True)
+        assert client.transfer.stats()['responses'] == 0
+
+        assert len(list(client._stream_records(response))) == 200
+        stats = client.transfer.stats()
+        assert (stats['wire_bytes'], stats['decoded_bytes']) == (wire_bytes, len(BODY))
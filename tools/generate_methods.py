@@ -0,0 +1,139 @@
+"""
+Generate typed per-endpoint client methods from the endpoint registry.
+
+Reads ``API_ENDPOINTS`` (the output of the OpenAPI pipeline, including any
+hand fixes) and writes ``iucn_red_list_client/endpoints.py``: one method per
+endpoint on a sync and an async mixin class. Each method takes the path
+parameters positionally and the query parameters as typed keyword
+arguments, coerces them up front and calls the client with the path and
+tags inlined, so calls skip the registry lookup and kwarg scanning of
+``call_endpoint``.
+
+Usage:
+    python tools/generate_methods.py [--check]
+"""
+
+import argparse
+import keyword
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from iucn_red_list_client.api_endpoints import API_ENDPOINTS  # noqa: E402
+
+# Constants
+OUTPUT_PATH = ROOT / 'iucn_red_list_client' / 'endpoints.py'
+RESERVED_NAMES = frozenset({'self', 'timeout', 'stream', 'model', 'query_params'})
+QUERY_TYPES = {'integer': 'int', 'boolean': 'bool'}
+COERCERS = {'integer': 'coerce_integer', 'boolean': 'coerce_boolean'}
+
+HEADER = '''"""
+Typed per-endpoint methods for the IUCN Red List API clients.
+
+Generated from API_ENDPOINTS by tools/generate_methods.py; do not edit.
+
+EndpointMethods and AsyncEndpointMethods are mixed into IUCNRedListClient
+and AsyncIUCNRedListClient. Each method coerces its query parameters up
+front and calls the client with its path and tags inlined, skipping the
+endpoint registry, which this module does not import.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from .dispatch import coerce_boolean, coerce_integer
+
+if TYPE_CHECKING:
+    from .client import TimeoutSetting
+
+# Path parameters are formatted into the URL with str()
+PathValue = Union[str, int]
+'''
+
+
+def _check_name(endpoint_name: str, name: str) -> None:
+    """Reject parameter names that cannot be Python keyword arguments."""
+    if not name.isidentifier() or keyword.iskeyword(name) or name in RESERVED_NAMES:
+        raise ValueError(f"{endpoint_name}: parameter {name!r} cannot be a method argument")
+
+
+def _docstring(text: str) -> str:
+    """Return a one-line docstring body from an endpoint summary."""
+    return ' '.join(text.split()).replace('\\', '\\\\').replace('"""', '\\"\\"\\"').rstrip('.') + '.'
+
+
+def render_method(endpoint_name: str, endpoint_info: Dict[str, Any], is_async: bool) -> List[str]:
+    """Return the source lines of one endpoint method."""
+    path_params = endpoint_info['path_params']
+    query_params = endpoint_info['query_params']
+    for name in path_params + [param['name'] for param in query_params]:
+        _check_name(endpoint_name, name)
+
+    arguments = ['self'] + [f'{name}: PathValue' for name in path_params] + ['*']
+    for param in sorted(query_params, key=lambda param: not param['required']):
+        annotation = QUERY_TYPES.get(param['type'], 'str')
+        if param['required']:
+            arguments.append(f"{param['name']}: {annotation}")
+        else:
+            arguments.append(f"{param['name']}: Optional[{annotation}] = None")
+    arguments.append('timeout: "TimeoutSetting" = None')
+    if not is_async:
+        arguments.append('stream: bool = False')
+    arguments.append('model: Optional[type] = None')
+
+    prefix = 'async def' if is_async else 'def'
+    lines = [f'    {prefix} {endpoint_name}(', *(f'        {argument},' for argument in arguments), '    ) -> Any:']
+    lines.append(f'        """{_docstring(endpoint_info["summary"])}"""')
+    lines.append('        query_params: Dict[str, Any] = {}')
+    for param in query_params:
+        name = param['name']
+        coercer = COERCERS.get(param['type'])
+        value = f"{coercer}('{name}', {name})" if coercer else name
+        if param['required']:
+            lines.append(f"        query_params['{name}'] = {value}")
+        else:
+            lines.append(f'        if {name} is not None:')
+            lines.append(f"            query_params['{name}'] = {value}")
+
+    path = endpoint_info['path']
+    path = f'f"{path}"' if path_params else f'"{path}"'
+    call = 'await self._call_resolved' if is_async else 'self._call_resolved'
+    options = 'timeout, model' if is_async else 'timeout, stream, model'
+    lines.append(f'        return {call}(')
+    lines.append(f"            '{endpoint_name}', {tuple(endpoint_info['tags'])!r}, '{endpoint_info['method']}', {path},")
+    lines.append(f'            query_params, {options})')
+    return lines
+
+
+def render(endpoints: Dict[str, Dict[str, Any]]) -> str:
+    """Return the source of the generated methods module."""
+    lines = HEADER.splitlines()
+    for class_name, is_async, client_name in (('EndpointMethods', False, 'IUCNRedListClient'),
+                                              ('AsyncEndpointMethods', True, 'AsyncIUCNRedListClient')):
+        lines += ['', '', f'class {class_name}:', f'    """One method per API endpoint, for {client_name}."""']
+        for endpoint_name in sorted(endpoints):
+            lines.append('')
+            lines += render_method(endpoint_name, endpoints[endpoint_name], is_async)
+    return '\n'.join(lines) + '\n'
+
+
+def main() -> None:
+    """Write the generated module, or check that it is up to date."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='Exit with an error if the module is out of date')
+    args = parser.parse_args()
+
+    source = render(API_ENDPOINTS)
+    if args.check:
+        if not OUTPUT_PATH.exists() or OUTPUT_PATH.read_text() != source:
+            sys.exit(f"{OUTPUT_PATH} is out of date; run tools/generate_methods.py")
+        print(f"{OUTPUT_PATH} is up to date")
+        return
+    OUTPUT_PATH.write_text(source)
+    print(f"Wrote {len(API_ENDPOINTS)} endpoint methods to {OUTPUT_PATH}")
+
+
+if __name__ == '__main__':
+    main()